@@ -2,29 +2,36 @@
 FastAPI Routes for BioDiscovery AI
 Architecture v3.3 - With Article/PDF Upload Support
 """
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, BackgroundTasks, HTTPException, UploadFile, File, Form, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import Optional, List
+from pathlib import Path
 from pydantic import BaseModel
+import asyncio
 import tempfile
 import os
 import logging
+import traceback
+import aiofiles
 
 from app.models.schemas import (
     SearchRequest,
     SearchResponse,
+    SummaryRequest,
     FilterSettings
 )
 from app.graph.workflow import run_recommendation
 from app.core.qdrant_client import get_qdrant
-from app.core.encoders import get_encoder
-from app.core.cache import get_cache
+from app.core.encoders import get_encoder_batcher
+from app.core.cache import LRUCache, get_cache, hash_content
+from app.core.llm_client import GeminiClient, get_llm
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-router = APIRouter()
+# orjson serializes the large nested payload dicts several times faster than json
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # =============================================================================
@@ -44,6 +51,84 @@ class ClarificationStatus(BaseModel):
     session_id: Optional[str] = None
 
 
+# =============================================================================
+# UPLOAD HELPERS
+# =============================================================================
+
+UPLOAD_CHUNK_SIZE = 64 * 1024  # 64 KB
+UPLOAD_ICONS = {"image": "📷", "structure": "🔮", "article": "📄"}
+
+
+async def _save_upload(upload: Optional[UploadFile], kind: str) -> Optional[str]:
+    """
+    Copy an uploaded file to a named temp file in fixed-size chunks.
+    
+    Never materializes the whole upload in memory: Starlette already spools
+    the multipart body to disk, so we only move UPLOAD_CHUNK_SIZE bytes at a time.
+    Writes go through aiofiles so the event loop is not blocked on disk I/O.
+    
+    Returns the temp file path, or None if no file was uploaded.
+    Raises 413 (and removes the partial file) past settings.max_upload_mb.
+    """
+    if not upload:
+        return None
+    
+    suffix = os.path.splitext(upload.filename)[1].lower()
+    max_bytes = settings.max_upload_mb * 1024 * 1024
+    written = 0
+    
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    async with aiofiles.open(path, "wb") as tmp:
+        while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            if written > max_bytes:
+                break
+            await tmp.write(chunk)
+    
+    if written > max_bytes:
+        _remove_temp_files([path])
+        raise HTTPException(
+            status_code=413,
+            detail=f"{kind.capitalize()} file exceeds {settings.max_upload_mb} MB"
+        )
+    
+    logger.info(f"{UPLOAD_ICONS.get(kind, '📎')} {kind.capitalize()} uploaded: {upload.filename} → {path}")
+    return path
+
+
+def _remove_temp_files(paths: List[Optional[str]]) -> None:
+    """Delete uploaded temp files, ignoring ones already gone."""
+    for path in paths:
+        if not path:
+            continue
+        try:
+            Path(path).unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"Failed to cleanup temp file {path}: {e}")
+
+
+# =============================================================================
+# QUERY ENCODING
+# =============================================================================
+
+async def _encode_query(text: str) -> List[float]:
+    """
+    Dense-encode a query string, memoized in the embeddings cache.
+    
+    Cache misses go through the encoder batcher, so concurrent requests
+    share one batched forward pass.
+    """
+    cache = get_cache()
+    cache_key = f"query:{hash_content(text)}"
+    
+    vector = cache.get_embedding(cache_key)
+    if vector is None:
+        vector = (await get_encoder_batcher().encode(text)).tolist()
+        cache.set_embedding(cache_key, vector)
+    return vector
+
+
 # =============================================================================
 # MAIN SEARCH ENDPOINT
 # =============================================================================
@@ -77,13 +162,13 @@ async def recommend(request: SearchRequest):
         return response
     except Exception as e:
         logger.error(f"Recommendation error: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/recommend/upload", response_model=SearchResponse)
 async def recommend_with_upload(
+    background_tasks: BackgroundTasks,
     text: Optional[str] = Form(None),
     sequence: Optional[str] = Form(None),
     top_k: int = Form(5),
@@ -112,28 +197,11 @@ async def recommend_with_upload(
     image_path = None
     structure_path = None
     article_path = None
+    cleanup_scheduled = False
     
     try:
-        # Handle image upload
-        if image_file:
-            suffix = os.path.splitext(image_file.filename)[1]
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                content = await image_file.read()
-                tmp.write(content)
-                image_path = tmp.name
-                logger.info(f"📷 Image uploaded: {image_file.filename} → {image_path}")
-        
-        # Handle structure upload
-        if structure_file:
-            suffix = os.path.splitext(structure_file.filename)[1]
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                content = await structure_file.read()
-                tmp.write(content)
-                structure_path = tmp.name
-                logger.info(f"🔮 Structure uploaded: {structure_file.filename} → {structure_path}")
-        
         # ═══════════════════════════════════════════════════════════════
-        # v3.3: Handle article upload (PDF/TXT)
+        # v3.3: Validate article upload (PDF/TXT) before touching disk
         # ═══════════════════════════════════════════════════════════════
         if article_file:
             suffix = os.path.splitext(article_file.filename)[1].lower()
@@ -142,12 +210,21 @@ async def recommend_with_upload(
                     status_code=400, 
                     detail=f"Invalid article format: {suffix}. Only PDF and TXT are supported."
                 )
-            
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                content = await article_file.read()
-                tmp.write(content)
-                article_path = tmp.name
-                logger.info(f"📄 Article uploaded: {article_file.filename} → {article_path}")
+        
+        # Save image, structure and article uploads concurrently
+        saved = await asyncio.gather(
+            _save_upload(image_file, "image"),
+            _save_upload(structure_file, "structure"),
+            _save_upload(article_file, "article"),
+            return_exceptions=True,
+        )
+        image_path, structure_path, article_path = (
+            p if isinstance(p, str) else None for p in saved
+        )
+        # Re-raise after keeping the successful paths so `finally` cleans them up
+        for p in saved:
+            if isinstance(p, BaseException):
+                raise p
         
         # Build filter settings
         filter_settings = {
@@ -179,24 +256,25 @@ async def recommend_with_upload(
             user_choice=user_choice
         )
         
+        # Remove temp files after the response has been sent
+        background_tasks.add_task(
+            _remove_temp_files, [image_path, structure_path, article_path]
+        )
+        cleanup_scheduled = True
+        
         return response
         
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Upload recommendation error: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
     
     finally:
-        # Cleanup temp files
-        for path in [image_path, structure_path, article_path]:
-            if path and os.path.exists(path):
-                try:
-                    os.unlink(path)
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup temp file {path}: {e}")
+        # Error path: background tasks never run, so cleanup here
+        if not cleanup_scheduled:
+            _remove_temp_files([image_path, structure_path, article_path])
 
 
 # =============================================================================
@@ -216,11 +294,10 @@ async def search_collection(
         raise HTTPException(status_code=400, detail=f"Invalid collection. Must be one of: {valid_collections}")
     
     try:
-        encoder = get_encoder()
         qdrant = get_qdrant()
         
         # Encode text
-        vector = encoder.encode_text(text)[0].tolist()
+        vector = await _encode_query(text)
         
         # Build filters
         filters = None
@@ -231,7 +308,7 @@ async def search_collection(
         vector_name = "caption" if collection == "images" else "text"
         
         # Search
-        results = qdrant.vector_search(
+        results = await qdrant.vector_search(
             collection=collection,
             vector=vector,
             vector_name=vector_name,
@@ -246,10 +323,65 @@ async def search_collection(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# =============================================================================
+# STREAMED SUMMARY
+# =============================================================================
+
+@router.post("/summary/stream")
+async def stream_summary(request: SummaryRequest):
+    """Stream the LLM summary of already-fetched results as plain text"""
+    llm = get_llm()
+    
+    async def chunks():
+        sent = False
+        try:
+            async for chunk in llm.generate_summary_stream(request.query, request.results):
+                sent = True
+                yield chunk
+        except Exception as e:
+            logger.error(f"Summary stream error: {e}")
+            if sent:
+                return
+            total = sum(len(items) for items in request.results.values())
+            yield f"Found {total} results across {len(request.results)} collections."
+    
+    # The generator is closed when the client disconnects, which abandons
+    # the Gemini stream instead of paying for the remaining tokens
+    return StreamingResponse(chunks(), media_type="text/plain; charset=utf-8")
+
+
 # =============================================================================
 # ENTITY DETAILS
 # =============================================================================
 
+RELATED_COLLECTIONS = ["articles", "experiments", "structures"]
+
+
+async def _related_counts(qdrant, genes: List[str]) -> dict:
+    """
+    Count related documents per collection for a gene set.
+    
+    The three counts run concurrently, and results are cached by gene set
+    since many entities share the same handful of genes.
+    """
+    cache = get_cache()
+    cache_key = f"related_counts:{hash_content(','.join(sorted(genes)))}"
+    
+    related = cache.get_results(cache_key)
+    if related is not None:
+        return related
+    
+    counts = await asyncio.gather(*[
+        asyncio.to_thread(
+            qdrant.count_documents_with_field, coll, "normalized_bridge.genes", genes
+        )
+        for coll in RELATED_COLLECTIONS
+    ])
+    related = dict(zip(RELATED_COLLECTIONS, counts))
+    cache.set_results(cache_key, related)
+    return related
+
+
 @router.get("/entity/{collection}/{entity_id}")
 async def get_entity_details(collection: str, entity_id: str):
     """Get detailed information about a specific entity"""
@@ -274,15 +406,7 @@ async def get_entity_details(collection: str, entity_id: str):
         
         related = {}
         if genes:
-            related["articles"] = qdrant.count_documents_with_field(
-                "articles", "normalized_bridge.genes", genes
-            )
-            related["experiments"] = qdrant.count_documents_with_field(
-                "experiments", "normalized_bridge.genes", genes
-            )
-            related["structures"] = qdrant.count_documents_with_field(
-                "structures", "normalized_bridge.genes", genes
-            )
+            related = await _related_counts(qdrant, genes)
         
         return {
             "id": entity_id,
@@ -302,12 +426,28 @@ async def get_entity_details(collection: str, entity_id: str):
 # ADMIN/UTILITY ENDPOINTS
 # =============================================================================
 
+# Probes and dashboards poll these constantly; a few seconds of staleness
+# saves a Qdrant round trip per call.
+STATUS_CACHE_TTL = 5
+_status_cache = LRUCache(max_size=4, default_ttl=STATUS_CACHE_TTL)
+
+
+def _cached_collection_names(qdrant) -> List[str]:
+    """Collection names, cached for STATUS_CACHE_TTL seconds"""
+    names = _status_cache.get("collection_names")
+    if names is None:
+        names = qdrant.list_collections()
+        if names:
+            _status_cache.set("collection_names", names)
+    return names
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
     try:
         qdrant = get_qdrant()
-        collections = qdrant.list_collections()
+        collections = _cached_collection_names(qdrant)
         return {
             "status": "healthy",
             "collections": collections,
@@ -336,15 +476,17 @@ async def clear_cache(level: Optional[str] = Query(None)):
         
         if level == "all" or level is None:
             cache.clear_all()
+            GeminiClient.clear_cache()
             return {"message": "All caches cleared"}
         elif level == "embeddings":
-            cache.embeddings.clear()
+            cache.clear_embeddings()
             return {"message": "Embeddings cache cleared"}
         elif level == "results":
             cache.results.clear()
             return {"message": "Results cache cleared"}
         elif level == "llm":
-            cache.llm.clear()
+            # Exact-prompt level plus the client's semantic and bad-JSON caches
+            GeminiClient.clear_cache()
             return {"message": "LLM cache cleared"}
         else:
             raise HTTPException(status_code=400, detail=f"Invalid cache level: {level}")
@@ -359,12 +501,17 @@ async def clear_cache(level: Optional[str] = Query(None)):
 async def list_collections():
     """List all collections with stats"""
     try:
-        qdrant = get_qdrant()
-        collections = qdrant.list_collections()
-        
-        stats = {}
-        for name in collections:
-            stats[name] = qdrant.get_collection_stats(name)
+        stats = _status_cache.get("collection_stats")
+        if stats is None:
+            qdrant = get_qdrant()
+            collections = _cached_collection_names(qdrant)
+            
+            results = await asyncio.gather(*[
+                asyncio.to_thread(qdrant.get_collection_stats, name)
+                for name in collections
+            ])
+            stats = dict(zip(collections, results))
+            _status_cache.set("collection_stats", stats)
         
         return {"collections": stats}
     except Exception as e:
@@ -377,6 +524,7 @@ async def create_collections(recreate: bool = False):
     try:
         qdrant = get_qdrant()
         qdrant.create_all_collections(recreate=recreate)
+        _status_cache.clear()
         return {"message": "Collections created successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -386,6 +534,9 @@ async def create_collections(recreate: bool = False):
 # GRAPH ENDPOINT
 # =============================================================================
 
+NEIGHBOR_MAX_NODES = 20  # including the center node; one edge per neighbor
+NEIGHBOR_PAYLOAD_FIELDS = ["protein_name", "title", "caption", "normalized_bridge.genes"]
+
 @router.post("/graph/neighbors")
 async def get_neighbors(
     entity_id: str,
@@ -419,18 +570,28 @@ async def get_neighbors(
         edges = []
         
         if genes:
-            encoder = get_encoder()
+            vector = await _encode_query(" ".join(genes))
+            neighbor_collections = ["proteins", "articles", "images", "experiments", "structures"]
             
-            for coll in ["proteins", "articles", "images", "experiments", "structures"]:
-                results = qdrant.vector_search(
+            # Search all collections concurrently (latency = max, not sum)
+            all_results = await asyncio.gather(*[
+                qdrant.vector_search(
                     collection=coll,
-                    vector=encoder.encode_text(" ".join(genes))[0].tolist(),
+                    vector=vector,
                     vector_name="text" if coll != "images" else "caption",
                     top_k=5,
-                    filter_dict={"normalized_bridge.genes": genes}
+                    filter_dict={"normalized_bridge.genes": genes},
+                    payload_fields=NEIGHBOR_PAYLOAD_FIELDS
                 )
-                
+                for coll in neighbor_collections
+            ])
+            
+            for coll, results in zip(neighbor_collections, all_results):
+                if len(nodes) >= NEIGHBOR_MAX_NODES:
+                    break
                 for r in results:
+                    if len(nodes) >= NEIGHBOR_MAX_NODES:
+                        break
                     if r["id"] == entity_id:
                         continue
                     
@@ -455,8 +616,8 @@ async def get_neighbors(
                     })
         
         return {
-            "nodes": nodes[:20],
-            "edges": edges[:40]
+            "nodes": nodes,
+            "edges": edges
         }
         
     except HTTPException:
@@ -18,6 +18,8 @@ class Settings(BaseSettings):
     qdrant_host: str = "localhost"
     qdrant_port: int = 6333
     qdrant_api_key: Optional[str] = None
+    qdrant_grpc_port: int = 6334
+    qdrant_prefer_grpc: bool = True  # gRPC for searches, REST if it can't connect
     
     # Gemini - Use a valid model name
     gemini_api_key: Optional[str] = None
@@ -25,12 +27,34 @@ class Settings(BaseSettings):
     
     # App
     debug: bool = False
+    max_upload_mb: int = 50  # Per-request and per-file upload limit
+    embedding_cache_path: Optional[str] = None  # e.g. "data/embedding_cache.db"; None = RAM only
+    model_precision: str = "auto"  # auto (bf16/fp16 on CUDA, fp32 on CPU), fp32, fp16 or bf16
+    semantic_cache_enabled: bool = False  # Reuse LLM results for paraphrased queries
+    semantic_cache_threshold: float = 0.95  # Min cosine similarity for a semantic hit
     
     class Config:
         env_file = ".env"
         extra = "ignore"  # Allow extra fields in .env
 
 
+# Scalar int8 quantization: 4x smaller vectors in RAM, <1% recall loss with rescoring.
+# Binary quantization ({"type": "binary"}) is only worth it for >=1024-dim vectors.
+DEFAULT_QUANTIZATION: Dict[str, Any] = {"type": "int8", "quantile": 0.99, "always_ram": True}
+
+# Binary quantization: 32x smaller, needs rescoring + oversampling at query time.
+# Used per-vector via "vector_quantization" (overrides the collection default).
+BINARY_QUANTIZATION: Dict[str, Any] = {"type": "binary", "always_ram": True}
+
+# Segments larger than this (KB) are stored as mmap instead of in RAM
+MEMMAP_THRESHOLD_KB = 20000
+
+# Payload index schema per field (anything not listed is indexed as keyword)
+PAYLOAD_INDEX_SCHEMAS: Dict[str, str] = {
+    "year": "integer",
+    "resolution": "float",
+}
+
 # Collection configurations
 COLLECTION_CONFIGS: Dict[str, Dict[str, Any]] = {
     "proteins": {
@@ -39,16 +63,18 @@ COLLECTION_CONFIGS: Dict[str, Dict[str, Any]] = {
             "sequence": 320,  # ESM-2
         },
         "sparse_vectors": ["text_sparse"],
-        "payload_indexes": ["gene_names", "organism", "diseases"],
+        "payload_indexes": ["gene_names", "organism", "diseases", "normalized_bridge.genes"],
         "primary_for": ["sequence", "text_sequence"],
+        "quantization": DEFAULT_QUANTIZATION,
     },
     "articles": {
         "vectors": {
             "text": 768,
         },
         "sparse_vectors": ["text_sparse"],
-        "payload_indexes": ["pmid", "year", "journal"],
+        "payload_indexes": ["pmid", "year", "journal", "normalized_bridge.genes"],
         "primary_for": ["text"],
+        "quantization": DEFAULT_QUANTIZATION,
     },
     "images": {
         "vectors": {
@@ -56,16 +82,20 @@ COLLECTION_CONFIGS: Dict[str, Dict[str, Any]] = {
             "caption": 768,  # BGE for caption text
         },
         "sparse_vectors": ["caption_sparse"],
-        "payload_indexes": ["source", "image_type", "gene_name"],
+        "payload_indexes": ["source", "image_type", "gene_name", "normalized_bridge.genes"],
         "primary_for": ["image", "text_image"],
+        "quantization": DEFAULT_QUANTIZATION,
+        "vector_quantization": {"image": BINARY_QUANTIZATION},
     },
     "experiments": {
         "vectors": {
             "text": 768,
         },
         "sparse_vectors": ["text_sparse"],
-        "payload_indexes": ["accession", "data_type", "organism"],
+        "payload_indexes": ["accession", "data_type", "organism", "normalized_bridge.genes"],
         "primary_for": [],
+        "quantization": DEFAULT_QUANTIZATION,
+        "sparse_on_disk": True,  # cold collection: posting lists via page cache
     },
     "structures": {
         "vectors": {
@@ -73,8 +103,9 @@ COLLECTION_CONFIGS: Dict[str, Dict[str, Any]] = {
             "structure": 768,  # Structure-specific vector (from PDB text/sequence)
         },
         "sparse_vectors": ["text_sparse"],
-        "payload_indexes": ["pdb_id", "method", "resolution"],
+        "payload_indexes": ["pdb_id", "method", "resolution", "normalized_bridge.genes"],
         "primary_for": ["structure", "text_structure"],
+        "quantization": DEFAULT_QUANTIZATION,
     },
 }
 
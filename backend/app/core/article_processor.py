@@ -18,13 +18,48 @@ Usage in workflow:
     # Returns: "Title of Paper. Abstract text... HER2 binding"
 """
 
+import hashlib
 import logging
 import re
 from pathlib import Path
 from typing import Optional, Tuple
 
+from app.core.cache import LRUCache
+
 logger = logging.getLogger(__name__)
 
+# PDF backend, resolved once at import (fastest available first)
+try:
+    import pypdfium2 as pdfium
+    _PDF_BACKEND = "pdfium"
+except ImportError:
+    try:
+        import fitz  # PyMuPDF
+        _PDF_BACKEND = "fitz"
+    except ImportError:
+        try:
+            from PyPDF2 import PdfReader
+            _PDF_BACKEND = "pypdf2"
+        except ImportError:
+            _PDF_BACKEND = None
+            logger.warning("No PDF library available. Install: pip install pypdfium2 (or PyMuPDF / PyPDF2)")
+
+# Extracted PDF text keyed by content hash: the same paper uploaded twice
+# (or parsed by both process_article_input and get_article_metadata) is
+# only run through the PDF library once.
+_pdf_text_cache = LRUCache(max_size=128)
+
+# Abstract patterns, tried in order. Matched case-insensitively on the original
+# text so the abstract can be sliced out directly (no lowercased copy).
+_ABSTRACT_RES = (
+    re.compile(r'abstract\s*[\:\.]?\s*(.+?)(?=introduction|background|keywords|1\.|methods)', re.DOTALL | re.IGNORECASE),
+    re.compile(r'summary\s*[\:\.]?\s*(.+?)(?=introduction|background|keywords|1\.)', re.DOTALL | re.IGNORECASE),
+)
+_WS_RE = re.compile(r'\s+')
+_DOI_RE = re.compile(r'10\.\d{4,}/[^\s]+')
+_KW_RE = re.compile(r'keywords?\s*[\:\.]?\s*([^\n]+)', re.IGNORECASE)
+_KW_SPLIT_RE = re.compile(r'[,;•]')
+
 
 def extract_title_abstract_from_text(text: str) -> Tuple[str, str]:
     """
@@ -44,22 +79,11 @@ def extract_title_abstract_from_text(text: str) -> Tuple[str, str]:
             title = line
             break
     
-    # Find abstract section
-    text_lower = text.lower()
-    
-    # Common abstract patterns
-    abstract_patterns = [
-        r'abstract\s*[\:\.]?\s*(.+?)(?=introduction|background|keywords|1\.|methods)',
-        r'summary\s*[\:\.]?\s*(.+?)(?=introduction|background|keywords|1\.)',
-    ]
-    
-    for pattern in abstract_patterns:
-        match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
+    # Find abstract section (common abstract patterns)
+    for pattern in _ABSTRACT_RES:
+        match = pattern.search(text)
         if match:
-            # Get the actual text (not lowercased)
-            start = match.start(1)
-            end = match.end(1)
-            abstract = text[start:end].strip()
+            abstract = match.group(1).strip()
             break
     
     # If no abstract found, use first paragraph after title
@@ -70,50 +94,97 @@ def extract_title_abstract_from_text(text: str) -> Tuple[str, str]:
                 break
     
     # Clean up
-    title = re.sub(r'\s+', ' ', title).strip()[:500]
-    abstract = re.sub(r'\s+', ' ', abstract).strip()[:2000]
+    title = _WS_RE.sub(' ', title).strip()[:500]
+    abstract = _WS_RE.sub(' ', abstract).strip()[:2000]
     
     return title, abstract
 
 
+def _file_digest(path: str) -> str:
+    """BLAKE2b digest of a file's bytes, read in 64 KB chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
-    Extract text from PDF file.
+    Extract text from PDF file (memoized by file content).
     
-    Uses PyMuPDF (fitz) if available, falls back to PyPDF2.
+    Uses pypdfium2 if available, falls back to PyMuPDF, then PyPDF2.
     """
+    key = _file_digest(pdf_path)
+    text = _pdf_text_cache.get(key)
+    if text is not None:
+        return text
+    
+    text = _parse_pdf(pdf_path)
+    if text:
+        _pdf_text_cache.set(key, text)
+    return text
+
+
+MAX_PDF_PAGES = 5  # First 5 pages usually contain title + abstract
+
+
+def _parse_pdf(pdf_path: str) -> str:
+    """
+    Run the PDF library over the first pages of the file.
+    
+    Backends, fastest first: pypdfium2 (PDFium, C++), PyMuPDF, PyPDF2 (pure Python).
+    """
+    if _PDF_BACKEND == "pdfium":
+        return _parse_pdf_pdfium(pdf_path)
+    if _PDF_BACKEND == "fitz":
+        return _parse_pdf_fitz(pdf_path)
+    if _PDF_BACKEND == "pypdf2":
+        return _parse_pdf_pypdf2(pdf_path)
+    
+    logger.error("No PDF library available. Install: pip install pypdfium2 (or PyMuPDF / PyPDF2)")
+    return ""
+
+
+def _parse_pdf_pdfium(pdf_path: str) -> str:
+    """Extract text with pypdfium2. Pages are loaded lazily, so only the first pages are decoded."""
+    doc = pdfium.PdfDocument(pdf_path)
     try:
-        # Try PyMuPDF first (better quality)
-        import fitz  # PyMuPDF
-        
-        doc = fitz.open(pdf_path)
         text_parts = []
-        
-        for page_num in range(min(5, len(doc))):  # First 5 pages usually contain abstract
+        for page_num in range(min(MAX_PDF_PAGES, len(doc))):
             page = doc[page_num]
-            text_parts.append(page.get_text())
-        
-        doc.close()
+            textpage = page.get_textpage()
+            text_parts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
         return '\n'.join(text_parts)
-        
-    except ImportError:
-        logger.warning("PyMuPDF not available, trying PyPDF2")
-        
-        try:
-            from PyPDF2 import PdfReader
-            
-            reader = PdfReader(pdf_path)
-            text_parts = []
-            
-            for page_num in range(min(5, len(reader.pages))):
-                page = reader.pages[page_num]
-                text_parts.append(page.extract_text())
-            
-            return '\n'.join(text_parts)
-            
-        except ImportError:
-            logger.error("No PDF library available. Install: pip install PyMuPDF or pip install PyPDF2")
-            return ""
+    finally:
+        doc.close()
+
+
+def _parse_pdf_fitz(pdf_path: str) -> str:
+    """Extract text with PyMuPDF."""
+    doc = fitz.open(pdf_path)
+    text_parts = []
+    
+    for page_num in range(min(MAX_PDF_PAGES, len(doc))):
+        page = doc[page_num]
+        text_parts.append(page.get_text())
+    
+    doc.close()
+    return '\n'.join(text_parts)
+
+
+def _parse_pdf_pypdf2(pdf_path: str) -> str:
+    """Extract text with PyPDF2 (slowest, pure Python)."""
+    reader = PdfReader(pdf_path)
+    text_parts = []
+    
+    for page_num in range(min(MAX_PDF_PAGES, len(reader.pages))):
+        page = reader.pages[page_num]
+        text_parts.append(page.extract_text())
+    
+    return '\n'.join(text_parts)
 
 
 def extract_text_from_txt(txt_path: str) -> str:
@@ -126,51 +197,50 @@ def extract_text_from_txt(txt_path: str) -> str:
         return ""
 
 
-def process_article_input(
-    user_query: str,
+def _read_article_file(article_path: str) -> str:
+    """Read article text from a PDF or TXT/MD file."""
+    suffix = Path(article_path).suffix.lower()
+    
+    if suffix == '.pdf':
+        return extract_text_from_pdf(article_path)
+    if suffix in ['.txt', '.md']:
+        return extract_text_from_txt(article_path)
+    
+    logger.warning(f"Unsupported file type: {suffix}")
+    return ""
+
+
+def _load_article(
     article_path: Optional[str] = None,
     article_content: Optional[str] = None,
-    max_context_length: int = 3000,
-) -> str:
+) -> Tuple[str, str, str]:
     """
-    Process article input and combine with user query.
-    
-    Args:
-        user_query: User's search query
-        article_path: Path to PDF or TXT file
-        article_content: Raw text content (if already extracted)
-        max_context_length: Maximum length for article context
+    Extract article text once and split out title and abstract.
     
     Returns:
-        Enhanced query string: "{title}. {abstract}. {user_query}"
+        (text, title, abstract) tuple; all empty if nothing could be read
     """
-    if not article_path and not article_content:
-        return user_query
-    
-    # Extract text from file if needed
     if article_path and not article_content:
-        path = Path(article_path)
-        
-        if path.suffix.lower() == '.pdf':
-            article_content = extract_text_from_pdf(article_path)
-        elif path.suffix.lower() in ['.txt', '.md']:
-            article_content = extract_text_from_txt(article_path)
-        else:
-            logger.warning(f"Unsupported file type: {path.suffix}")
-            return user_query
+        article_content = _read_article_file(article_path)
     
     if not article_content:
-        logger.warning("Could not extract article content")
-        return user_query
+        return "", "", ""
     
-    # Extract title and abstract
     title, abstract = extract_title_abstract_from_text(article_content)
-    
+    return article_content, title, abstract
+
+
+def _build_enhanced_query(
+    user_query: str,
+    title: str,
+    abstract: str,
+    max_context_length: int,
+) -> str:
+    """Combine: Title + Abstract + User Query"""
     logger.info(f"📄 ARTICLE PROCESSED:")
     logger.info(f"   Title: {title[:100]}...")
     logger.info(f"   Abstract: {abstract[:200]}...")
     
-    # Combine: Title + Abstract + User Query
     context_parts = []
     
     if title:
@@ -193,61 +263,82 @@ def process_article_input(
     return enhanced_query
 
 
-def get_article_metadata(
-    article_path: Optional[str] = None,
-    article_content: Optional[str] = None,
-) -> dict:
-    """
-    Extract structured metadata from article.
-    
-    Returns:
-        {
-            "title": str,
-            "abstract": str,
-            "keywords": list[str],  # if found
-            "doi": str,  # if found
-        }
-    """
+def _build_metadata(text: str, title: str, abstract: str) -> dict:
+    """Build the metadata dict (title, abstract, DOI, keywords) from loaded text."""
     metadata = {
-        "title": "",
-        "abstract": "",
+        "title": title,
+        "abstract": abstract,
         "keywords": [],
         "doi": "",
     }
     
-    if article_path and not article_content:
-        path = Path(article_path)
-        if path.suffix.lower() == '.pdf':
-            article_content = extract_text_from_pdf(article_path)
-        else:
-            article_content = extract_text_from_txt(article_path)
-    
-    if not article_content:
+    if not text:
         return metadata
     
-    # Extract title and abstract
-    title, abstract = extract_title_abstract_from_text(article_content)
-    metadata["title"] = title
-    metadata["abstract"] = abstract
-    
     # Try to find DOI
-    doi_pattern = r'10\.\d{4,}/[^\s]+'
-    doi_match = re.search(doi_pattern, article_content)
+    doi_match = _DOI_RE.search(text)
     if doi_match:
         metadata["doi"] = doi_match.group()
     
     # Try to find keywords
-    keywords_pattern = r'keywords?\s*[\:\.]?\s*([^\n]+)'
-    keywords_match = re.search(keywords_pattern, article_content, re.IGNORECASE)
+    keywords_match = _KW_RE.search(text)
     if keywords_match:
         keywords_text = keywords_match.group(1)
         # Split by common delimiters
-        keywords = re.split(r'[,;•]', keywords_text)
+        keywords = _KW_SPLIT_RE.split(keywords_text)
         metadata["keywords"] = [kw.strip() for kw in keywords if kw.strip()][:10]
     
     return metadata
 
 
+def process_article_input(
+    user_query: str,
+    article_path: Optional[str] = None,
+    article_content: Optional[str] = None,
+    max_context_length: int = 3000,
+) -> str:
+    """
+    Process article input and combine with user query.
+    
+    Args:
+        user_query: User's search query
+        article_path: Path to PDF or TXT file
+        article_content: Raw text content (if already extracted)
+        max_context_length: Maximum length for article context
+    
+    Returns:
+        Enhanced query string: "{title}. {abstract}. {user_query}"
+    """
+    if not article_path and not article_content:
+        return user_query
+    
+    text, title, abstract = _load_article(article_path, article_content)
+    if not text:
+        logger.warning("Could not extract article content")
+        return user_query
+    
+    return _build_enhanced_query(user_query, title, abstract, max_context_length)
+
+
+def get_article_metadata(
+    article_path: Optional[str] = None,
+    article_content: Optional[str] = None,
+) -> dict:
+    """
+    Extract structured metadata from article.
+    
+    Returns:
+        {
+            "title": str,
+            "abstract": str,
+            "keywords": list[str],  # if found
+            "doi": str,  # if found
+        }
+    """
+    text, title, abstract = _load_article(article_path, article_content)
+    return _build_metadata(text, title, abstract)
+
+
 # Example usage in workflow:
 # 
 # In node_encode or workflow.py:
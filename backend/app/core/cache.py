@@ -10,15 +10,42 @@ Cache Levels:
 
 import logging
 import hashlib
-import json
+import pickle
+import sqlite3
 import time
 from typing import Any, Optional, Dict
-from functools import lru_cache
+from functools import lru_cache, partial
 from collections import OrderedDict
+from pathlib import Path
 import threading
 
+import numpy as np
+
+from app.config import get_settings
+
 logger = logging.getLogger(__name__)
 
+# Cache keys need speed, not cryptographic strength: xxh3 when available,
+# else stdlib blake2b (both 64-bit / 16 hex chars, like the old sha256[:16])
+try:
+    import xxhash
+    
+    _new_hasher = xxhash.xxh3_64
+    
+    def _hexdigest64(data: bytes) -> str:
+        return xxhash.xxh3_64_hexdigest(data)
+except ImportError:
+    _new_hasher = partial(hashlib.blake2b, digest_size=8)
+    
+    def _hexdigest64(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+# Optional C implementation (lru-dict): LRU bookkeeping and eviction in C
+try:
+    from lru import LRU as _NativeLRU
+except ImportError:
+    _NativeLRU = None
+
 
 class LRUCache:
     """Thread-safe LRU Cache with optional TTL."""
@@ -26,58 +53,59 @@ class LRUCache:
     def __init__(self, max_size: int = 10000, default_ttl: Optional[int] = None):
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: OrderedDict = OrderedDict()
-        self._timestamps: Dict[str, float] = {}
-        self._ttls: Dict[str, Optional[int]] = {}
-        self._lock = threading.RLock()
+        # key -> (value, monotonic expiry in ns or None); one probe per access.
+        # lru.LRU promotes on get and evicts on insert by itself.
+        self._native = _NativeLRU is not None
+        self._cache = _NativeLRU(max_size) if self._native else OrderedDict()
+        # Methods never re-enter, so a plain (C-level) Lock is enough
+        self._lock = threading.Lock()
         
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 return None
             
             # Check TTL
-            ttl = self._ttls.get(key)
-            if ttl is not None:
-                age = time.time() - self._timestamps.get(key, 0)
-                if age > ttl:
-                    self._remove(key)
-                    return None
+            value, expiry = entry
+            if expiry is not None and expiry < time.monotonic_ns():
+                del self._cache[key]
+                return None
             
             # Move to end (most recently used)
-            self._cache.move_to_end(key)
-            return self._cache[key]
+            if not self._native:
+                self._cache.move_to_end(key)
+            return value
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache."""
+        if ttl is None:
+            ttl = self.default_ttl
+        # Monotonic clock: immune to wall-clock (NTP) jumps; integer compare on get
+        expiry = time.monotonic_ns() + int(ttl * 1_000_000_000) if ttl is not None else None
+        
         with self._lock:
-            # Remove if exists
-            if key in self._cache:
-                self._remove(key)
-            
-            # Evict oldest if at capacity
-            while len(self._cache) >= self.max_size:
-                oldest_key = next(iter(self._cache))
-                self._remove(oldest_key)
+            cache = self._cache
+            if not self._native:
+                if key in cache:
+                    cache.move_to_end(key)
+                else:
+                    # Evict oldest if at capacity
+                    while len(cache) >= self.max_size:
+                        cache.popitem(last=False)
             
-            # Add new entry
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
-            self._ttls[key] = ttl if ttl is not None else self.default_ttl
+            cache[key] = (value, expiry)
     
-    def _remove(self, key: str) -> None:
-        """Remove key from cache."""
-        self._cache.pop(key, None)
-        self._timestamps.pop(key, None)
-        self._ttls.pop(key, None)
+    def delete(self, key: str) -> None:
+        """Remove key from cache (no-op if absent)."""
+        with self._lock:
+            self._cache.pop(key, None)
     
     def clear(self) -> None:
         """Clear all cache."""
         with self._lock:
             self._cache.clear()
-            self._timestamps.clear()
-            self._ttls.clear()
     
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -89,6 +117,154 @@ class LRUCache:
             }
 
 
+class ShardedLRUCache:
+    """
+    LRUCache split into independently locked shards to cut lock contention.
+    
+    Eviction is LRU per shard (approximate globally). Caches of at most
+    SINGLE_SHARD_MAX_SIZE entries keep one shard for exact LRU.
+    """
+    
+    NUM_SHARDS = 16  # power of two: shard index is hash & (NUM_SHARDS - 1)
+    SINGLE_SHARD_MAX_SIZE = 256
+    
+    def __init__(self, max_size: int = 10000, default_ttl: Optional[int] = None):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        num_shards = 1 if max_size <= self.SINGLE_SHARD_MAX_SIZE else self.NUM_SHARDS
+        self._mask = num_shards - 1
+        self._shards = [
+            LRUCache(max_size=max(1, max_size // num_shards), default_ttl=default_ttl)
+            for _ in range(num_shards)
+        ]
+    
+    def _shard(self, key: str) -> LRUCache:
+        return self._shards[hash(key) & self._mask]
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache."""
+        return self._shard(key).get(key)
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in cache."""
+        self._shard(key).set(key, value, ttl)
+    
+    def delete(self, key: str) -> None:
+        """Remove key from cache (no-op if absent)."""
+        self._shard(key).delete(key)
+    
+    def clear(self) -> None:
+        """Clear all shards."""
+        for shard in self._shards:
+            shard.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics summed over shards."""
+        return {
+            "size": sum(shard.stats()["size"] for shard in self._shards),
+            "max_size": self.max_size,
+            "default_ttl": self.default_ttl,
+            "shards": len(self._shards),
+        }
+
+
+# Dense embeddings are stored as float16 (half the memory of float32, 1/16th of
+# a list of Python floats); cosine retrieval tolerates the rounding. Short
+# float lists (sparse weights, concepts) are left exact.
+HALF_PRECISION_MIN_DIM = 64
+
+
+class _HalfVector:
+    """float16 copy of a dense vector; restores the original container type."""
+    
+    __slots__ = ("data", "as_list")
+    
+    def __init__(self, vector: Any):
+        self.as_list = isinstance(vector, list)
+        self.data = np.asarray(vector, dtype=np.float16)
+    
+    def restore(self) -> Any:
+        vector = self.data.astype(np.float32)
+        return vector.tolist() if self.as_list else vector
+
+
+def _is_dense_vector(value: Any) -> bool:
+    if isinstance(value, np.ndarray):
+        return value.ndim == 1 and value.dtype.kind == "f" and value.size >= HALF_PRECISION_MIN_DIM
+    return (
+        isinstance(value, list)
+        and len(value) >= HALF_PRECISION_MIN_DIM
+        and isinstance(value[0], float)
+    )
+
+
+def _pack_embedding(value: Any) -> Any:
+    """Quantize dense vectors (top level or dict values) to float16."""
+    if _is_dense_vector(value):
+        return _HalfVector(value)
+    if isinstance(value, dict):
+        return {k: _HalfVector(v) if _is_dense_vector(v) else v for k, v in value.items()}
+    return value
+
+
+def _unpack_embedding(value: Any) -> Any:
+    """Inverse of _pack_embedding (float32 values, original containers)."""
+    if isinstance(value, _HalfVector):
+        return value.restore()
+    if isinstance(value, dict):
+        return {k: v.restore() if isinstance(v, _HalfVector) else v for k, v in value.items()}
+    return value
+
+
+class PersistentEmbeddingStore:
+    """
+    On-disk embedding store (SQLite) that survives restarts.
+    
+    Reads use SQLite's memory-mapped I/O: hot rows come from the OS page
+    cache, cold ones never occupy the Python heap. Values are the same
+    objects the RAM cache holds (vectors or dicts of vectors), pickled.
+    """
+    
+    def __init__(self, path: str, mmap_bytes: int = 256 * 1024 * 1024):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_bytes)}")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from disk."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+        return pickle.loads(row[0]) if row else None
+    
+    def set(self, key: str, value: Any) -> None:
+        """Write value to disk (replaces any existing entry)."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, value) VALUES (?, ?)", (key, blob)
+            )
+    
+    def clear(self) -> None:
+        """Delete all stored embeddings."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            (size,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return {"path": self.path, "size": size}
+
+
 class MultiLevelCache:
     """
     Multi-level cache system for BioDiscovery AI.
@@ -114,13 +290,23 @@ class MultiLevelCache:
         self._initialized = True
         
         # Level 1: Embeddings (permanent, large)
-        self.embeddings = LRUCache(max_size=10000, default_ttl=None)
+        self.embeddings = ShardedLRUCache(max_size=10000, default_ttl=None)
         
         # Level 2: Results (1 hour TTL)
-        self.results = LRUCache(max_size=1000, default_ttl=3600)
+        self.results = ShardedLRUCache(max_size=1000, default_ttl=3600)
         
         # Level 3: LLM responses (permanent, smaller)
-        self.llm = LRUCache(max_size=500, default_ttl=None)
+        self.llm = ShardedLRUCache(max_size=500, default_ttl=None)
+        
+        # Optional disk tier behind the embeddings level (survives restarts)
+        self.persistent: Optional[PersistentEmbeddingStore] = None
+        cache_path = get_settings().embedding_cache_path
+        if cache_path:
+            try:
+                self.persistent = PersistentEmbeddingStore(cache_path)
+                logger.info(f"Persistent embedding cache: {cache_path}")
+            except Exception as e:
+                logger.warning(f"Persistent embedding cache disabled ({cache_path}): {e}")
         
         # Stats
         self._hits = {"embeddings": 0, "results": 0, "llm": 0}
@@ -145,7 +331,7 @@ class MultiLevelCache:
         cache = self._get_cache(level)
         cache.set(key, value, ttl)
     
-    def _get_cache(self, level: str) -> LRUCache:
+    def _get_cache(self, level: str) -> ShardedLRUCache:
         """Get cache by level name."""
         if level == "embeddings":
             return self.embeddings
@@ -157,12 +343,35 @@ class MultiLevelCache:
             return self.results  # default
     
     def get_embedding(self, content_hash: str) -> Optional[Any]:
-        """Shortcut for embedding cache."""
-        return self.get(f"emb:{content_hash}", "embeddings")
+        """Shortcut for embedding cache (RAM first, then the disk tier)."""
+        key = f"emb:{content_hash}"
+        value = self.embeddings.get(key)
+        
+        if value is None and self.persistent is not None:
+            value = self.persistent.get(key)
+            if value is not None:
+                self.embeddings.set(key, value)
+        
+        if value is None:
+            self._misses["embeddings"] += 1
+            return None
+        
+        self._hits["embeddings"] += 1
+        return _unpack_embedding(value)
     
     def set_embedding(self, content_hash: str, value: Any) -> None:
-        """Shortcut for embedding cache."""
-        self.set(f"emb:{content_hash}", value, "embeddings")
+        """Shortcut for embedding cache (dense vectors stored as float16)."""
+        key = f"emb:{content_hash}"
+        value = _pack_embedding(value)
+        self.embeddings.set(key, value)
+        if self.persistent is not None:
+            self.persistent.set(key, value)
+    
+    def clear_embeddings(self) -> None:
+        """Clear the embeddings level, including the disk tier."""
+        self.embeddings.clear()
+        if self.persistent is not None:
+            self.persistent.clear()
     
     def get_results(self, query_hash: str) -> Optional[Any]:
         """Shortcut for results cache."""
@@ -180,6 +389,10 @@ class MultiLevelCache:
         """Shortcut for LLM cache."""
         self.set(f"llm:{prompt_hash}", value, "llm")
     
+    def delete_llm(self, prompt_hash: str) -> None:
+        """Drop a cached LLM response (e.g. one that failed to parse)."""
+        self.llm.delete(f"llm:{prompt_hash}")
+    
     def stats(self) -> Dict[str, Any]:
         """Get all cache statistics."""
         return {
@@ -187,6 +400,7 @@ class MultiLevelCache:
                 **self.embeddings.stats(),
                 "hits": self._hits.get("embeddings", 0),
                 "misses": self._misses.get("embeddings", 0),
+                "persistent": self.persistent.stats() if self.persistent else None,
             },
             "results": {
                 **self.results.stats(),
@@ -202,7 +416,7 @@ class MultiLevelCache:
     
     def clear_all(self) -> None:
         """Clear all caches."""
-        self.embeddings.clear()
+        self.clear_embeddings()
         self.results.clear()
         self.llm.clear()
         logger.info("All caches cleared")
@@ -214,24 +428,52 @@ class MultiLevelCache:
 
 def hash_content(content: str) -> str:
     """Generate hash for content."""
-    return hashlib.sha256(content.encode()).hexdigest()[:16]
+    return _hexdigest64(content.encode())
+
+
+def _feed(h, obj: Any) -> None:
+    """Stream a canonical encoding of obj into hasher h (sorted dict keys)."""
+    if isinstance(obj, dict):
+        h.update(b"{")
+        for k in sorted(obj):
+            h.update(repr(k).encode())
+            h.update(b":")
+            _feed(h, obj[k])
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"[")
+        for item in obj:
+            _feed(h, item)
+            h.update(b",")
+        h.update(b"]")
+    else:
+        h.update(repr(obj).encode())
 
 
 def hash_dict(d: Dict) -> str:
     """Generate hash for dictionary."""
-    return hashlib.sha256(json.dumps(d, sort_keys=True).encode()).hexdigest()[:16]
+    h = _new_hasher()
+    _feed(h, d)
+    return h.hexdigest()
+
+
+def hash_search(vector: Any, params: Dict) -> str:
+    """Hash a query vector (as float32 bytes) together with its search params."""
+    h = _new_hasher()
+    h.update(np.asarray(vector, dtype=np.float32).tobytes())
+    _feed(h, params)
+    return h.hexdigest()
 
 
 # ============================================================
 # SINGLETON ACCESSOR
 # ============================================================
 
-_cache_instance: Optional[MultiLevelCache] = None
+# Built eagerly at import (cheap: three empty caches), so the accessor
+# on every request is a plain global read with no None check.
+_cache_instance: MultiLevelCache = MultiLevelCache()
 
 
 def get_cache() -> MultiLevelCache:
     """Get singleton cache instance."""
-    global _cache_instance
-    if _cache_instance is None:
-        _cache_instance = MultiLevelCache()
     return _cache_instance
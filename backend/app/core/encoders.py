@@ -9,13 +9,95 @@ Models used:
 - Structures: Hybrid (sequence + geometry + text)
 """
 
+import asyncio
+import hashlib
+import os
 import numpy as np
-from typing import List, Optional, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, List, Optional, Union, Tuple
 from pathlib import Path
 import logging
 
+from app.core.cache import get_cache
+
 logger = logging.getLogger(__name__)
 
+# Optional model dependencies, bound once here instead of imported per call.
+# Broad except: a broken torch install (e.g. Windows DLL errors) raises OSError.
+try:
+    import torch
+except Exception as e:
+    logger.warning(f"torch unavailable ({e}); local models disabled")
+    torch = None
+
+try:
+    import google.generativeai as genai
+except Exception:
+    genai = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Optional JIT for the AA-composition fallback (NumPy path used without it)
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Optional Aho-Corasick matcher for SparseEncoder (substring scan without it)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+_TORCH_DTYPES = {"fp32": "float32", "fp16": "float16", "bf16": "bfloat16"}
+
+
+def _torch_device_and_dtype():
+    """
+    Pick inference device/dtype. With model_precision="auto": bf16 (or fp16)
+    on CUDA, fp32 on CPU. An explicit fp16/bf16 also applies on CPU, e.g.
+    bf16 on CPUs with AVX512-BF16/AMX. Encoders always return fp32 vectors.
+    """
+    if torch is None:
+        raise ImportError("torch is not installed")
+
+    from app.config import get_settings
+
+    precision = get_settings().model_precision.lower()
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+
+    if precision in _TORCH_DTYPES:
+        return device, getattr(torch, _TORCH_DTYPES[precision])
+    if precision != "auto":
+        logger.warning(f"Unknown model_precision {precision!r}, using auto")
+
+    if device == "cuda":
+        dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        return device, dtype
+    return device, torch.float32
+
+
+def _from_pretrained_sdpa(model_name: str, dtype):
+    """
+    AutoModel with PyTorch's fused scaled-dot-product attention (flash /
+    memory-efficient kernels), or the default attention on transformers
+    versions where the architecture has no SDPA implementation.
+    """
+    from transformers import AutoModel
+
+    try:
+        return AutoModel.from_pretrained(
+            model_name, torch_dtype=dtype, attn_implementation="sdpa"
+        )
+    except (ValueError, TypeError, ImportError) as e:
+        logger.info(f"SDPA attention unavailable for {model_name} ({e})")
+        return AutoModel.from_pretrained(model_name, torch_dtype=dtype)
+
 
 # =============================================================================
 # TEXT ENCODER - PubMedBERT (Specialized for biomedical text)
@@ -41,6 +123,7 @@ class TextEncoder:
     _use_gemini = False
     _model = None
     _model_type = None
+    _device = "cpu"
 
     def __new__(cls):
         if cls._instance is None:
@@ -56,7 +139,8 @@ class TextEncoder:
 
         # Try Gemini API first (works on Windows!)
         try:
-            import google.generativeai as genai
+            if genai is None:
+                raise ImportError("google-generativeai is not installed")
             from app.config import get_settings
 
             settings = get_settings()
@@ -94,15 +178,17 @@ class TextEncoder:
 
         # Try PubMedBERT
         try:
-            from transformers import AutoTokenizer, AutoModel
+            from transformers import AutoTokenizer
 
             model_name = "microsoft/BiomedNLP-PubMedBERT-base-uncased-abstract-fulltext"
+            device, dtype = _torch_device_and_dtype()
             TextEncoder._tokenizer = AutoTokenizer.from_pretrained(model_name)
-            TextEncoder._model = AutoModel.from_pretrained(model_name)
-            TextEncoder._model.eval()
+            TextEncoder._model = _from_pretrained_sdpa(model_name, dtype)
+            TextEncoder._model.to(device).eval()
+            TextEncoder._device = device
             TextEncoder._model_type = "pubmedbert"
             TextEncoder._configured = True
-            logger.info("✅ PubMedBERT loaded successfully")
+            logger.info(f"✅ PubMedBERT loaded successfully ({device}, {dtype})")
             return
         except Exception as e3:
             logger.warning(f"PubMedBERT also failed: {e3}")
@@ -132,48 +218,67 @@ class TextEncoder:
         logger.warning("Using random vectors (no model loaded)")
         return np.random.randn(len(texts), 768).astype(np.float32)
 
+    GEMINI_BATCH_SIZE = 100  # batchEmbedContents request limit
+
     def _encode_gemini(self, texts: List[str]) -> np.ndarray:
-        """Encode using Gemini API"""
-        import google.generativeai as genai
+        """Encode using Gemini API (one batch request per GEMINI_BATCH_SIZE texts)"""
+        # Truncate if too long (Gemini limit)
+        texts = [text[:2000] for text in texts]
 
-        vectors = []
-        for text in texts:
+        vectors = np.empty((len(texts), 768), dtype=np.float32)
+        for start in range(0, len(texts), self.GEMINI_BATCH_SIZE):
+            chunk = texts[start : start + self.GEMINI_BATCH_SIZE]
             try:
-                # Truncate if too long (Gemini limit)
-                text = text[:2000] if len(text) > 2000 else text
-
                 result = genai.embed_content(
                     model="models/embedding-001",
-                    content=text,
+                    content=chunk,
                     task_type="retrieval_document",
                 )
-                embedding = np.array(result["embedding"], dtype=np.float32)
-                # Normalize
-                embedding = embedding / (np.linalg.norm(embedding) + 1e-8)
-                vectors.append(embedding)
+                vectors[start : start + len(chunk)] = result["embedding"]
             except Exception as e:
-                logger.error(f"Gemini embedding error: {e}")
-                vectors.append(np.random.randn(768).astype(np.float32))
+                logger.warning(f"Gemini batch embedding failed ({e}), retrying per text")
+                for offset, text in enumerate(chunk):
+                    vectors[start + offset] = self._embed_gemini_single(text)
 
-        return np.array(vectors, dtype=np.float32)
+        # Normalize
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-8
+        return vectors
 
-    def _encode_pubmedbert(self, texts: List[str]) -> np.ndarray:
-        """Encode using PubMedBERT"""
-        import torch
+    def _embed_gemini_single(self, text: str) -> np.ndarray:
+        """Embed one text; random vector on failure"""
+        try:
+            result = genai.embed_content(
+                model="models/embedding-001",
+                content=text,
+                task_type="retrieval_document",
+            )
+            return np.asarray(result["embedding"], dtype=np.float32)
+        except Exception as e:
+            logger.error(f"Gemini embedding error: {e}")
+            return np.random.randn(768).astype(np.float32)
 
-        vectors = []
-        for text in texts:
+    PUBMEDBERT_BATCH_SIZE = 32
+
+    def _encode_pubmedbert(self, texts: List[str]) -> np.ndarray:
+        """Encode using PubMedBERT (batched forward passes, masked mean pooling)"""
+        vectors = np.empty((len(texts), 768), dtype=np.float32)
+        for start in range(0, len(texts), self.PUBMEDBERT_BATCH_SIZE):
+            batch = texts[start : start + self.PUBMEDBERT_BATCH_SIZE]
             inputs = TextEncoder._tokenizer(
-                text, return_tensors="pt", truncation=True, max_length=512, padding=True
+                batch, return_tensors="pt", truncation=True, max_length=512, padding=True
             )
+            inputs = {k: v.to(TextEncoder._device) for k, v in inputs.items()}
 
-            with torch.no_grad():
+            with torch.inference_mode():
                 outputs = TextEncoder._model(**inputs)
-                embedding = outputs.last_hidden_state.mean(dim=1).squeeze().numpy()
-                embedding = embedding / (np.linalg.norm(embedding) + 1e-8)
-                vectors.append(embedding)
+                # Mean over real tokens only (padding excluded), pooled in fp32
+                mask = inputs["attention_mask"].unsqueeze(-1).float()
+                summed = (outputs.last_hidden_state.float() * mask).sum(dim=1)
+                embeddings = summed / mask.sum(dim=1).clamp(min=1.0)
+                embeddings = torch.nn.functional.normalize(embeddings, dim=1)
+                vectors[start : start + len(batch)] = embeddings.cpu().numpy()
 
-        return np.array(vectors, dtype=np.float32)
+        return vectors
 
     @property
     def dimension(self) -> int:
@@ -202,6 +307,10 @@ class ImageEncoder:
     _model = None
     _processor = None
     _model_type = None  # 'biomedclip', 'clip', or None
+    _device = "cpu"
+    _dtype = None
+    _encode_image = None  # BiomedCLIP encode_image, torch.compile'd on CUDA
+    _compiled = False
 
     def __new__(cls):
         if cls._instance is None:
@@ -217,18 +326,30 @@ class ImageEncoder:
         # Try BiomedCLIP first
         try:
             from open_clip import create_model_from_pretrained, get_tokenizer
-            import torch
 
             logger.info("Loading image encoder: BiomedCLIP")
             model, preprocess = create_model_from_pretrained(
                 "hf-hub:microsoft/BiomedCLIP-PubMedBERT_256-vit_base_patch16_224"
             )
+            device, dtype = _torch_device_and_dtype()
+            model.to(device=device, dtype=dtype).eval()
             ImageEncoder._model = model
             ImageEncoder._processor = preprocess
             ImageEncoder._model_type = "biomedclip"
-            ImageEncoder._model.eval()
+            ImageEncoder._device = device
+            ImageEncoder._dtype = dtype
+            ImageEncoder._encode_image = model.encode_image
+
+            # Fuse ViT kernels on GPU; dynamic shapes avoid a recompile per batch size
+            if device == "cuda" and hasattr(torch, "compile"):
+                ImageEncoder._encode_image = torch.compile(
+                    model.encode_image, dynamic=True
+                )
+                ImageEncoder._compiled = True
 
-            logger.info("✅ BiomedCLIP loaded successfully (biomedical-specialized)")
+            logger.info(
+                f"✅ BiomedCLIP loaded successfully (biomedical-specialized, {device})"
+            )
             return
         except Exception as e:
             logger.warning(f"BiomedCLIP failed: {e}")
@@ -259,8 +380,6 @@ class ImageEncoder:
             logger.warning("Using random vectors (no model loaded)")
             return np.random.randn(len(image_paths), 512).astype(np.float32)
 
-        from PIL import Image
-
         if ImageEncoder._model_type == "clip":
             try:
                 images = [Image.open(p).convert("RGB") for p in image_paths]
@@ -270,25 +389,44 @@ class ImageEncoder:
                 logger.error(f"Error encoding images: {e}")
                 return np.random.randn(len(image_paths), 512).astype(np.float32)
 
-        # Using BiomedCLIP
-        import torch
-
-        vectors = []
-        for img_path in image_paths:
+        # Using BiomedCLIP: preprocess every image, then one batched forward pass
+        vectors = np.empty((len(image_paths), 512), dtype=np.float32)
+        tensors, rows = [], []
+        for i, img_path in enumerate(image_paths):
             try:
                 image = Image.open(img_path).convert("RGB")
-                image_input = ImageEncoder._processor(image).unsqueeze(0)
-
-                with torch.no_grad():
-                    image_features = ImageEncoder._model.encode_image(image_input)
-                    embedding = image_features.squeeze().numpy()
-                    embedding = embedding / (np.linalg.norm(embedding) + 1e-8)
-                    vectors.append(embedding)
+                tensors.append(ImageEncoder._processor(image))
+                rows.append(i)
             except Exception as e:
                 logger.error(f"Error encoding image {img_path}: {e}")
-                vectors.append(np.random.randn(512).astype(np.float32))
+                vectors[i] = np.random.randn(512)
 
-        return np.array(vectors, dtype=np.float32)
+        if tensors:
+            batch = torch.stack(tensors).to(ImageEncoder._device, ImageEncoder._dtype)
+            try:
+                with torch.inference_mode():
+                    image_features = self._run_biomedclip(batch)
+                    image_features = torch.nn.functional.normalize(
+                        image_features.float(), dim=1
+                    )
+                vectors[rows] = image_features.cpu().numpy()
+            except Exception as e:
+                logger.error(f"Error encoding image batch: {e}")
+                vectors[rows] = np.random.randn(len(rows), 512)
+
+        return vectors
+
+    def _run_biomedclip(self, batch):
+        """encode_image via the compiled path, dropping to eager mode if it fails"""
+        try:
+            return ImageEncoder._encode_image(batch)
+        except Exception as e:
+            if not ImageEncoder._compiled:
+                raise
+            logger.warning(f"Compiled BiomedCLIP failed ({e}), using eager mode")
+            ImageEncoder._encode_image = ImageEncoder._model.encode_image
+            ImageEncoder._compiled = False
+            return ImageEncoder._encode_image(batch)
 
     @property
     def dimension(self) -> int:
@@ -300,6 +438,252 @@ class ImageEncoder:
 # =============================================================================
 
 
+def _build_aa_luts(amino_acids: str, hydrophobicity: dict):
+    """
+    Byte -> residue-index table (unknown/X -> 20), byte -> kept-residue mask
+    (amino acids and X) and index -> hydrophobicity table, so composition
+    features come from one vectorized pass.
+    """
+    aa_idx = np.full(256, 20, dtype=np.uint8)
+    for i, aa in enumerate(amino_acids):
+        aa_idx[ord(aa)] = i
+
+    valid = aa_idx < 20
+    valid[ord("X")] = True
+
+    hydro_lut = np.zeros(21, dtype=np.float32)
+    for aa, value in hydrophobicity.items():
+        hydro_lut[aa_idx[ord(aa)]] = value
+
+    return aa_idx, valid, hydro_lut
+
+
+@lru_cache(maxsize=8)
+def _strided_index(dim: int, step: int, count: int) -> np.ndarray:
+    """Indices of embedding[::step][:count], cached per hidden size."""
+    return np.arange(0, dim, step, dtype=np.intp)[:count]
+
+
+def _build_property_matrix(aa_idx: np.ndarray, groups: List[str]) -> np.ndarray:
+    """(groups x 21) membership matrix: matrix @ residue_counts = group counts."""
+    matrix = np.zeros((len(groups), 21))
+    for row, members in enumerate(groups):
+        for aa in members:
+            matrix[row, aa_idx[ord(aa)]] = 1.0
+    return matrix
+
+
+def _build_dipeptide_tables(aa_idx: np.ndarray, dipeptides: List[str]):
+    """Pair codes (first * 21 + second), homodipeptide mask and first residues."""
+    first = np.array([aa_idx[ord(a)] for a, _ in dipeptides], dtype=np.intp)
+    second = np.array([aa_idx[ord(b)] for _, b in dipeptides], dtype=np.intp)
+    return first * 21 + second, first == second, first
+
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True)
+    def _aa_composition_kernel(
+        idx, offsets, hydro_lut, dipep_codes, dipep_homo, dipep_first, property_matrix, out
+    ):
+        """
+        Fill the first 83 columns of `out` for each sequence idx[offsets[i]:offsets[i+1]].
+        Same feature layout as SequenceEncoder._encode_aa_composition's NumPy path.
+        """
+        n = len(offsets) - 1
+        n_groups = property_matrix.shape[0]
+
+        for i in prange(n):
+            start = offsets[i]
+            end = offsets[i + 1]
+            size = end - start
+            length = max(size, 1)
+
+            counts = np.zeros(21)
+            pairs = np.zeros(441)
+            homo = np.zeros(21)  # non-overlapping homodipeptides: run // 2
+            h_sum = 0.0
+            h_pos = 0.0
+            h_min = np.inf
+            h_max = -np.inf
+            run = 0
+
+            for j in range(start, end):
+                a = idx[j]
+                counts[a] += 1
+                h = hydro_lut[a]
+                h_sum += h
+                if h > 0:
+                    h_pos += 1
+                h_min = min(h_min, h)
+                h_max = max(h_max, h)
+                if j > start:
+                    prev = idx[j - 1]
+                    pairs[prev * 21 + a] += 1
+                    if a == prev:
+                        run += 1
+                    else:
+                        homo[prev] += run // 2
+                        run = 1
+                else:
+                    run = 1
+            if size > 0:
+                homo[idx[end - 1]] += run // 2
+
+            for a in range(20):
+                out[i, a] = counts[a] / length
+
+            denom = max(length - 1, 1)
+            for k in range(len(dipep_codes)):
+                if dipep_homo[k]:
+                    out[i, 20 + k] = homo[dipep_first[k]] / denom
+                else:
+                    out[i, 20 + k] = pairs[dipep_codes[k]] / denom
+
+            if size > 0:
+                mean = h_sum / size
+                var = 0.0
+                for j in range(start, end):
+                    d = hydro_lut[idx[j]] - mean
+                    var += d * d
+                out[i, 70] = mean
+                out[i, 71] = np.sqrt(var / size)
+                out[i, 72] = h_min
+                out[i, 73] = h_max
+                out[i, 74] = h_pos / length
+
+            for g in range(n_groups):
+                acc = 0.0
+                for a in range(21):
+                    acc += property_matrix[g, a] * counts[a]
+                out[i, 75 + g] = acc / length
+            out[i, 75 + n_groups] = np.log1p(length)
+            out[i, 76 + n_groups] = length / 1000
+
+else:
+    _aa_composition_kernel = None
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _geometric_kernel(coords, sample_idx, out):
+        """
+        Fill the first 19 entries of `out` from (N, 3) CA coordinates in a few
+        explicit loops. Same feature layout as the NumPy path in
+        StructureEncoder._extract_geometric_features.
+        """
+        n = coords.shape[0]
+        lo = coords[0].copy()
+        hi = coords[0].copy()
+        center = np.zeros(3)
+        for i in range(n):
+            for d in range(3):
+                v = coords[i, d]
+                center[d] += v
+                lo[d] = min(lo[d], v)
+                hi[d] = max(hi[d], v)
+
+        # Bounding box, volume, residue count, center of mass
+        volume = 1.0
+        for d in range(3):
+            center[d] /= n
+            out[d] = hi[d] - lo[d]
+            volume *= hi[d] - lo[d]
+            out[5 + d] = center[d]
+        out[3] = volume
+        out[4] = n
+
+        # Radius of gyration and distance-to-center stats
+        sq_sum = 0.0
+        cd_sum = 0.0
+        for i in range(n):
+            sq = 0.0
+            for d in range(3):
+                diff = coords[i, d] - center[d]
+                sq += diff * diff
+            sq_sum += sq
+            cd_sum += np.sqrt(sq)
+        cd_mean = cd_sum / n
+        cd_var = 0.0
+        for i in range(n):
+            sq = 0.0
+            for d in range(3):
+                diff = coords[i, d] - center[d]
+                sq += diff * diff
+            diff = np.sqrt(sq) - cd_mean
+            cd_var += diff * diff
+        out[8] = np.sqrt(sq_sum / n)
+
+        # Consecutive CA-CA distances
+        sd_sum = 0.0
+        sd_min = np.inf
+        sd_max = 0.0
+        for i in range(1, n):
+            sq = 0.0
+            for d in range(3):
+                diff = coords[i, d] - coords[i - 1, d]
+                sq += diff * diff
+            dist = np.sqrt(sq)
+            sd_sum += dist
+            sd_min = min(sd_min, dist)
+            sd_max = max(sd_max, dist)
+        sd_mean = sd_sum / (n - 1)
+        sd_var = 0.0
+        for i in range(1, n):
+            sq = 0.0
+            for d in range(3):
+                diff = coords[i, d] - coords[i - 1, d]
+                sq += diff * diff
+            diff = np.sqrt(sq) - sd_mean
+            sd_var += diff * diff
+        out[9] = sd_mean
+        out[10] = np.sqrt(sd_var / (n - 1))
+        out[11] = sd_min
+        out[12] = sd_max
+
+        out[13] = cd_mean
+        out[14] = np.sqrt(cd_var / n)
+
+        # End-to-end distance
+        sq = 0.0
+        for d in range(3):
+            diff = coords[n - 1, d] - coords[0, d]
+            sq += diff * diff
+        out[15] = np.sqrt(sq)
+
+        # Contact density over the sampled residues
+        m = len(sample_idx)
+        n_pairs = m * (m - 1) // 2
+        dists = np.empty(n_pairs)
+        k = 0
+        for a in range(m):
+            for b in range(a + 1, m):
+                sq = 0.0
+                for d in range(3):
+                    diff = coords[sample_idx[a], d] - coords[sample_idx[b], d]
+                    sq += diff * diff
+                dists[k] = np.sqrt(sq)
+                k += 1
+        contacts = 0
+        p_sum = 0.0
+        for k in range(n_pairs):
+            if dists[k] < 8.0:
+                contacts += 1
+            p_sum += dists[k]
+        p_mean = p_sum / n_pairs
+        p_var = 0.0
+        for k in range(n_pairs):
+            diff = dists[k] - p_mean
+            p_var += diff * diff
+        out[16] = contacts / n_pairs
+        out[17] = p_mean
+        out[18] = np.sqrt(p_var / n_pairs)
+
+else:
+    _geometric_kernel = None
+
+
 class SequenceEncoder:
     """
     Protein sequence encoder using ESM-2 - Meta's protein language model
@@ -319,6 +703,9 @@ class SequenceEncoder:
     _model = None
     _tokenizer = None
     _use_esm = False
+    _device = "cpu"
+    _forward = None  # ESM-2 forward, torch.compile'd on CUDA
+    _compiled = False
     _output_dim = 320
 
     AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
@@ -347,6 +734,24 @@ class SequenceEncoder:
         "Y": -1.3,
     }
 
+    # Dipeptide features (50 dims)
+    COMMON_DIPEPTIDES = [
+        "LL", "AA", "VV", "GG", "SS", "AL", "LA", "AV", "VA", "LV",
+        "VL", "IL", "LI", "EE", "KK", "AG", "GA", "AS", "SA", "AT",
+        "TA", "SG", "GS", "ST", "TS", "EK", "KE", "DE", "ED", "ER",
+        "RE", "LK", "KL", "LE", "EL", "AE", "EA", "AR", "RA", "AD",
+        "DA", "AN", "NA", "AQ", "QA", "GL", "LG", "GV", "VG", "GT",
+    ]
+
+    # hydrophobic, polar, positive, negative, aromatic, small
+    PROPERTY_GROUPS = ["AILMFVPWY", "STNQ", "KRH", "DE", "FWY", "AGST"]
+
+    _AA_IDX, _AA_VALID, _HYDRO_LUT = _build_aa_luts(AMINO_ACIDS, HYDROPHOBICITY)
+    _PROPERTY_MATRIX = _build_property_matrix(_AA_IDX, PROPERTY_GROUPS)
+    _DIPEP_CODES, _DIPEP_HOMO, _DIPEP_FIRST = _build_dipeptide_tables(
+        _AA_IDX, COMMON_DIPEPTIDES
+    )
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -361,17 +766,25 @@ class SequenceEncoder:
         # Try larger ESM-2 first
         for model_name in ["facebook/esm2_t33_650M_UR50D", "facebook/esm2_t6_8M_UR50D"]:
             try:
-                import torch
-                from transformers import AutoTokenizer, AutoModel
+                from transformers import AutoTokenizer
 
                 logger.info(f"Loading sequence encoder: {model_name}")
 
+                device, dtype = _torch_device_and_dtype()
                 SequenceEncoder._tokenizer = AutoTokenizer.from_pretrained(model_name)
-                SequenceEncoder._model = AutoModel.from_pretrained(model_name)
-                SequenceEncoder._model.eval()
+                model = _from_pretrained_sdpa(model_name, dtype)
+                model.to(device).eval()
+                SequenceEncoder._model = model
+                SequenceEncoder._forward = model
+                SequenceEncoder._device = device
                 SequenceEncoder._use_esm = True
 
-                logger.info(f"✅ {model_name} loaded successfully")
+                # Sequence lengths vary per call: dynamic shapes avoid recompiles
+                if device == "cuda" and hasattr(torch, "compile"):
+                    SequenceEncoder._forward = torch.compile(model, dynamic=True)
+                    SequenceEncoder._compiled = True
+
+                logger.info(f"✅ {model_name} loaded successfully ({device}, {dtype})")
                 return
 
             except Exception as e:
@@ -392,159 +805,194 @@ class SequenceEncoder:
 
     def _encode_esm(self, sequences: List[str]) -> np.ndarray:
         """Encode using ESM-2 model"""
-        import torch
-
-        vectors = []
-        for seq in sequences:
+        # Rows for too-short sequences stay zero
+        vectors = np.zeros((len(sequences), self._output_dim), dtype=np.float32)
+        for row, seq in enumerate(sequences):
             seq = "".join(c for c in seq.upper() if c in self.AMINO_ACIDS + "X")
             seq = seq[:1024]
 
             if len(seq) < 5:
-                vectors.append(np.zeros(self._output_dim, dtype=np.float32))
                 continue
 
             inputs = SequenceEncoder._tokenizer(
                 seq, return_tensors="pt", padding=True, truncation=True, max_length=1024
             )
+            inputs = {k: v.to(SequenceEncoder._device) for k, v in inputs.items()}
 
-            with torch.no_grad():
-                outputs = SequenceEncoder._model(**inputs)
-                embedding = outputs.last_hidden_state.mean(dim=1).squeeze().numpy()
+            with torch.inference_mode():
+                outputs = self._run_esm(inputs)
+                embedding = (
+                    outputs.last_hidden_state.mean(dim=1).squeeze().float().cpu().numpy()
+                )
 
                 # Reduce dimensions if needed
                 if len(embedding) > self._output_dim:
-                    step = len(embedding) // (self._output_dim - 10)
-                    reduced = embedding[::step][: self._output_dim - 10]
-                    stats = [
-                        np.mean(embedding),
-                        np.std(embedding),
-                        np.min(embedding),
-                        np.max(embedding),
-                        np.median(embedding),
-                    ]
-                    reduced = np.concatenate([reduced, stats])
-                    reduced = reduced[: self._output_dim]
-                    if len(reduced) < self._output_dim:
-                        reduced = np.pad(reduced, (0, self._output_dim - len(reduced)))
-                    embedding = reduced
-
-                embedding = embedding / (np.linalg.norm(embedding) + 1e-8)
-                vectors.append(embedding)
-
-        return np.array(vectors, dtype=np.float32)
+                    embedding = self._reduce_embedding(embedding)
 
-    def _encode_aa_composition(self, sequences: List[str]) -> np.ndarray:
-        """Fallback: Advanced amino acid composition encoding"""
-        vectors = []
+                vectors[row] = embedding / (np.linalg.norm(embedding) + 1e-8)
 
-        for seq in sequences:
-            seq = "".join(c for c in seq.upper() if c in self.AMINO_ACIDS + "X")
-            length = max(len(seq), 1)
-
-            features = []
-
-            # AA frequencies (20 dims)
-            aa_freq = np.array([seq.count(aa) / length for aa in self.AMINO_ACIDS])
-            features.extend(aa_freq)
-
-            # Dipeptide frequencies (50 dims)
-            common_dipeptides = [
-                "LL",
-                "AA",
-                "VV",
-                "GG",
-                "SS",
-                "AL",
-                "LA",
-                "AV",
-                "VA",
-                "LV",
-                "VL",
-                "IL",
-                "LI",
-                "EE",
-                "KK",
-                "AG",
-                "GA",
-                "AS",
-                "SA",
-                "AT",
-                "TA",
-                "SG",
-                "GS",
-                "ST",
-                "TS",
-                "EK",
-                "KE",
-                "DE",
-                "ED",
-                "ER",
-                "RE",
-                "LK",
-                "KL",
-                "LE",
-                "EL",
-                "AE",
-                "EA",
-                "AR",
-                "RA",
-                "AD",
-                "DA",
-                "AN",
-                "NA",
-                "AQ",
-                "QA",
-                "GL",
-                "LG",
-                "GV",
-                "VG",
-                "GT",
-            ]
-            dipeptide_freq = np.array(
-                [seq.count(dp) / max(length - 1, 1) for dp in common_dipeptides]
+        return vectors
+
+    def _run_esm(self, inputs: dict):
+        """ESM-2 forward via the compiled path, dropping to eager mode if it fails"""
+        try:
+            return SequenceEncoder._forward(**inputs)
+        except Exception as e:
+            if not SequenceEncoder._compiled:
+                raise
+            logger.warning(f"Compiled ESM-2 failed ({e}), using eager mode")
+            SequenceEncoder._forward = SequenceEncoder._model
+            SequenceEncoder._compiled = False
+            return SequenceEncoder._forward(**inputs)
+
+    def _reduce_embedding(self, embedding: np.ndarray) -> np.ndarray:
+        """
+        Strided sample of the hidden state plus mean/std/min/max/median,
+        zero-padded to _output_dim.
+        """
+        dim = len(embedding)
+        take = _strided_index(dim, dim // (self._output_dim - 10), self._output_dim - 10)
+
+        reduced = np.zeros(self._output_dim, dtype=embedding.dtype)
+        n = len(take)
+        np.take(embedding, take, out=reduced[:n])
+
+        mean = embedding.mean()
+        centered = embedding - mean
+        lo, hi = (dim - 1) // 2, dim // 2
+        middle = np.partition(embedding, (lo, hi))
+        reduced[n : n + 5] = (
+            mean,
+            np.sqrt((centered * centered).mean()),
+            embedding.min(),
+            embedding.max(),
+            (middle[lo] + middle[hi]) / 2,
+        )
+        return reduced
+
+    def _encode_aa_composition(self, sequences: List[str]) -> np.ndarray:
+        """Fallback: Advanced amino acid composition encoding (whole batch at once)"""
+        n = len(sequences)
+        # Feature blocks are written straight into the zero-padded output rows
+        out = np.zeros((n, self._output_dim), dtype=np.float32)
+        if n == 0:
+            return out
+
+        # Flatten the batch: residue indices plus the sequence each belongs to
+        encoded = [seq.upper().encode("ascii", "ignore") for seq in sequences]
+        codes = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        seq_ids = np.repeat(np.arange(n), [len(e) for e in encoded])
+        keep = self._AA_VALID[codes]
+        idx = self._AA_IDX[codes[keep]].astype(np.intp)
+        seq_ids = seq_ids[keep]
+
+        lengths = np.bincount(seq_ids, minlength=n)
+
+        if _aa_composition_kernel is not None:
+            offsets = np.concatenate(([0], np.cumsum(lengths)))
+            _aa_composition_kernel(
+                idx,
+                offsets,
+                self._HYDRO_LUT,
+                self._DIPEP_CODES,
+                self._DIPEP_HOMO,
+                self._DIPEP_FIRST,
+                self._PROPERTY_MATRIX,
+                out,
             )
-            features.extend(dipeptide_freq)
-
-            # Physicochemical properties (30 dims)
-            hydro_values = [self.HYDROPHOBICITY.get(aa, 0) for aa in seq]
-            if hydro_values:
-                features.extend(
-                    [
-                        np.mean(hydro_values),
-                        np.std(hydro_values),
-                        np.min(hydro_values),
-                        np.max(hydro_values),
-                        np.sum(np.array(hydro_values) > 0) / length,
-                    ]
-                )
-            else:
-                features.extend([0] * 5)
-
-            # Property groups
-            hydrophobic = sum(seq.count(aa) for aa in "AILMFVPWY") / length
-            polar = sum(seq.count(aa) for aa in "STNQ") / length
-            positive = sum(seq.count(aa) for aa in "KRH") / length
-            negative = sum(seq.count(aa) for aa in "DE") / length
-            aromatic = sum(seq.count(aa) for aa in "FWY") / length
-            small = sum(seq.count(aa) for aa in "AGST") / length
-
-            features.extend([hydrophobic, polar, positive, negative, aromatic, small])
-            features.extend([np.log1p(length), length / 1000])
-
-            # Pad to output dimension
-            features = np.array(features, dtype=np.float32)
-            if len(features) < self._output_dim:
-                features = np.pad(features, (0, self._output_dim - len(features)))
-            else:
-                features = features[: self._output_dim]
+        else:
+            self._fill_aa_composition(out, idx, seq_ids, lengths)
+
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        np.divide(out, norms, out=out, where=norms > 0)
+        return out
+
+    def _fill_aa_composition(
+        self, out: np.ndarray, idx: np.ndarray, seq_ids: np.ndarray, lengths: np.ndarray
+    ) -> None:
+        """NumPy path: write the 83 feature columns for the flattened batch."""
+        n = len(lengths)
+        length = np.maximum(lengths, 1)[:, None]
+
+        # AA frequencies (20 dims)
+        aa_counts = np.bincount(seq_ids * 21 + idx, minlength=n * 21).reshape(n, 21)
+        out[:, 0:20] = aa_counts[:, :20] / length
+
+        # Dipeptide frequencies (50 dims)
+        out[:, 20:70] = self._dipeptide_counts(idx, seq_ids, n) / np.maximum(
+            length - 1, 1
+        )
+
+        # Physicochemical properties (5 dims)
+        out[:, 70:75] = self._hydrophobicity_stats(idx, seq_ids, lengths)
+
+        # Property groups (6 dims) + length (2 dims); rest stays zero-padded
+        out[:, 75:81] = aa_counts @ self._PROPERTY_MATRIX.T / length
+        out[:, 81] = np.log1p(length[:, 0])
+        out[:, 82] = length[:, 0] / 1000
 
-            norm = np.linalg.norm(features)
-            if norm > 0:
-                features = features / norm
+    @classmethod
+    def _dipeptide_counts(
+        cls, idx: np.ndarray, seq_ids: np.ndarray, n: int
+    ) -> np.ndarray:
+        """
+        (n, 50) counts of COMMON_DIPEPTIDES over a flattened batch.
 
-            vectors.append(features)
+        Matches str.count semantics: occurrences are non-overlapping, so a run
+        of r identical residues holds r // 2 homodipeptides ("LLL" -> 1 "LL").
+        """
+        counts = np.zeros((n, len(cls.COMMON_DIPEPTIDES)))
+        total = len(idx)
+        if total < 2:
+            return counts
+
+        # Pairs never straddle two sequences
+        same_seq = seq_ids[1:] == seq_ids[:-1]
+        pair_codes = seq_ids[:-1] * 441 + idx[:-1] * 21 + idx[1:]
+        pair_counts = np.bincount(pair_codes[same_seq], minlength=n * 441)
+        counts[:] = pair_counts.reshape(n, 441)[:, cls._DIPEP_CODES]
+
+        change = np.empty(total, dtype=bool)
+        change[0] = True
+        change[1:] = (idx[1:] != idx[:-1]) | ~same_seq
+        starts = np.flatnonzero(change)
+        run_lengths = np.diff(np.append(starts, total))
+        homo = np.bincount(
+            seq_ids[starts] * 21 + idx[starts],
+            weights=run_lengths // 2,
+            minlength=n * 21,
+        ).reshape(n, 21)
+        counts[:, cls._DIPEP_HOMO] = homo[:, cls._DIPEP_FIRST[cls._DIPEP_HOMO]]
+
+        return counts
+
+    @classmethod
+    def _hydrophobicity_stats(
+        cls, idx: np.ndarray, seq_ids: np.ndarray, lengths: np.ndarray
+    ) -> np.ndarray:
+        """(n, 5) mean/std/min/max/positive-fraction; zeros for empty sequences."""
+        n = len(lengths)
+        stats = np.zeros((n, 5))
+        present = lengths > 0
+        if not present.any():
+            return stats
+
+        values = cls._HYDRO_LUT[idx].astype(np.float64)
+        counts = np.maximum(lengths, 1)
+        mean = np.bincount(seq_ids, weights=values, minlength=n) / counts
+        deviation = values - mean[seq_ids]
+
+        # seq_ids is sorted, so each non-empty sequence is one contiguous segment
+        starts = (np.cumsum(lengths) - lengths)[present]
+        stats[:, 0] = mean
+        stats[:, 1] = np.sqrt(
+            np.bincount(seq_ids, weights=deviation * deviation, minlength=n) / counts
+        )
+        stats[present, 2] = np.minimum.reduceat(values, starts)
+        stats[present, 3] = np.maximum.reduceat(values, starts)
+        stats[:, 4] = np.bincount(seq_ids, weights=values > 0, minlength=n) / counts
 
-        return np.array(vectors, dtype=np.float32)
+        return stats
 
     @property
     def dimension(self) -> int:
@@ -556,6 +1004,19 @@ class SequenceEncoder:
 # =============================================================================
 
 
+def _build_residue_lut(aa_map: dict) -> np.ndarray:
+    """
+    26^3 table from an uppercase three-letter residue code, indexed as
+    (c0 * 26 + c1) * 26 + c2 with c = byte - ord("A"), to its one-letter
+    code byte; unknown codes map to "X".
+    """
+    lut = np.full(26**3, ord("X"), dtype=np.uint8)
+    for three, one in aa_map.items():
+        c0, c1, c2 = (ord(ch) - ord("A") for ch in three)
+        lut[(c0 * 26 + c1) * 26 + c2] = ord(one)
+    return lut
+
+
 class StructureEncoder:
     """
     Structure encoder using hybrid approach:
@@ -568,6 +1029,21 @@ class StructureEncoder:
 
     _instance = None
 
+    # File reads, NumPy parsing and the numba kernel release the GIL, so
+    # threads overlap well; no pool for a single file
+    MAX_PARSE_WORKERS = min(8, os.cpu_count() or 1)
+
+    # Bump when the feature layout or models change so cached vectors miss
+    CACHE_VERSION = "v2"
+
+    AA_MAP = {
+        "ALA": "A", "CYS": "C", "ASP": "D", "GLU": "E", "PHE": "F",
+        "GLY": "G", "HIS": "H", "ILE": "I", "LYS": "K", "LEU": "L",
+        "MET": "M", "ASN": "N", "PRO": "P", "GLN": "Q", "ARG": "R",
+        "SER": "S", "THR": "T", "VAL": "V", "TRP": "W", "TYR": "Y",
+    }
+    _RESIDUE_LUT = _build_residue_lut(AA_MAP)
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -579,174 +1055,272 @@ class StructureEncoder:
 
     def encode(self, pdb_paths: Union[str, Path, List[Union[str, Path]]]) -> np.ndarray:
         """Encode PDB structure(s) to vectors"""
+        return self.encode_with_titles(pdb_paths)[0]
+
+    def encode_with_titles(
+        self, pdb_paths: Union[str, Path, List[Union[str, Path]]]
+    ) -> Tuple[np.ndarray, List[Optional[str]]]:
+        """
+        Encode PDB structure(s) to vectors, also returning each TITLE header
+        ("" if absent, None if the file could not be read) from the same parse.
+
+        Vectors are cached by file content hash. All uncached files are parsed
+        first, then the sequence and text encoders each run once over them.
+        Files that fail to parse get zero rows.
+        """
         if isinstance(pdb_paths, (str, Path)):
             pdb_paths = [pdb_paths]
 
-        vectors = []
-        for pdb_path in pdb_paths:
-            vec = self._encode_single(pdb_path)
-            vectors.append(vec)
+        vectors = np.zeros((len(pdb_paths), 768), dtype=np.float32)
+        titles: List[Optional[str]] = [None] * len(pdb_paths)
 
-        return np.array(vectors, dtype=np.float32)
+        workers = min(self.MAX_PARSE_WORKERS, len(pdb_paths))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                loaded = list(pool.map(self._load_structure, pdb_paths))
+        else:
+            loaded = [self._load_structure(p) for p in pdb_paths]
 
-    def _encode_single(self, pdb_path: Union[str, Path]) -> np.ndarray:
-        """Encode a single PDB file"""
+        rows, keys, sequences, text_descs, geo_features = [], [], [], [], []
+        for row, result in enumerate(loaded):
+            if result is None:
+                continue
+            key, cached, parsed = result
+            if cached is not None:
+                vectors[row] = cached["vector"]
+                titles[row] = cached["title"]
+                continue
+            title, sequence, text_desc, geo = parsed
+            titles[row] = title
+            rows.append(row)
+            keys.append(key)
+            sequences.append(sequence)
+            text_descs.append(text_desc)
+            geo_features.append(geo)
+
+        if not rows:
+            return vectors, titles
+
+        # Combine: 320 + 256 + 192 = 768, written into one buffer
+        combined = np.empty((len(rows), 768), dtype=np.float32)
         try:
-            with open(pdb_path, "r") as f:
-                pdb_content = f.read()
+            # Sequence features (320 dims); too-short sequences stay zero
+            combined[:, :320] = 0.0
+            seq_rows = [i for i, seq in enumerate(sequences) if seq and len(seq) > 10]
+            if seq_rows:
+                combined[seq_rows, :320] = self.sequence_encoder.encode(
+                    [sequences[i] for i in seq_rows]
+                )
 
-            sequence = self._extract_sequence(pdb_content)
-            title = self._extract_field(pdb_content, "TITLE")
-            method = self._extract_field(pdb_content, "EXPDTA")
-            geo_features = self._extract_geometric_features(pdb_content)
+            # Text description (768 -> 256 dims)
+            combined[:, 320:576] = self.text_encoder.encode(text_descs)[:, :256]
+        except Exception as e:
+            logger.error(f"Error encoding structures: {e}")
+            return vectors, titles
 
-            # Encode sequence (320 dims)
-            if sequence and len(sequence) > 10:
-                seq_vec = self.sequence_encoder.encode(sequence)[0]
-            else:
-                seq_vec = np.zeros(320, dtype=np.float32)
+        for i, geo in enumerate(geo_features):
+            combined[i, 576:] = geo
+
+        # In-place L2 normalisation; all-zero rows stay zero (0 / 1e-12)
+        norms = np.linalg.norm(combined, axis=1, keepdims=True)
+        np.divide(combined, norms.clip(min=1e-12), out=combined)
 
-            # Encode text (768 -> 256 dims)
-            text_desc = f"{title} {method} protein structure"
-            full_text_vec = self.text_encoder.encode(text_desc)[0]
-            text_vec = full_text_vec[:256]
+        vectors[rows] = combined
 
-            # Combine: 320 + 256 + 192 = 768
-            combined = np.concatenate([seq_vec, text_vec, geo_features])
+        cache = get_cache()
+        for key, row, vector in zip(keys, rows, combined):
+            cache.set_embedding(key, {"vector": vector, "title": titles[row]})
 
-            norm = np.linalg.norm(combined)
-            if norm > 0:
-                combined = combined / norm
+        return vectors, titles
 
-            return combined.astype(np.float32)
+    def _load_structure(self, pdb_path: Union[str, Path]) -> Optional[tuple]:
+        """
+        Read one file and look up its content hash.
+
+        Returns (cache_key, cached_entry, None) on a hit,
+        (cache_key, None, (title, sequence, text_desc, geo_features)) on a
+        miss, or None if the file cannot be read or parsed.
+        """
+        try:
+            digest, title, method, ca_lines = self._read_pdb(pdb_path)
+
+            key = f"struct:{self.CACHE_VERSION}:{digest}"
+            cached = get_cache().get_embedding(key)
+            if cached is not None:
+                return key, cached, None
 
+            return key, None, self._parse_structure(title, method, ca_lines)
         except Exception as e:
             logger.error(f"Error encoding structure {pdb_path}: {e}")
-            return np.zeros(768, dtype=np.float32)
-
-    def _extract_sequence(self, pdb_content: str) -> str:
-        """Extract amino acid sequence from ATOM records"""
-        aa_map = {
-            "ALA": "A",
-            "CYS": "C",
-            "ASP": "D",
-            "GLU": "E",
-            "PHE": "F",
-            "GLY": "G",
-            "HIS": "H",
-            "ILE": "I",
-            "LYS": "K",
-            "LEU": "L",
-            "MET": "M",
-            "ASN": "N",
-            "PRO": "P",
-            "GLN": "Q",
-            "ARG": "R",
-            "SER": "S",
-            "THR": "T",
-            "VAL": "V",
-            "TRP": "W",
-            "TYR": "Y",
-        }
+            return None
 
+    def _parse_structure(
+        self, title: str, method: str, ca_lines: List[bytes]
+    ) -> Tuple[str, str, str, np.ndarray]:
+        """Model-free work for one file: (title, sequence, text description, geo features)"""
+        sequence, coords = self._parse_ca_lines(ca_lines)
+        geo_features = self._extract_geometric_features(coords)
+        return title, sequence, f"{title} {method} protein structure", geo_features
+
+    def _read_pdb(self, pdb_path: Union[str, Path]) -> Tuple[str, str, str, List[bytes]]:
+        """
+        Single streamed pass over the PDB file.
+
+        Returns (digest, title, method, ca_lines): the blake2b content digest,
+        the first TITLE and EXPDTA header values, and the raw CA ATOM records.
+        The file is hashed line by line, so its full text is never held in
+        memory.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        title = None
+        method = None
+        ca_lines = []
+
+        with open(pdb_path, "rb", buffering=1 << 20) as f:
+            for raw in f:
+                hasher.update(raw)
+                if raw.startswith(b"ATOM"):
+                    line = raw.rstrip(b"\r\n")
+                    if len(line) > 26 and line[12:16].strip() == b"CA":
+                        ca_lines.append(line)
+                elif title is None and raw.startswith(b"TITLE"):
+                    title = raw[10:].decode("utf-8", "replace").strip()
+                elif method is None and raw.startswith(b"EXPDTA"):
+                    method = raw[10:].decode("utf-8", "replace").strip()
+
+        return hasher.hexdigest(), title or "", method or "", ca_lines
+
+    def _parse_ca_lines(self, ca_lines: List[bytes]) -> Tuple[str, np.ndarray]:
+        """
+        (sequence, ca_coords): the one-letter sequence of CA atoms ordered by
+        (chain, residue number) and an (N, 3) array of every CA coordinate.
+        """
+        try:
+            return self._parse_ca_records(ca_lines)
+        except ValueError:
+            # Malformed columns somewhere: fall back to per-line parsing,
+            # which skips bad records individually
+            return self._parse_ca_records_slow(ca_lines)
+
+    def _parse_ca_records(self, ca_lines: List[bytes]) -> Tuple[str, np.ndarray]:
+        """
+        Vectorized fixed-width parse of CA ATOM records.
+
+        The lines are packed into a zero-padded byte matrix so residue numbers
+        and x/y/z columns are converted by NumPy in C rather than per line.
+        Raises ValueError if any column fails to parse.
+        """
+        if not ca_lines:
+            return "", np.zeros((0, 3), dtype=np.float64)
+
+        lengths = np.fromiter(map(len, ca_lines), dtype=np.int64, count=len(ca_lines))
+        width = max(int(lengths.max()), 54)
+        records = np.array(ca_lines, dtype=f"S{width}").view(np.uint8)
+        records = records.reshape(len(ca_lines), width)
+
+        def column(start: int, stop: int, rows=slice(None)) -> np.ndarray:
+            block = np.ascontiguousarray(records[rows, start:stop])
+            return block.view(f"S{stop - start}").ravel()
+
+        # Residues: first occurrence per (chain, resnum), ordered by that key
+        resnums = column(22, 26).astype(np.int64)
+        keys = (records[:, 21].astype(np.int64) << 32) | (resnums + (1 << 31))
+        _, first = np.unique(keys, return_index=True)
+
+        # One-letter codes via the 26^3 table; any name that is not three
+        # uppercase letters (blank-padded, lowercase, digits) is "X"
+        codes = records[first, 17:20].astype(np.intp) - ord("A")
+        known = ((codes >= 0) & (codes < 26)).all(axis=1)
+        letters = np.full(len(first), ord("X"), dtype=np.uint8)
+        codes = codes[known]
+        lut_index = (codes[:, 0] * 26 + codes[:, 1]) * 26 + codes[:, 2]
+        letters[known] = self._RESIDUE_LUT[lut_index]
+        sequence = letters.tobytes().decode("ascii")
+
+        # Coordinates: only records long enough to hold x/y/z
+        full = lengths > 54
+        coords = np.empty((int(full.sum()), 3), dtype=np.float64)
+        for axis, start in enumerate((30, 38, 46)):
+            coords[:, axis] = column(start, start + 8, full).astype(np.float64)
+
+        return sequence, coords
+
+    def _parse_ca_records_slow(self, ca_lines: List[bytes]) -> Tuple[str, np.ndarray]:
+        """Per-line CA record parse that skips unparseable fields"""
         residues = {}
-        for line in pdb_content.split("\n"):
-            if line.startswith("ATOM") and len(line) > 26:
-                if line[12:16].strip() == "CA":
-                    res_name = line[17:20].strip()
-                    chain = line[21] if len(line) > 21 else "A"
-                    try:
-                        res_num = int(line[22:26].strip())
-                        key = (chain, res_num)
-                        if key not in residues:
-                            residues[key] = aa_map.get(res_name, "X")
-                    except ValueError:
-                        continue
-
-        sorted_keys = sorted(residues.keys())
-        return "".join(residues[k] for k in sorted_keys)
-
-    def _extract_field(self, pdb_content: str, field: str) -> str:
-        """Extract a field from PDB header"""
-        for line in pdb_content.split("\n"):
-            if line.startswith(field):
-                return line[10:].strip()
-        return ""
-
-    def _extract_geometric_features(self, pdb_content: str) -> np.ndarray:
-        """Extract 192-dimensional geometric features"""
         coords = []
+        for raw in ca_lines:
+            line = raw.decode("utf-8", "replace")
+            try:
+                key = (line[21], int(line[22:26].strip()))
+                if key not in residues:
+                    residues[key] = self.AA_MAP.get(line[17:20].strip(), "X")
+            except ValueError:
+                pass
+            if len(line) > 54:
+                try:
+                    coords.append(
+                        [float(line[30:38]), float(line[38:46]), float(line[46:54])]
+                    )
+                except ValueError:
+                    pass
 
-        for line in pdb_content.split("\n"):
-            if line.startswith("ATOM") and len(line) > 54:
-                if line[12:16].strip() == "CA":
-                    try:
-                        x = float(line[30:38])
-                        y = float(line[38:46])
-                        z = float(line[46:54])
-                        coords.append([x, y, z])
-                    except ValueError:
-                        continue
+        sequence = "".join(residues[k] for k in sorted(residues))
+        return sequence, np.array(coords, dtype=np.float64).reshape(-1, 3)
 
+    def _extract_geometric_features(self, coords: np.ndarray) -> np.ndarray:
+        """Extract 192-dimensional geometric features from CA coordinates"""
         if len(coords) < 3:
             return np.zeros(192, dtype=np.float32)
 
-        coords = np.array(coords)
+        coords = np.ascontiguousarray(coords, dtype=np.float64)
         n_residues = len(coords)
-        features = []
 
-        # Bounding box
-        bbox_min = coords.min(axis=0)
-        bbox_max = coords.max(axis=0)
-        bbox_size = bbox_max - bbox_min
-        features.extend(bbox_size.tolist())
-        features.append(np.prod(bbox_size))  # Volume
-        features.append(n_residues)
+        # Single output buffer; entries past the 19 features stay zero padding
+        features = np.zeros(192, dtype=np.float32)
+        n_sample = min(50, n_residues)
+        sample_idx = np.linspace(0, n_residues - 1, n_sample, dtype=int)
+
+        if _geometric_kernel is not None:
+            _geometric_kernel(coords, sample_idx, features)
+            return features
+
+        # Bounding box, volume, residue count
+        bbox_size = coords.max(axis=0) - coords.min(axis=0)
+        features[0:3] = bbox_size
+        features[3] = np.prod(bbox_size)
+        features[4] = n_residues
 
         # Center of mass
         center = coords.mean(axis=0)
-        features.extend(center.tolist())
+        features[5:8] = center
 
         # Radius of gyration
-        rg = np.sqrt(np.mean(np.sum((coords - center) ** 2, axis=1)))
-        features.append(rg)
+        features[8] = np.sqrt(np.mean(np.sum((coords - center) ** 2, axis=1)))
 
         # Distance statistics
         seq_dists = np.linalg.norm(np.diff(coords, axis=0), axis=1)
-        features.extend(
-            [
-                np.mean(seq_dists),
-                np.std(seq_dists),
-                np.min(seq_dists),
-                np.max(seq_dists),
-            ]
-        )
+        features[9] = np.mean(seq_dists)
+        features[10] = np.std(seq_dists)
+        features[11] = np.min(seq_dists)
+        features[12] = np.max(seq_dists)
 
         center_dists = np.linalg.norm(coords - center, axis=1)
-        features.extend([np.mean(center_dists), np.std(center_dists)])
+        features[13] = np.mean(center_dists)
+        features[14] = np.std(center_dists)
 
         # End-to-end distance
-        features.append(np.linalg.norm(coords[-1] - coords[0]))
+        features[15] = np.linalg.norm(coords[-1] - coords[0])
 
         # Contact density (sampled)
-        n_sample = min(50, n_residues)
-        sample_idx = np.linspace(0, n_residues - 1, n_sample, dtype=int)
         sampled = coords[sample_idx]
-
         if len(sampled) > 1:
-            from scipy.spatial.distance import pdist
-
-            pairwise = pdist(sampled)
-            contacts_8 = (pairwise < 8.0).sum() / len(pairwise)
-            features.append(contacts_8)
-            features.extend([np.mean(pairwise), np.std(pairwise)])
-        else:
-            features.extend([0, 0, 0])
-
-        # Pad to 192
-        features = np.array(features[:192], dtype=np.float32)
-        if len(features) < 192:
-            features = np.pad(features, (0, 192 - len(features)))
+            diff = sampled[:, None, :] - sampled[None, :, :]
+            upper = np.triu_indices(len(sampled), 1)
+            pairwise = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff)[upper])
+            features[16] = (pairwise < 8.0).sum() / len(pairwise)
+            features[17] = np.mean(pairwise)
+            features[18] = np.std(pairwise)
 
         return features
 
@@ -775,6 +1349,13 @@ class SparseEncoder:
     _instance = None
     _vocabulary = None
     _term_to_idx = None
+    _automaton = None
+    _sorted_terms = None
+    _by_prefix = None
+    _short_terms = None
+
+    # Fallback scan only tests terms whose first SCAN_PREFIX_LEN characters occur
+    SCAN_PREFIX_LEN = 3
 
     def __new__(cls):
         if cls._instance is None:
@@ -793,6 +1374,11 @@ class SparseEncoder:
             self.b = b
             self.avg_doc_len = 50.0
 
+            # BM25 constants: tf = count * k1_plus_1 / (count + base + slope * doc_len)
+            self._k1_plus_1 = k1 + 1
+            self._len_norm_base = k1 * (1 - b)
+            self._len_norm_slope = k1 * b / self.avg_doc_len
+
             # Category weights for biological terms
             self.category_weights = {
                 "genes": 3.0,
@@ -806,6 +1392,38 @@ class SparseEncoder:
             }
 
             self._load_vocabulary()
+            self._index_vocabulary()
+
+    def _index_vocabulary(self):
+        """
+        Build the per-vocabulary matching structures once: the longest-first
+        term list for the substring scan and, if available, the Aho-Corasick
+        automaton.
+        """
+        SparseEncoder._sorted_terms = sorted(
+            SparseEncoder._vocabulary.keys(), key=len, reverse=True
+        )
+
+        by_prefix = {}
+        short_terms = []
+        for term in SparseEncoder._sorted_terms:
+            if len(term) < self.SCAN_PREFIX_LEN:
+                short_terms.append(term)
+            else:
+                by_prefix.setdefault(term[: self.SCAN_PREFIX_LEN], []).append(term)
+        SparseEncoder._by_prefix = by_prefix
+        SparseEncoder._short_terms = short_terms
+
+        if ahocorasick is None:
+            logger.warning("pyahocorasick not installed, using substring scan")
+            return
+
+        automaton = ahocorasick.Automaton()
+        for term in SparseEncoder._vocabulary:
+            if term:
+                automaton.add_word(term, term)
+        automaton.make_automaton()
+        SparseEncoder._automaton = automaton
 
     def _load_vocabulary(self):
         """Load biological vocabulary from JSON file."""
@@ -983,73 +1601,85 @@ class SparseEncoder:
 
     def _encode_single(self, text: str) -> dict:
         """Encode single text to sparse vector."""
-        import re
-
         # Tokenize
         text_lower = text.lower()
 
         # Find matched terms
         matched_terms = {}
+        length_norm = self._len_norm_base + self._len_norm_slope * len(text.split())
 
-        # Multi-word matching (longer terms first)
-        sorted_terms = sorted(SparseEncoder._vocabulary.keys(), key=len, reverse=True)
-
-        remaining_text = text_lower
-
-        for term in sorted_terms:
-            if term in remaining_text:
-                info = SparseEncoder._vocabulary[term]
-                idx = info["idx"]
-                weight = info["weight"]
-
-                # Count occurrences
-                count = remaining_text.count(term)
-                if count > 0:
-                    # BM25-style TF
-                    tf = (
-                        count
-                        * (self.k1 + 1)
-                        / (
-                            count
-                            + self.k1
-                            * (
-                                1
-                                - self.b
-                                + self.b * len(text.split()) / self.avg_doc_len
-                            )
-                        )
-                    )
-                    score = tf * weight
+        if SparseEncoder._automaton is not None:
+            term_counts = self._count_terms(text_lower)
+        else:
+            term_counts = self._scan_terms(text_lower)
 
-                    if idx not in matched_terms or matched_terms[idx] < score:
-                        matched_terms[idx] = score
+        for term, count in term_counts.items():
+            info = SparseEncoder._vocabulary[term]
+            idx = info["idx"]
+            weight = info["weight"]
 
-        # Also add simple word tokens
-        words = re.findall(r"\b[a-z0-9]+\b", text_lower)
-        for word in words:
-            if len(word) > 2 and word in SparseEncoder._term_to_idx:
-                idx = SparseEncoder._term_to_idx[word]
-                if idx not in matched_terms:
-                    info = SparseEncoder._vocabulary.get(word, {})
-                    weight = info.get("weight", 1.0)
-                    matched_terms[idx] = weight
+            # BM25-style TF
+            tf = count * self._k1_plus_1 / (count + length_norm)
+            score = tf * weight
+
+            if idx not in matched_terms or matched_terms[idx] < score:
+                matched_terms[idx] = score
 
         # Convert to sparse format
         if not matched_terms:
             return {"indices": [], "values": []}
 
-        indices = list(matched_terms.keys())
-        values = [matched_terms[i] for i in indices]
+        # Ascending indices, so downstream sparse dot products can merge
+        # two vectors in one linear pass
+        indices = sorted(matched_terms)
 
         # Normalize values
-        max_val = max(values) if values else 1.0
-        values = [v / max_val for v in values]
+        max_val = max(matched_terms.values())
+        values = [matched_terms[i] / max_val for i in indices]
 
         return {
             "indices": indices,
             "values": values,
         }
 
+    def _count_terms(self, text_lower: str) -> dict:
+        """
+        One automaton pass over the text. Counts are non-overlapping per term,
+        matching str.count: an occurrence is only counted if it starts after
+        the previous counted occurrence of the same term ended.
+        """
+        counts = {}
+        last_end = {}
+        for end, term in SparseEncoder._automaton.iter(text_lower):
+            if end - len(term) < last_end.get(term, -1):
+                continue
+            last_end[term] = end
+            counts[term] = counts.get(term, 0) + 1
+        return counts
+
+    def _scan_terms(self, text_lower: str) -> dict:
+        """
+        Substring-scan fallback used when pyahocorasick is unavailable.
+
+        A term can only occur if its prefix does, so only the buckets of
+        prefixes present in the text (plus the few very short terms) are
+        scanned instead of the whole vocabulary.
+        """
+        width = self.SCAN_PREFIX_LEN
+        prefixes = {text_lower[i : i + width] for i in range(len(text_lower))}
+
+        candidates = list(SparseEncoder._short_terms)
+        for prefix in prefixes.intersection(SparseEncoder._by_prefix):
+            candidates.extend(SparseEncoder._by_prefix[prefix])
+
+        counts = {}
+        for term in candidates:
+            # str.count alone: an "in" check first would scan the text twice
+            count = text_lower.count(term)
+            if count:
+                counts[term] = count
+        return counts
+
     def extract_concepts(self, text: str) -> dict:
         """
         Extract biological concepts from text.
@@ -1146,10 +1776,12 @@ class MultiModalEncoder:
 
         has_structure = structure_path is not None and Path(structure_path).exists()
         if has_structure:
-            vectors["structure"] = self.structure_encoder.encode(structure_path)[
-                0
-            ].tolist()
-            title = self._extract_pdb_title(structure_path)
+            # The TITLE header comes from the same parse (or cache entry)
+            struct_vecs, titles = self.structure_encoder.encode_with_titles(
+                structure_path
+            )
+            vectors["structure"] = struct_vecs[0].tolist()
+            title = titles[0] or Path(structure_path).stem
             if title and not has_text:
                 vectors["text"] = self.text_encoder.encode(title)[0].tolist()
 
@@ -1175,15 +1807,101 @@ class MultiModalEncoder:
 
         return input_type, vectors
 
-    def _extract_pdb_title(self, pdb_path: str) -> Optional[str]:
-        try:
-            with open(pdb_path, "r") as f:
-                for line in f:
-                    if line.startswith("TITLE"):
-                        return line[10:].strip()
-            return Path(pdb_path).stem
-        except Exception:
-            return Path(pdb_path).stem
+
+# =============================================================================
+# ENCODER BATCHER - Coalesce concurrent requests into one batched forward pass
+# =============================================================================
+
+
+class EncoderBatcher:
+    """
+    Request coalescer for text encoding.
+
+    Each HTTP request encodes a single query; under concurrent load that means
+    N batch-size-1 forward passes. The batcher collects pending texts for up to
+    `max_wait_ms` (or `max_batch_size` items), runs one batched encode in a
+    worker thread, and resolves each caller's future with its own row.
+
+    Usage:
+        vector = await get_encoder_batcher().encode("BRCA1 DNA repair")
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 10.0,
+    ):
+        self._encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def encode(self, text: str) -> np.ndarray:
+        """Encode a single text; returns its 1-D vector."""
+        loop = asyncio.get_running_loop()
+        self._ensure_worker(loop)
+
+        future = loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start (or restart) the batching worker on the running loop."""
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the worker and cancel requests still waiting in the queue."""
+        worker, self._worker = self._worker, None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+        self._queue = None
+        self._loop = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+
+            # Collect more requests until the batch is full or the window closes
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                vectors = await asyncio.to_thread(self._encode_fn, texts)
+            except Exception as e:
+                logger.error(f"Batched encode failed ({len(texts)} texts): {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
 
 
 # =============================================================================
@@ -1199,3 +1917,20 @@ def get_encoder() -> MultiModalEncoder:
     if _encoder_instance is None:
         _encoder_instance = MultiModalEncoder()
     return _encoder_instance
+
+
+_batcher_instance = None
+
+
+def get_encoder_batcher() -> EncoderBatcher:
+    """Get the singleton text-encoding batcher"""
+    global _batcher_instance
+    if _batcher_instance is None:
+        _batcher_instance = EncoderBatcher(get_encoder().encode_text)
+    return _batcher_instance
+
+
+async def close_encoder_batcher() -> None:
+    """Stop the batcher's worker, if one was ever created (app shutdown)"""
+    if _batcher_instance is not None:
+        await _batcher_instance.close()
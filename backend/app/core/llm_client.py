@@ -6,35 +6,260 @@ Features:
 - bridge_cross_modal(): Génère queries + filters + alignment
 - generate_design_candidates(): Design Assistant
 - generate_summary(): Summary generation
+- generate_summary_stream(): Summary streamed chunk by chunk
 """
 
+import asyncio
+import copy
 import json
 import logging
 import re
-from typing import Dict, List, Any, Optional
+import threading
+from typing import AsyncIterator, Dict, List, Any, Optional
+
+import numpy as np
 
 from app.config import get_settings
+from app.core.cache import LRUCache, get_cache, hash_content
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Optional Rust JSON codec for LLM replies (stdlib json without it).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+# the stdlib exception either way.
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Optional HNSW index for SemanticCache lookups (full matrix scan without it)
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+# Prompts whose reply failed to parse as JSON are remembered this long, so
+# retries return the fallback without another Gemini call
+BAD_JSON_TTL = 300
+
+# Shared read-only default for missing result payloads (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+# Language tag after an opening ``` fence (the regex \w, ASCII)
+_FENCE_LANG_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_"
+)
+
+# Gene symbols recognized by the mock responder, matched in one pass
+_GENE_RE = re.compile(r"\b(BRCA1|BRCA2|TP53|EGFR|HER2|KRAS|MYC|AKT|PTEN)\b")
+
+
+# =============================================================================
+# PROMPTS
+# =============================================================================
+# Static instructions come first and never change, dynamic data (query,
+# results) is appended after DYNAMIC_SEPARATOR: Gemini's prompt caching only
+# reuses an identical prefix.
+
+DYNAMIC_SEPARATOR = "\n\n---\n\n"
+
+BRIDGE_SYSTEM_PROMPT = """You are a biomedical search assistant. Analyze the search results and generate optimized cross-modal queries.
+
+The input below gives the user's query (or states there is none, for a modal-only search) and the PHASE 1 RESULTS from the modality search.
+
+Generate a JSON response with:
+
+1. "queries": Object with optimized search queries for each collection:
+   - "articles": query for scientific literature (focus on key concepts)
+   - "experiments": query for experimental datasets (GEO, ArrayExpress)
+   - "proteins": query for protein databases (function, interactions)
+   - "images": query for pathway/cellular images
+   - "structures": query for protein structures (PDB)
+
+2. "filters": Object with biological entities to filter by:
+   - "genes": list of gene names (max 5, from results or inferred)
+   - "diseases": list of diseases (max 3)
+   - "pathways": list of biological pathways (max 3)
+
+3. "alignment": Assess if user text and modality results are about the same topic:
+   - "aligned": Same biological topic/context
+   - "partial": Related but different aspects
+   - "divergent": Unrelated topics (user should be warned)
+
+4. "interpretation": 2-3 sentence summary explaining what was found and the biological relevance.
+
+Return ONLY valid JSON, no markdown or other text."""
+
+DESIGN_SYSTEM_PROMPT = """As a biological research assistant, analyze the search results below and suggest research directions.
+
+Generate a JSON response with:
+- candidates: list of NUMBER OF CANDIDATES objects, each with:
+  - name: entity name (from results)
+  - justification: why this is scientifically relevant (1-2 sentences)
+  - research_suggestion: potential research direction (1 sentence)
+- summary: overall finding summary (2-3 sentences)
+
+Focus on novel connections and research opportunities.
+Return ONLY valid JSON."""
+
+SUMMARY_SYSTEM_PROMPT = """Summarize the biological search results below in 2-3 sentences.
+
+Focus on main findings and biological connections.
+Return ONLY the summary text, no JSON."""
+
+# Full prompt templates: the static prefix is concatenated once at import,
+# each call only formats the dynamic fields (the system prompts hold no braces)
+BRIDGE_TEMPLATE = (
+    BRIDGE_SYSTEM_PROMPT + DYNAMIC_SEPARATOR
+    + "{user_block}\n\nPHASE 1 RESULTS (from modality search):\n{metadata_block}"
+)
+DESIGN_TEMPLATE = (
+    DESIGN_SYSTEM_PROMPT + DYNAMIC_SEPARATOR
+    + "QUERY: {query}\n\nNUMBER OF CANDIDATES: {top_k}\n\nRESULTS:\n{results_text}"
+)
+SUMMARY_TEMPLATE = (
+    SUMMARY_SYSTEM_PROMPT + DYNAMIC_SEPARATOR
+    + "QUERY: {query}\n\nRESULTS OVERVIEW:\n{results_overview}"
+)
+
+
+# =============================================================================
+# SEMANTIC CACHE
+# =============================================================================
+
+class SemanticCache:
+    """
+    Result cache matched by embedding similarity instead of exact key.
+    
+    Paraphrased queries ("BRCA1 function" / "function of BRCA1") embed close
+    together, so a lookup returns the stored result of the most similar key
+    if its cosine similarity reaches the threshold. Keys live in a fixed
+    (max_size, dim) ring buffer: one matrix-vector product per lookup, FIFO
+    eviction once full.
+    
+    With faiss installed, an HNSW inner-product index proposes a few
+    candidate slots instead, and only those are re-scored against the ring
+    buffer (so overwritten slots never produce a false hit). HNSW cannot
+    delete, so the index is rebuilt from the buffer once it holds max_size
+    stale entries.
+    """
+    
+    HNSW_NEIGHBORS = 32
+    HNSW_EF_SEARCH = 16
+    HNSW_CANDIDATES = 4
+    
+    def __init__(self, threshold: float = 0.95, max_size: int = 2000):
+        self.threshold = threshold
+        self.max_size = max_size
+        self._matrix: Optional[np.ndarray] = None
+        self._values: List[Any] = [None] * max_size
+        self._count = 0
+        self._next = 0
+        self._index = None
+        self._index_slots: List[int] = []  # faiss label -> ring slot
+        self._lock = threading.Lock()
+    
+    def get(self, vector: np.ndarray) -> Optional[Any]:
+        """Most similar stored value, or None below the threshold."""
+        with self._lock:
+            if self._count == 0 or vector.shape[0] != self._matrix.shape[1]:
+                return None
+            if self._index is not None:
+                _, labels = self._index.search(
+                    vector.reshape(1, -1).astype(np.float32), self.HNSW_CANDIDATES
+                )
+                slots = np.unique([self._index_slots[i] for i in labels[0] if i >= 0])
+                if slots.size == 0:
+                    return None
+                sims = self._matrix[slots] @ vector
+                pos = int(np.argmax(sims))
+                best = int(slots[pos])
+                best_sim = sims[pos]
+            else:
+                sims = self._matrix[: self._count] @ vector
+                best = int(np.argmax(sims))
+                best_sim = sims[best]
+            if best_sim < self.threshold:
+                return None
+            return copy.deepcopy(self._values[best])
+    
+    def _new_index(self, dim: int):
+        index = faiss.IndexHNSWFlat(dim, self.HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efSearch = self.HNSW_EF_SEARCH
+        return index
+    
+    def _index_add(self, slot: int) -> None:
+        if len(self._index_slots) >= 2 * self.max_size:
+            # max_size labels point at overwritten slots: rebuild from the buffer
+            self._index = self._new_index(self._matrix.shape[1])
+            self._index.add(self._matrix[: self._count])
+            self._index_slots = list(range(self._count))
+            return
+        self._index.add(self._matrix[slot : slot + 1])
+        self._index_slots.append(slot)
+    
+    def set(self, vector: np.ndarray, value: Any) -> None:
+        """Store value under a unit-norm key vector (evicts the oldest when full)."""
+        with self._lock:
+            if self._matrix is None or vector.shape[0] != self._matrix.shape[1]:
+                self._matrix = np.zeros((self.max_size, vector.shape[0]), dtype=np.float32)
+                self._count = 0
+                self._next = 0
+                self._index = self._new_index(vector.shape[0]) if faiss is not None else None
+                self._index_slots = []
+            slot = self._next
+            self._matrix[slot] = vector
+            self._values[slot] = copy.deepcopy(value)
+            self._next = (slot + 1) % self.max_size
+            self._count = min(self._count + 1, self.max_size)
+            if self._index is not None:
+                self._index_add(slot)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._matrix = None
+            self._values = [None] * self.max_size
+            self._count = 0
+            self._next = 0
+            self._index = None
+            self._index_slots = []
+
 
 class GeminiClient:
     """Client for Gemini LLM with Bridge and Design Assistant"""
     
     _instance = None
+    _lock = threading.Lock()
     
     def __new__(cls):
+        # Double-checked locking: concurrent first calls build one instance
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialized = False
+                    cls._instance = instance
         return cls._instance
     
     def __init__(self):
         if self._initialized:
             return
-        
+        with GeminiClient._lock:
+            if self._initialized:
+                return
+            self._setup()
+    
+    def _setup(self) -> None:
+        """Initialize the Gemini SDK client once (caller holds _lock)."""
         self.model = None
+        self.model_name = settings.gemini_model
         self.mock_mode = False
         
         if settings.gemini_api_key:
@@ -43,7 +268,6 @@ class GeminiClient:
                 try:
                     from google import genai
                     self.client = genai.Client(api_key=settings.gemini_api_key)
-                    self.model_name = settings.gemini_model
                     self.use_new_api = True
                     logger.info(f"✅ Gemini client initialized (new API), model: {self.model_name}")
                 except ImportError:
@@ -60,26 +284,212 @@ class GeminiClient:
             logger.warning("⚠️ No Gemini API key provided. Using mock mode.")
             self.mock_mode = True
         
+        # Per-method semantic caches (only used with semantic_cache_enabled)
+        self._sem_caches = {
+            name: SemanticCache(threshold=settings.semantic_cache_threshold)
+            for name in ("bridge", "design", "summary")
+        }
+        
+        # Negative cache: prompt hash -> True for unparseable JSON replies
+        self._bad_json = LRUCache(max_size=1000, default_ttl=BAD_JSON_TTL)
+        
         self._initialized = True
     
     async def generate(self, prompt: str) -> str:
-        """Generate response from Gemini"""
+        """Generate response from Gemini (exact-prompt cached per model)"""
         if self.mock_mode:
             return self._mock_response(prompt)
         
+        cache = get_cache()
+        prompt_hash = hash_content(f"{self.model_name}|{prompt}")
+        cached = cache.get_llm(prompt_hash)
+        if cached is not None:
+            return cached
+        
         try:
             if self.use_new_api:
-                response = self.client.models.generate_content(
+                # google-genai has a native asyncio client: no thread hop
+                response = await self.client.aio.models.generate_content(
                     model=self.model_name,
                     contents=prompt,
                 )
-                return response.text
             else:
-                response = self.model.generate_content(prompt)
-                return response.text
+                # google.generativeai blocks: run it in a worker thread so
+                # concurrent generate() calls don't stall the event loop
+                response = await asyncio.to_thread(self.model.generate_content, prompt)
+            text = response.text
         except Exception as e:
             logger.error(f"Gemini generation error: {e}")
             return self._mock_response(prompt)
+        
+        # Only real responses are cached; errors fall through to the mock
+        cache.set_llm(prompt_hash, text)
+        return text
+    
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Yield the Gemini response chunk by chunk (same exact-prompt cache as
+        generate()). Closing the iterator early abandons the SDK stream, so
+        the remaining tokens are never waited for. Only a fully received
+        response is cached; SDK errors are logged and re-raised.
+        """
+        if self.mock_mode:
+            yield self._mock_response(prompt)
+            return
+        
+        cache = get_cache()
+        prompt_hash = hash_content(f"{self.model_name}|{prompt}")
+        cached = cache.get_llm(prompt_hash)
+        if cached is not None:
+            yield cached
+            return
+        
+        parts: List[str] = []
+        try:
+            async for chunk in self._sdk_stream(prompt):
+                text = chunk.text or ""
+                if text:
+                    parts.append(text)
+                    yield text
+        except Exception as e:
+            logger.error(f"Gemini streaming error: {e}")
+            raise
+        
+        cache.set_llm(prompt_hash, "".join(parts))
+    
+    async def _sdk_stream(self, prompt: str) -> AsyncIterator[Any]:
+        """Raw SDK response chunks, without blocking the event loop"""
+        if self.use_new_api:
+            stream = await self.client.aio.models.generate_content_stream(
+                model=self.model_name,
+                contents=prompt,
+            )
+            async for chunk in stream:
+                yield chunk
+            return
+        
+        stream = await asyncio.to_thread(self.model.generate_content, prompt, stream=True)
+        chunks = iter(stream)
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+    
+    async def generate_json_text(self, prompt: str) -> str:
+        """
+        Stream a JSON reply and stop as soon as its top-level object closes,
+        instead of waiting for any trailing text. Returns the text received
+        up to that point (the whole reply when no complete object is seen);
+        falls back to the mock response on errors, like generate().
+        """
+        parts: List[str] = []
+        depth = 0
+        started = in_string = escaped = False
+        stream = self.generate_stream(prompt)
+        try:
+            async for chunk in stream:
+                for end, ch in enumerate(chunk, 1):
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif ch == "\\":
+                            escaped = True
+                        elif ch == '"':
+                            in_string = False
+                    elif ch == '"':
+                        in_string = True
+                    elif ch == "{":
+                        depth += 1
+                        started = True
+                    elif ch == "}" and started:
+                        depth -= 1
+                        if depth == 0:
+                            break
+                if started and depth == 0:
+                    parts.append(chunk[:end])
+                    break
+                parts.append(chunk)
+            else:
+                return "".join(parts)
+        except Exception:
+            return self._mock_response(prompt)
+        finally:
+            await stream.aclose()
+        
+        # Stopped early: generate_stream() did not see the end, cache here
+        text = "".join(parts)
+        if not self.mock_mode:
+            get_cache().set_llm(hash_content(f"{self.model_name}|{prompt}"), text)
+        return text
+    
+    def _forget_bad_reply(self, prompt: str, bad_key: str) -> None:
+        """
+        Unparseable JSON reply: evict it from the exact-prompt cache (so the
+        call after BAD_JSON_TTL really retries the LLM) and mark the prompt
+        in the negative cache until then.
+        """
+        get_cache().delete_llm(hash_content(f"{self.model_name}|{prompt}"))
+        self._bad_json.set(bad_key, True)
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Drop cached LLM responses (exact and semantic) and the invalid-JSON
+        negative cache, so prompts marked bad are retried right away.
+        """
+        get_cache().llm.clear()
+        if cls._instance is not None and cls._instance._initialized:
+            for sem_cache in cls._instance._sem_caches.values():
+                sem_cache.clear()
+            cls._instance._bad_json.clear()
+    
+    async def _semantic_lookup(self, name: str, key: str):
+        """
+        Returns (cached_result, key_vector). Both are None when the semantic
+        cache is disabled or the key cannot be embedded; on a miss only the
+        vector is set, to be passed back to _semantic_store.
+        """
+        if not settings.semantic_cache_enabled or self.mock_mode:
+            return None, None
+        
+        try:
+            from app.core.encoders import TextEncoder
+            
+            vector = (await asyncio.to_thread(TextEncoder().encode, key))[0]
+            vector = vector / (np.linalg.norm(vector) + 1e-12)
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None, None
+        
+        cached = self._sem_caches[name].get(vector)
+        if cached is not None:
+            logger.info(f"🧠 Semantic cache hit ({name})")
+        return cached, vector
+    
+    def _semantic_store(self, name: str, vector: Optional[np.ndarray], result: Any) -> None:
+        if vector is not None:
+            self._sem_caches[name].set(vector, result)
+    
+    @staticmethod
+    def _strip_code_fence(text: str) -> str:
+        """
+        Remove a surrounding ```lang ... ``` markdown fence (plain slicing,
+        same result as stripping ^```\w*\n? and \n?```$).
+        """
+        if text.startswith("```"):
+            i = 3
+            n = len(text)
+            while i < n and text[i] in _FENCE_LANG_CHARS:
+                i += 1
+            if text.startswith("\n", i):
+                i += 1
+            text = text[i:]
+            if text.endswith("```"):
+                text = text[:-3]
+                if text.endswith("\n"):
+                    text = text[:-1]
+        return text
     
     def _mock_response(self, prompt: str) -> str:
         """Generate mock response - uses actual user query when available"""
@@ -96,12 +506,8 @@ class GeminiClient:
             except:
                 pass
         
-        # Extract gene names from prompt or metadata
-        extracted_genes = []
-        gene_patterns = ["BRCA1", "BRCA2", "TP53", "EGFR", "HER2", "KRAS", "MYC", "AKT", "PTEN"]
-        for gene in gene_patterns:
-            if gene in prompt:
-                extracted_genes.append(gene)
+        # Extract gene names from prompt or metadata (first-seen order, deduped)
+        extracted_genes = list(dict.fromkeys(_GENE_RE.findall(prompt)))
         
         # Bridge cross-modal - use actual user query!
         if "bridge" in prompt_lower or "cross-modal" in prompt_lower or "generate" in prompt_lower:
@@ -123,7 +529,7 @@ class GeminiClient:
                 if user_query.isupper() and len(user_query) <= 10:
                     genes = [user_query]
             
-            return json.dumps({
+            return _json_dumps({
                 "queries": queries,
                 "filters": {
                     "genes": genes,
@@ -136,7 +542,7 @@ class GeminiClient:
         
         # Design candidates
         if "design" in prompt_lower or "candidate" in prompt_lower:
-            return json.dumps({
+            return _json_dumps({
                 "candidates": [
                     {
                         "name": "Related Protein 1",
@@ -161,7 +567,7 @@ class GeminiClient:
         if "summary" in prompt_lower or "summarize" in prompt_lower:
             return f"Search results identified entities related to {user_query or 'the query'}."
         
-        return json.dumps({"response": "Mock response generated"})
+        return _json_dumps({"response": "Mock response generated"})
     
     # =========================================================================
     # BRIDGE CROSS-MODAL (Architecture v3.0)
@@ -187,8 +593,15 @@ class GeminiClient:
             "interpretation": "Summary text..."
         }
         """
+        sem_key = (user_text or "") + "|" + ",".join(
+            sorted(str(item.get("name", "")) for item in modality_metadata[:5])
+        )
+        cached, sem_vector = await self._semantic_lookup("bridge", sem_key)
+        if cached is not None:
+            return cached
+        
         # Format metadata for prompt
-        metadata_str = ""
+        parts: List[str] = []
         for i, item in enumerate(modality_metadata[:5]):
             name = item.get("name", "Unknown")
             score = item.get("score", 0)
@@ -196,85 +609,79 @@ class GeminiClient:
             diseases = item.get("diseases", [])
             func = item.get("function", item.get("abstract", item.get("description", "")))
             
-            metadata_str += f"{i+1}. {name} (score: {score:.3f})\n"
+            parts.append(f"{i+1}. {name} (score: {score:.3f})")
             if genes:
-                metadata_str += f"   Genes: {', '.join(genes[:5])}\n"
+                parts.append(f"   Genes: {', '.join(genes[:5])}")
             if diseases:
-                metadata_str += f"   Diseases: {', '.join(diseases[:3])}\n"
+                parts.append(f"   Diseases: {', '.join(diseases[:3])}")
             if func:
-                metadata_str += f"   Info: {func[:150]}...\n"
+                parts.append(f"   Info: {func[:150]}...")
+        metadata_str = "\n".join(parts)
         
-        # Build prompt
-        prompt = f"""You are a biomedical search assistant. Analyze the search results and generate optimized cross-modal queries.
-
-{"USER QUERY: " + user_text if user_text else "NO USER TEXT (modal-only search)"}
-
-PHASE 1 RESULTS (from modality search):
-{metadata_str if metadata_str else "No results available"}
-
-Generate a JSON response with:
-
-1. "queries": Object with optimized search queries for each collection:
-   - "articles": query for scientific literature (focus on key concepts)
-   - "experiments": query for experimental datasets (GEO, ArrayExpress)
-   - "proteins": query for protein databases (function, interactions)
-   - "images": query for pathway/cellular images
-   - "structures": query for protein structures (PDB)
-
-2. "filters": Object with biological entities to filter by:
-   - "genes": list of gene names (max 5, from results or inferred)
-   - "diseases": list of diseases (max 3)
-   - "pathways": list of biological pathways (max 3)
-
-3. "alignment": Assess if user text and modality results are about the same topic:
-   - "aligned": Same biological topic/context
-   - "partial": Related but different aspects
-   - "divergent": Unrelated topics (user should be warned)
-
-4. "interpretation": 2-3 sentence summary explaining what was found and the biological relevance.
-
-Return ONLY valid JSON, no markdown or other text."""
+        # Build prompt (static instructions first, see BRIDGE_TEMPLATE)
+        prompt = BRIDGE_TEMPLATE.format(
+            user_block=f"USER QUERY: {user_text}" if user_text else "NO USER TEXT (modal-only search)",
+            metadata_block=metadata_str or "No results available",
+        )
+        
+        bad_key = hash_content(prompt)
+        if self._bad_json.get(bad_key):
+            logger.info("Bridge prompt recently returned invalid JSON, using fallback")
+            return self._bridge_fallback(user_text, modality_metadata)
 
-        response = await self.generate(prompt)
+        response = await self.generate_json_text(prompt)
         
         try:
             # Clean response
             response = response.strip()
-            if response.startswith("```"):
-                response = re.sub(r'^```\w*\n?', '', response)
-                response = re.sub(r'\n?```$', '', response)
+            response = self._strip_code_fence(response)
             
-            result = json.loads(response)
+            result = _json_loads(response)
             
             # Validate and return
-            return {
+            bridge = {
                 "queries": result.get("queries", {}),
                 "filters": result.get("filters", {"genes": [], "diseases": [], "pathways": []}),
                 "alignment": result.get("alignment", "aligned"),
                 "interpretation": result.get("interpretation", "Results found for the given modality."),
             }
+            self._semantic_store("bridge", sem_vector, bridge)
+            return bridge
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse Bridge response: {e}")
             logger.warning(f"Response was: {response[:200]}")
-            
-            # Extract genes from metadata as fallback
-            fallback_genes = []
-            for item in modality_metadata:
-                fallback_genes.extend(item.get("genes", []))
-            fallback_genes = list(set(fallback_genes))[:5]
-            
-            return {
-                "queries": {
-                    "articles": user_text or "protein function",
-                    "experiments": user_text or "gene expression",
-                    "proteins": user_text or "protein structure",
-                    "images": user_text or "pathway diagram",
-                    "structures": user_text or "protein 3D structure",
-                },
-                "filters": {"genes": fallback_genes, "diseases": [], "pathways": []},
-                "alignment": "aligned",
-                "interpretation": "Search results found.",
-            }
+            self._forget_bad_reply(prompt, bad_key)
+            return self._bridge_fallback(user_text, modality_metadata)
+    
+    @staticmethod
+    def _bridge_fallback(
+        user_text: Optional[str],
+        modality_metadata: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Bridge output built without the LLM (unparseable reply)"""
+        # First 5 distinct metadata genes (first-seen order)
+        seen: Dict[str, None] = {}
+        for item in modality_metadata:
+            for gene in item.get("genes") or ():
+                seen[gene] = None
+                if len(seen) == 5:
+                    break
+            if len(seen) == 5:
+                break
+        fallback_genes = list(seen)
+        
+        return {
+            "queries": {
+                "articles": user_text or "protein function",
+                "experiments": user_text or "gene expression",
+                "proteins": user_text or "protein structure",
+                "images": user_text or "pathway diagram",
+                "structures": user_text or "protein 3D structure",
+            },
+            "filters": {"genes": fallback_genes, "diseases": [], "pathways": []},
+            "alignment": "aligned",
+            "interpretation": "Search results found.",
+        }
     
     # =========================================================================
     # DESIGN ASSISTANT
@@ -287,49 +694,51 @@ Return ONLY valid JSON, no markdown or other text."""
         top_k: int = 3,
     ) -> Dict[str, Any]:
         """Generate design candidates with justifications"""
-        results_text = ""
+        result_lines: List[str] = []
         for i, r in enumerate(results[:10]):
-            name = r.get("name") or r.get("payload", {}).get("protein_name") or r.get("payload", {}).get("title", "Unknown")
+            payload = r.get("payload") or _EMPTY
+            name = r.get("name") or payload.get("protein_name") or payload.get("title") or "Unknown"
             score = r.get("score", 0)
             coll = r.get("collection", "unknown")
-            results_text += f"{i+1}. [{coll}] {name} (score: {score:.3f})\n"
+            result_lines.append(f"{i+1}. [{coll}] {name} (score: {score:.3f})")
+        results_text = "\n".join(result_lines)
         
-        prompt = f"""As a biological research assistant, analyze these search results and suggest research directions.
-
-QUERY: {query}
-
-RESULTS:
-{results_text}
-
-Generate a JSON response with:
-- candidates: list of {top_k} objects, each with:
-  - name: entity name (from results)
-  - justification: why this is scientifically relevant (1-2 sentences)
-  - research_suggestion: potential research direction (1 sentence)
-- summary: overall finding summary (2-3 sentences)
-
-Focus on novel connections and research opportunities.
-Return ONLY valid JSON."""
+        sem_key = f"{query}|{top_k}|{results_text}"
+        cached, sem_vector = await self._semantic_lookup("design", sem_key)
+        if cached is not None:
+            return cached
+        
+        prompt = DESIGN_TEMPLATE.format(query=query, top_k=top_k, results_text=results_text)
+        
+        bad_key = hash_content(prompt)
+        if self._bad_json.get(bad_key):
+            logger.info("Design prompt recently returned invalid JSON, using fallback")
+            return self._design_fallback()
 
-        response = await self.generate(prompt)
+        response = await self.generate_json_text(prompt)
         
         try:
             response = response.strip()
-            if response.startswith("```"):
-                response = re.sub(r'^```\w*\n?', '', response)
-                response = re.sub(r'\n?```$', '', response)
+            response = self._strip_code_fence(response)
             
-            result = json.loads(response)
-            return {
+            result = _json_loads(response)
+            design = {
                 "candidates": result.get("candidates", []),
                 "summary": result.get("summary", ""),
             }
+            self._semantic_store("design", sem_vector, design)
+            return design
         except json.JSONDecodeError:
             logger.warning(f"Failed to parse Design response")
-            return {
-                "candidates": [],
-                "summary": "Results analyzed.",
-            }
+            self._forget_bad_reply(prompt, bad_key)
+            return self._design_fallback()
+    
+    @staticmethod
+    def _design_fallback() -> Dict[str, Any]:
+        return {
+            "candidates": [],
+            "summary": "Results analyzed.",
+        }
     
     # =========================================================================
     # SUMMARY GENERATION
@@ -341,37 +750,57 @@ Return ONLY valid JSON."""
         results: Dict[str, List[Dict[str, Any]]],
     ) -> str:
         """Generate summary of search results"""
+        results_overview = self._results_overview(results)
+        
+        cached, sem_vector = await self._semantic_lookup(
+            "summary", f"{query}|{results_overview}"
+        )
+        if cached is not None:
+            return cached
+        
+        response = await self.generate(self._summary_prompt(query, results_overview))
+        
+        response = response.strip()
+        if response.startswith('"') and response.endswith('"'):
+            response = response[1:-1]
+        
+        self._semantic_store("summary", sem_vector, response)
+        return response
+    
+    async def generate_summary_stream(
+        self,
+        query: str,
+        results: Dict[str, List[Dict[str, Any]]],
+    ) -> AsyncIterator[str]:
+        """Stream the summary text as it is generated (no semantic cache)."""
+        results_overview = self._results_overview(results)
+        stream = self.generate_stream(self._summary_prompt(query, results_overview))
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
+    
+    @staticmethod
+    def _summary_prompt(query: str, results_overview: str) -> str:
+        return SUMMARY_TEMPLATE.format(query=query, results_overview=results_overview)
+    
+    @staticmethod
+    def _results_overview(results: Dict[str, List[Dict[str, Any]]]) -> str:
+        """Top-3 names per collection, one line per collection"""
         overview_parts = []
         for collection, items in results.items():
             if items:
                 names = []
                 for item in items[:3]:
-                    payload = item.get("payload", {})
+                    payload = item.get("payload") or _EMPTY
                     name = payload.get("protein_name") or payload.get("title") or payload.get("caption", "Unknown")
                     if isinstance(name, str):
                         names.append(name[:30])
                 if names:
                     overview_parts.append(f"{collection}: {', '.join(names)}")
         
-        results_overview = "\n".join(overview_parts)
-        
-        prompt = f"""Summarize these biological search results in 2-3 sentences.
-
-QUERY: {query}
-
-RESULTS OVERVIEW:
-{results_overview}
-
-Focus on main findings and biological connections.
-Return ONLY the summary text, no JSON."""
-
-        response = await self.generate(prompt)
-        
-        response = response.strip()
-        if response.startswith('"') and response.endswith('"'):
-            response = response[1:-1]
-        
-        return response
+        return "\n".join(overview_parts)
 
 
 # Singleton accessor
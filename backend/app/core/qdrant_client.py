@@ -12,13 +12,23 @@ SEARCH METHODS:
 2. sparse_search()      - Sparse vector only (BM25-style keyword matching)
 3. hybrid_search()      - Dense + Sparse with RRF fusion ← KEY METHOD!
 4. multi_modal_search() - Multiple vectors with weighted fusion
+
+The search methods are coroutines backed by AsyncQdrantClient, so callers
+can fan out over collections with asyncio.gather. Collection management and
+indexing stay on the synchronous client.
 """
 
+import asyncio
 import logging
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from functools import lru_cache
 
-from qdrant_client import QdrantClient, models
+import numpy as np
+
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
 from qdrant_client.http.models import (
     Distance,
     VectorParams,
@@ -35,45 +45,90 @@ from qdrant_client.http.models import (
     SparseVector,
 )
 
-from app.config import get_settings, COLLECTION_CONFIGS
+from app.config import (
+    get_settings,
+    COLLECTION_CONFIGS,
+    PAYLOAD_INDEX_SCHEMAS,
+    MEMMAP_THRESHOLD_KB,
+)
+from app.core.cache import get_cache, hash_search
+from app.models.schemas import get_id_from_document
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Search quantized vectors, then rescore the top 2x candidates with the
+# original vectors so recall stays close to the unquantized index.
+QUANTIZED_SEARCH_PARAMS = models.SearchParams(
+    quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+GRPC_MAX_MESSAGE = 32 << 20  # 32 MB
+
+# On-disk sparse indexes: below this many matching points, score by
+# plain scan instead of touching the inverted index
+SPARSE_FULL_SCAN_THRESHOLD = 5000
+
+# Hybrid prefetch: candidates fetched per branch (x top_k) before fusion,
+# and the HNSW beam width for the dense branch
+DENSE_PREFETCH_OVERSAMPLE = 3
+SPARSE_PREFETCH_OVERSAMPLE = 3
+HYBRID_HNSW_EF = 64
+
+# Identical searches within one request flow (Phase 1/3 overlap, filter
+# retries, Bridge re-runs) reuse the formatted results for a few seconds
+SEARCH_CACHE_TTL = 30
+
+# Upserts are split into batches sent by a few worker threads
+UPSERT_BATCH_SIZE = 256
+UPSERT_PARALLEL = 4
+
 
 class QdrantManager:
     """
     Manager class for Qdrant operations with REAL hybrid search.
-    """
 
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    Construct through get_qdrant() only, which owns the process-wide instance.
+    """
 
     def __init__(self):
-        if self._initialized:
-            return
-
         try:
-            self.client = QdrantClient(
-                host=settings.qdrant_host,
-                port=settings.qdrant_port,
-                api_key=settings.qdrant_api_key if settings.qdrant_api_key else None,
-            )
-            self.client.get_collections()
-            logger.info(
-                f"✅ Connected to Qdrant at {settings.qdrant_host}:{settings.qdrant_port}"
-            )
+            try:
+                self._connect(prefer_grpc=settings.qdrant_prefer_grpc)
+            except Exception as e:
+                if not settings.qdrant_prefer_grpc:
+                    raise
+                logger.warning(f"⚠️ Qdrant gRPC failed ({e}), retrying over REST")
+                self._connect(prefer_grpc=False)
         except Exception as e:
             logger.warning(f"⚠️ Remote Qdrant failed ({e}), using in-memory mode")
             self.client = QdrantClient(":memory:")
+            # A second in-memory client would be a separate, empty store:
+            # searches go through the sync client in a worker thread instead
+            self.aclient = None
             logger.info("✅ Using in-memory Qdrant")
 
-        self._initialized = True
+    def _connect(self, prefer_grpc: bool) -> None:
+        """Open the sync and async clients (raises if Qdrant is unreachable)."""
+        params = dict(
+            host=settings.qdrant_host,
+            port=settings.qdrant_port,
+            grpc_port=settings.qdrant_grpc_port,
+            prefer_grpc=prefer_grpc,
+            api_key=settings.qdrant_api_key if settings.qdrant_api_key else None,
+        )
+        if prefer_grpc:
+            # Binary protobuf over HTTP/2; allow large batch/upsert messages
+            params["grpc_options"] = {"grpc.max_send_message_length": GRPC_MAX_MESSAGE}
+
+        self.client = QdrantClient(**params)
+        self.client.get_collections()
+        self.aclient = AsyncQdrantClient(**params)
+        logger.info(
+            f"✅ Connected to Qdrant at {settings.qdrant_host}:"
+            f"{settings.qdrant_grpc_port if prefer_grpc else settings.qdrant_port}"
+            f" ({'gRPC' if prefer_grpc else 'REST'})"
+        )
 
     # ════════════════════════════════════════════════════════════════════════════
     # COLLECTION MANAGEMENT
@@ -97,16 +152,27 @@ class QdrantManager:
 
             # Dense vectors
             vectors_config = {}
+            vector_quantization = config.get("vector_quantization", {})
             for vec_name, dim in config.get("vectors", {}).items():
                 vectors_config[vec_name] = VectorParams(
-                    size=dim, distance=Distance.COSINE
+                    size=dim,
+                    distance=Distance.COSINE,
+                    quantization_config=self._build_quantization(
+                        vector_quantization.get(vec_name)
+                    ),
                 )
 
             # Sparse vectors (for BM25-style keyword search)
+            sparse_on_disk = config.get("sparse_on_disk", False)
             sparse_vectors_config = {}
             for sparse_name in config.get("sparse_vectors", []):
                 sparse_vectors_config[sparse_name] = SparseVectorParams(
-                    index=SparseIndexParams(on_disk=False)
+                    index=SparseIndexParams(
+                        on_disk=sparse_on_disk,
+                        full_scan_threshold=(
+                            SPARSE_FULL_SCAN_THRESHOLD if sparse_on_disk else None
+                        ),
+                    )
                 )
 
             self.client.create_collection(
@@ -115,26 +181,92 @@ class QdrantManager:
                 sparse_vectors_config=(
                     sparse_vectors_config if sparse_vectors_config else None
                 ),
+                quantization_config=self._build_quantization(
+                    config.get("quantization")
+                ),
+                optimizers_config=models.OptimizersConfigDiff(
+                    memmap_threshold=config.get("memmap_threshold", MEMMAP_THRESHOLD_KB)
+                ),
             )
 
+            self._create_payload_indexes(name, config.get("payload_indexes", []))
+
             logger.info(f"✅ Created collection: {name}")
             logger.info(f"   ├─ Dense vectors: {list(vectors_config.keys())}")
-            logger.info(f"   └─ Sparse vectors: {list(sparse_vectors_config.keys())}")
+            logger.info(
+                f"   ├─ Sparse vectors: {list(sparse_vectors_config.keys())}"
+                f"{' (on disk)' if sparse_on_disk else ''}"
+            )
+            logger.info(f"   ├─ Payload indexes: {config.get('payload_indexes', [])}")
+            logger.info(f"   └─ Quantization: {config.get('quantization')}"
+                        f" (per-vector: {vector_quantization or '-'})")
             return True
 
         except Exception as e:
             logger.error(f"❌ Error creating collection {name}: {e}")
             return False
 
+    def _create_payload_indexes(self, collection: str, fields: List[str]) -> None:
+        """
+        Index filterable payload fields.
+
+        Filters on indexed fields (e.g. MatchAny on normalized_bridge.genes)
+        use Qdrant's filterable-HNSW path instead of scanning payloads.
+        """
+        for field in fields:
+            try:
+                self.client.create_payload_index(
+                    collection_name=collection,
+                    field_name=field,
+                    field_schema=models.PayloadSchemaType(
+                        PAYLOAD_INDEX_SCHEMAS.get(field, "keyword")
+                    ),
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Payload index {collection}.{field} failed: {e}")
+
+    def _build_quantization(
+        self, quantization: Optional[Dict[str, Any]]
+    ) -> Optional[models.QuantizationConfig]:
+        """Build Qdrant quantization config from COLLECTION_CONFIGS entry."""
+        if not quantization:
+            return None
+
+        if quantization.get("type") == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(
+                    always_ram=quantization.get("always_ram", True),
+                )
+            )
+
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=quantization.get("quantile", 0.99),
+                always_ram=quantization.get("always_ram", True),
+            )
+        )
+
     def create_all_collections(self, recreate: bool = False):
         """Create all configured collections."""
         for name, config in COLLECTION_CONFIGS.items():
             self.create_collection(name, config, recreate)
 
-    def upsert_points(self, collection: str, points: List[Dict[str, Any]]) -> int:
+    def upsert_points(
+        self,
+        collection: str,
+        points: List[Dict[str, Any]],
+        batch_size: int = UPSERT_BATCH_SIZE,
+        parallel: int = UPSERT_PARALLEL,
+        wait: bool = True,
+    ) -> int:
         """
         Upsert points with BOTH dense and sparse vectors.
 
+        Points are sent in batches of batch_size by up to `parallel` threads.
+        wait=False returns once Qdrant has accepted each batch, without
+        waiting for it to be applied (bulk loads).
+
         Point format:
         {
             "vectors": {
@@ -144,91 +276,188 @@ class QdrantManager:
             "payload": {...}
         }
         """
-        from app.models.schemas import get_id_from_document
-
         try:
-            qdrant_points = []
-
-            for point in points:
-                point_id = get_id_from_document(collection, point.get("payload", {}))
-
-                # Separate dense and sparse vectors
-                all_vectors = {}
-
-                for vec_name, vec_data in point.get("vectors", {}).items():
-                    if isinstance(vec_data, dict) and "indices" in vec_data:
-                        # Sparse vector
-                        if vec_data.get("indices") and vec_data.get("values"):
-                            all_vectors[vec_name] = SparseVector(
-                                indices=vec_data["indices"],
-                                values=vec_data["values"],
-                            )
-                    elif isinstance(vec_data, list) and len(vec_data) > 0:
-                        # Dense vector
-                        all_vectors[vec_name] = vec_data
-
-                qdrant_points.append(
-                    PointStruct(
-                        id=point_id,
-                        vector=all_vectors,
-                        payload=point.get("payload", {}),
-                    )
+            # Vector schema is fixed per collection: classify names once
+            config = COLLECTION_CONFIGS.get(collection, {})
+            dense_names = set(config.get("vectors", {}))
+            sparse_names = set(config.get("sparse_vectors", []))
+
+            qdrant_points = [
+                PointStruct(
+                    id=get_id_from_document(collection, point.get("payload", {})),
+                    vector=_point_vectors(
+                        point.get("vectors", {}), dense_names, sparse_names
+                    ),
+                    payload=point.get("payload", {}),
                 )
+                for point in points
+            ]
 
-            self.client.upsert(collection_name=collection, points=qdrant_points)
-            logger.info(f"📥 Upserted {len(qdrant_points)} points to {collection}")
+            batches = [
+                qdrant_points[i : i + batch_size]
+                for i in range(0, len(qdrant_points), batch_size)
+            ]
+
+            def send(batch: List[PointStruct]) -> None:
+                self.client.upsert(collection_name=collection, points=batch, wait=wait)
+
+            # The in-memory client is not meant for concurrent writers
+            workers = min(parallel, len(batches)) if self.aclient is not None else 1
+            if workers <= 1:
+                for batch in batches:
+                    send(batch)
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(send, batches))
+
+            logger.info(
+                f"📥 Upserted {len(qdrant_points)} points to {collection} "
+                f"({len(batches)} batches)"
+            )
             return len(qdrant_points)
 
         except Exception as e:
             logger.error(f"❌ Error upserting to {collection}: {e}")
-            import traceback
-
             logger.error(traceback.format_exc())
             return 0
 
+    def bulk_upsert(self, collection: str, points: List[Dict[str, Any]]) -> int:
+        """
+        Upsert for initial loads: HNSW indexing is paused while the batches
+        are written (wait=False), then the previous threshold is restored so
+        the index is built once instead of incrementally.
+        """
+        try:
+            info = self.client.get_collection(collection)
+            threshold = info.config.optimizer_config.indexing_threshold or 20000
+            self.client.update_collection(
+                collection_name=collection,
+                optimizers_config=models.OptimizersConfigDiff(indexing_threshold=0),
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not pause indexing on {collection}: {e}")
+            return self.upsert_points(collection, points)
+
+        try:
+            return self.upsert_points(collection, points, wait=False)
+        finally:
+            try:
+                self.client.update_collection(
+                    collection_name=collection,
+                    optimizers_config=models.OptimizersConfigDiff(
+                        indexing_threshold=threshold
+                    ),
+                )
+            except Exception as e:
+                logger.error(f"❌ Could not restore indexing on {collection}: {e}")
+
+    async def _query_points(self, **kwargs):
+        """query_points without blocking the event loop."""
+        if self.aclient is not None:
+            return await self.aclient.query_points(**kwargs)
+        return await asyncio.to_thread(self.client.query_points, **kwargs)
+
+    @staticmethod
+    def _cached_search(key: str) -> Optional[List[Dict[str, Any]]]:
+        hit = get_cache().get(f"qs:{key}", "results")
+        # Callers annotate result dicts in place: hand out copies
+        return [dict(r) for r in hit] if hit is not None else None
+
+    @staticmethod
+    def _store_search(key: str, formatted: List[Dict[str, Any]]) -> None:
+        get_cache().set(
+            f"qs:{key}", [dict(r) for r in formatted], "results", ttl=SEARCH_CACHE_TTL
+        )
+
+    async def _query_batch_points(self, **kwargs):
+        """query_batch_points without blocking the event loop."""
+        if self.aclient is not None:
+            return await self.aclient.query_batch_points(**kwargs)
+        return await asyncio.to_thread(self.client.query_batch_points, **kwargs)
+
+    async def _search(
+        self,
+        collection: str,
+        query: Any,
+        *,
+        using: Optional[str] = None,
+        prefetch: Optional[List[Prefetch]] = None,
+        top_k: int = 10,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        payload_fields: Optional[List[str]] = None,
+        search_params: Optional[models.SearchParams] = None,
+        cache_key: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Single query_points path behind every search method: result cache
+        (when cache_key is given), filter, payload projection, formatting.
+
+        Raises on Qdrant errors; each public method owns its fallback.
+        """
+        if cache_key is not None:
+            cached = self._cached_search(cache_key)
+            if cached is not None:
+                return cached
+
+        results = await self._query_points(
+            collection_name=collection,
+            query=query,
+            using=using,
+            prefetch=prefetch,
+            limit=top_k,
+            query_filter=self._build_filter(filter_dict) if filter_dict else None,
+            search_params=search_params,
+            with_payload=payload_fields or True,
+        )
+        formatted = _fmt(results.points)
+
+        logger.debug("   └─ %s: %d results", collection, len(formatted))
+        if cache_key is not None:
+            self._store_search(cache_key, formatted)
+        return formatted
+
     # ════════════════════════════════════════════════════════════════════════════
     # 1. VECTOR SEARCH (Dense only)
     # ════════════════════════════════════════════════════════════════════════════
 
-    def vector_search(
+    async def vector_search(
         self,
         collection: str,
         vector: List[float],
         vector_name: str = "text",
         top_k: int = 10,
         filter_dict: Optional[Dict[str, Any]] = None,
+        payload_fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Simple dense vector search.
 
         Use when: Text-only queries, single modality.
+        payload_fields: only return these payload keys (default: full payload).
         """
         try:
-            query_filter = self._build_filter(filter_dict) if filter_dict else None
-
-            logger.debug(f"🔍 VECTOR_SEARCH: {collection}/{vector_name} (k={top_k})")
-
-            results = self.client.query_points(
-                collection_name=collection,
-                query=vector,
+            logger.debug("VECTOR_SEARCH %s/%s k=%d", collection, vector_name, top_k)
+            return await self._search(
+                collection,
+                vector,
                 using=vector_name,
-                limit=top_k,
-                query_filter=query_filter,
-                with_payload=True,
+                top_k=top_k,
+                filter_dict=filter_dict,
+                payload_fields=payload_fields,
+                search_params=QUANTIZED_SEARCH_PARAMS,
+                cache_key=hash_search(
+                    vector,
+                    {
+                        "kind": "vector",
+                        "collection": collection,
+                        "using": vector_name,
+                        "top_k": top_k,
+                        "filter": filter_dict,
+                        "fields": payload_fields,
+                    },
+                ),
             )
 
-            formatted = [
-                {
-                    "id": str(point.id),
-                    "score": point.score if hasattr(point, "score") else 0.0,
-                    "payload": point.payload or {},
-                }
-                for point in results.points
-            ]
-
-            logger.debug(f"   └─ Found {len(formatted)} results")
-            return formatted
-
         except Exception as e:
             logger.error(f"❌ Vector search error ({collection}/{vector_name}): {e}")
             return []
@@ -237,7 +466,7 @@ class QdrantManager:
     # 2. SPARSE SEARCH (BM25-style keyword matching)
     # ════════════════════════════════════════════════════════════════════════════
 
-    def sparse_search(
+    async def sparse_search(
         self,
         collection: str,
         sparse_indices: List[int],
@@ -245,6 +474,7 @@ class QdrantManager:
         sparse_name: str = "text_sparse",
         top_k: int = 10,
         filter_dict: Optional[Dict[str, Any]] = None,
+        payload_fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Sparse vector search (BM25-style keyword matching).
@@ -256,35 +486,18 @@ class QdrantManager:
                 logger.warning("⚠️ Empty sparse vector")
                 return []
 
-            query_filter = self._build_filter(filter_dict) if filter_dict else None
-
             logger.debug(
-                f"🔍 SPARSE_SEARCH: {collection}/{sparse_name} ({len(sparse_indices)} terms)"
+                "SPARSE_SEARCH %s/%s (%d terms)", collection, sparse_name, len(sparse_indices)
             )
-
-            sparse_vector = SparseVector(indices=sparse_indices, values=sparse_values)
-
-            results = self.client.query_points(
-                collection_name=collection,
-                query=sparse_vector,
+            return await self._search(
+                collection,
+                SparseVector(indices=sparse_indices, values=sparse_values),
                 using=sparse_name,
-                limit=top_k,
-                query_filter=query_filter,
-                with_payload=True,
+                top_k=top_k,
+                filter_dict=filter_dict,
+                payload_fields=payload_fields,
             )
 
-            formatted = [
-                {
-                    "id": str(point.id),
-                    "score": point.score if hasattr(point, "score") else 0.0,
-                    "payload": point.payload or {},
-                }
-                for point in results.points
-            ]
-
-            logger.debug(f"   └─ Found {len(formatted)} results")
-            return formatted
-
         except Exception as e:
             logger.error(f"❌ Sparse search error ({collection}/{sparse_name}): {e}")
             return []
@@ -293,7 +506,7 @@ class QdrantManager:
     # 3. HYBRID SEARCH - REAL Implementation with Qdrant Native RRF Fusion
     # ════════════════════════════════════════════════════════════════════════════
 
-    def hybrid_search(
+    async def hybrid_search(
         self,
         collection: str,
         dense_vector: List[float],
@@ -304,6 +517,10 @@ class QdrantManager:
         top_k: int = 10,
         filter_dict: Optional[Dict[str, Any]] = None,
         fusion_method: str = "rrf",
+        payload_fields: Optional[List[str]] = None,
+        dense_oversample: int = DENSE_PREFETCH_OVERSAMPLE,
+        sparse_oversample: int = SPARSE_PREFETCH_OVERSAMPLE,
+        hnsw_ef: Optional[int] = HYBRID_HNSW_EF,
     ) -> List[Dict[str, Any]]:
         """
         ╔═══════════════════════════════════════════════════════════════════════╗
@@ -322,6 +539,10 @@ class QdrantManager:
         ║  • DBSF (Distribution-Based Score Fusion)                             ║
         ║                                                                       ║
         ╚═══════════════════════════════════════════════════════════════════════╝
+
+        Each branch prefetches top_k * <branch>_oversample candidates; the
+        dense branch searches with HNSW ef=hnsw_ef (None = collection default)
+        on quantized vectors with rescoring.
         """
         try:
             # ════════════════════════════════════════════════════════════════
@@ -332,37 +553,41 @@ class QdrantManager:
                 or sparse_values is None
                 or len(sparse_indices) == 0
             ):
-                logger.info(
-                    f"🔍 HYBRID→DENSE: No sparse vector, using dense-only for {collection}"
-                )
-                return self.vector_search(
+                logger.debug("HYBRID->DENSE %s: no sparse vector", collection)
+                return await self.vector_search(
                     collection=collection,
                     vector=dense_vector,
                     vector_name=dense_name,
                     top_k=top_k,
                     filter_dict=filter_dict,
+                    payload_fields=payload_fields,
                 )
 
-            query_filter = self._build_filter(filter_dict) if filter_dict else None
-
-            # ════════════════════════════════════════════════════════════════
-            # LOG HYBRID SEARCH PARAMETERS
-            # ════════════════════════════════════════════════════════════════
-            logger.info(
-                f"╔═══════════════════════════════════════════════════════════════╗"
-            )
-            logger.info(f"║  🔀 HYBRID SEARCH: {collection}")
-            logger.info(
-                f"╠═══════════════════════════════════════════════════════════════╣"
-            )
-            logger.info(f"║  Dense vector: {dense_name} (dim={len(dense_vector)})")
-            logger.info(
-                f"║  Sparse vector: {sparse_name} ({len(sparse_indices)} terms)"
+            cache_key = hash_search(
+                dense_vector,
+                {
+                    "kind": "hybrid",
+                    "collection": collection,
+                    "using": [dense_name, sparse_name],
+                    "sparse": [sparse_indices, sparse_values],
+                    "top_k": top_k,
+                    "filter": filter_dict,
+                    "fusion": fusion_method,
+                    "fields": payload_fields,
+                    "prefetch": [dense_oversample, sparse_oversample, hnsw_ef],
+                },
             )
-            logger.info(f"║  Fusion method: {fusion_method.upper()}")
-            logger.info(f"║  Top-K: {top_k}")
-            logger.info(
-                f"╚═══════════════════════════════════════════════════════════════╝"
+
+            # Hot path: lazy %-args, nothing is formatted unless DEBUG is on
+            logger.debug(
+                "HYBRID %s dense=%s(%d) sparse=%s(%d terms) fusion=%s k=%d",
+                collection,
+                dense_name,
+                len(dense_vector),
+                sparse_name,
+                len(sparse_indices),
+                fusion_method,
+                top_k,
             )
 
             # ════════════════════════════════════════════════════════════════
@@ -371,67 +596,113 @@ class QdrantManager:
 
             sparse_vector = SparseVector(indices=sparse_indices, values=sparse_values)
 
-            results = self.client.query_points(
-                collection_name=collection,
+            formatted = await self._search(
+                collection,
+                FusionQuery(
+                    fusion=Fusion.RRF if fusion_method == "rrf" else Fusion.DBSF,
+                ),
                 prefetch=[
                     # Dense vector prefetch
                     Prefetch(
-                        query=dense_vector,
+                        query=_as_list(dense_vector),
                         using=dense_name,
-                        limit=top_k * 2,
+                        limit=top_k * dense_oversample,
+                        params=models.SearchParams(
+                            hnsw_ef=hnsw_ef,
+                            exact=False,
+                            quantization=QUANTIZED_SEARCH_PARAMS.quantization,
+                        ),
                     ),
-                    # Sparse vector prefetch
+                    # Sparse vector prefetch (HNSW/quantization don't apply)
                     Prefetch(
                         query=sparse_vector,
                         using=sparse_name,
-                        limit=top_k * 2,
+                        limit=top_k * sparse_oversample,
                     ),
                 ],
-                query=FusionQuery(
-                    fusion=Fusion.RRF if fusion_method == "rrf" else Fusion.DBSF,
-                ),
-                limit=top_k,
-                query_filter=query_filter,
-                with_payload=True,
+                top_k=top_k,
+                filter_dict=filter_dict,
+                payload_fields=payload_fields,
+                cache_key=cache_key,
             )
 
-            formatted = [
-                {
-                    "id": str(point.id),
-                    "score": point.score if hasattr(point, "score") else 0.0,
-                    "payload": point.payload or {},
-                }
-                for point in results.points
-            ]
-
-            logger.info(f"   ✅ HYBRID SEARCH: {len(formatted)} results (fused)")
-
-            # Log top 3 results
-            for i, r in enumerate(formatted[:3]):
-                name = (
-                    r["payload"].get("title") or r["payload"].get("protein_name") or "?"
-                )
-                logger.debug(f"      [{i+1}] {name[:40]}... (score: {r['score']:.4f})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("HYBRID %s: %d results (fused)", collection, len(formatted))
+                for i, r in enumerate(formatted[:3]):
+                    name = (
+                        r["payload"].get("title")
+                        or r["payload"].get("protein_name")
+                        or "?"
+                    )
+                    logger.debug("   [%d] %.40s (score: %.4f)", i + 1, name, r["score"])
 
             return formatted
 
         except Exception as e:
             logger.error(f"❌ Hybrid search error ({collection}): {e}")
-            logger.warning(f"   ⚠️ Falling back to dense-only search")
-            return self.vector_search(
-                collection=collection,
-                vector=dense_vector,
-                vector_name=dense_name,
-                top_k=top_k,
-                filter_dict=filter_dict,
+            logger.warning(f"   ⚠️ Falling back to client-side RRF of dense + sparse")
+            dense, sparse = await asyncio.gather(
+                self.vector_search(
+                    collection=collection,
+                    vector=dense_vector,
+                    vector_name=dense_name,
+                    top_k=top_k * 2,
+                    filter_dict=filter_dict,
+                    payload_fields=payload_fields,
+                ),
+                self.sparse_search(
+                    collection=collection,
+                    sparse_indices=sparse_indices,
+                    sparse_values=sparse_values,
+                    sparse_name=sparse_name,
+                    top_k=top_k * 2,
+                    filter_dict=filter_dict,
+                    payload_fields=payload_fields,
+                ),
             )
+            return self._rrf_merge([dense, sparse], top_k=top_k)
+
+    @staticmethod
+    def _rrf_merge(
+        results_lists: List[List[Dict[str, Any]]],
+        top_k: int = 10,
+        k: int = 60,
+        weights: Optional[List[float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Client-side Reciprocal Rank Fusion, for when Qdrant can't fuse:
+        score(d) = sum_i w_i / (k + rank_i(d)), ranks starting at 1.
+
+        Vectorized: ids are aligned across lists with np.unique and the
+        per-list contributions summed with one bincount. Returns the top_k
+        result dicts (first occurrence) with the fused score.
+        """
+        lists = [r for r in results_lists if r]
+        if not lists:
+            return []
+        if weights is None:
+            weights = [1.0] * len(results_lists)
+        weights = [w for w, r in zip(weights, results_lists) if r]
+
+        ids = np.array([r["id"] for results in lists for r in results])
+        ranks = np.concatenate([np.arange(1, len(results) + 1) for results in lists])
+        list_weights = np.repeat(
+            np.asarray(weights, dtype=np.float64), [len(results) for results in lists]
+        )
+
+        _, first, inverse = np.unique(ids, return_index=True, return_inverse=True)
+        scores = np.bincount(inverse, weights=list_weights / (k + ranks))
+        order = np.argsort(-scores, kind="stable")[:top_k]
+
+        flat = [r for results in lists for r in results]
+        return [{**flat[first[i]], "score": float(scores[i])} for i in order]
 
     # ════════════════════════════════════════════════════════════════════════════
     # 4. MULTI-MODAL FUSION SEARCH
     # Combines multiple dense vectors (text, image, structure) with RRF
     # ════════════════════════════════════════════════════════════════════════════
 
-    def multi_modal_search(
+    async def multi_modal_search(
         self,
         collection: str,
         vectors: Dict[str, List[float]],
@@ -439,6 +710,7 @@ class QdrantManager:
         top_k: int = 10,
         filter_dict: Optional[Dict[str, Any]] = None,
         fusion_method: str = "rrf",
+        payload_fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Multi-modal fusion search combining multiple vector types.
@@ -452,23 +724,21 @@ class QdrantManager:
                 logger.warning("⚠️ No vectors provided")
                 return []
 
-            query_filter = self._build_filter(filter_dict) if filter_dict else None
-
-            logger.info(f"🎯 MULTI-MODAL SEARCH: {collection}")
-            logger.info(f"   ├─ Modalities: {list(vectors.keys())}")
-            if sparse_data:
-                logger.info(
-                    f"   ├─ Sparse: {len(sparse_data.get('indices', []))} terms"
-                )
-            logger.info(f"   └─ Fusion: {fusion_method.upper()}")
+            logger.debug(
+                "MULTI-MODAL %s modalities=%s sparse=%d terms fusion=%s",
+                collection,
+                list(vectors),
+                len((sparse_data or {}).get("indices") or ()),
+                fusion_method,
+            )
 
             # Build prefetch queries
             prefetch_queries = []
 
             for vec_name, vector in vectors.items():
-                if vector and len(vector) > 0:
+                if vector is not None and len(vector) > 0:
                     prefetch_queries.append(
-                        Prefetch(query=vector, using=vec_name, limit=top_k * 2)
+                        Prefetch(query=_as_list(vector), using=vec_name, limit=top_k * 2)
                     )
 
             # Add sparse vector if available
@@ -494,60 +764,105 @@ class QdrantManager:
             if len(prefetch_queries) == 1:
                 # Single modality
                 pq = prefetch_queries[0]
-                results = self.client.query_points(
-                    collection_name=collection,
-                    query=pq.query,
+                formatted = await self._search(
+                    collection,
+                    pq.query,
                     using=pq.using,
-                    limit=top_k,
-                    query_filter=query_filter,
-                    with_payload=True,
+                    top_k=top_k,
+                    filter_dict=filter_dict,
+                    payload_fields=payload_fields,
                 )
             else:
                 # Multiple modalities → fusion
-                results = self.client.query_points(
-                    collection_name=collection,
-                    prefetch=prefetch_queries,
-                    query=FusionQuery(
+                formatted = await self._search(
+                    collection,
+                    FusionQuery(
                         fusion=Fusion.RRF if fusion_method == "rrf" else Fusion.DBSF,
                     ),
-                    limit=top_k,
-                    query_filter=query_filter,
-                    with_payload=True,
+                    prefetch=prefetch_queries,
+                    top_k=top_k,
+                    filter_dict=filter_dict,
+                    payload_fields=payload_fields,
                 )
 
-            formatted = [
-                {
-                    "id": str(point.id),
-                    "score": point.score if hasattr(point, "score") else 0.0,
-                    "payload": point.payload or {},
-                }
-                for point in results.points
-            ]
-
-            logger.info(
-                f"   ✅ {len(formatted)} results ({len(prefetch_queries)} modalities fused)"
+            logger.debug(
+                "MULTI-MODAL %s: %d results (%d modalities fused)",
+                collection,
+                len(formatted),
+                len(prefetch_queries),
             )
             return formatted
 
         except Exception as e:
             logger.error(f"❌ Multi-modal search error ({collection}): {e}")
-            # Fallback to first vector
-            if vectors:
-                first_name, first_vec = next(iter(vectors.items()))
-                return self.vector_search(
-                    collection=collection,
-                    vector=first_vec,
-                    vector_name=first_name,
-                    top_k=top_k,
-                    filter_dict=filter_dict,
+            # Fallback: one search per modality, fused client-side
+            per_modality = await asyncio.gather(
+                *(
+                    self.vector_search(
+                        collection=collection,
+                        vector=vector,
+                        vector_name=vec_name,
+                        top_k=top_k * 2,
+                        filter_dict=filter_dict,
+                        payload_fields=payload_fields,
+                    )
+                    for vec_name, vector in vectors.items()
+                    if vector is not None and len(vector) > 0
                 )
+            )
+            return self._rrf_merge(per_modality, top_k=top_k)
+
+    # ════════════════════════════════════════════════════════════════════════════
+    # 5. BATCH SEARCH (several queries, one collection, one round-trip)
+    # ════════════════════════════════════════════════════════════════════════════
+
+    def dense_request(
+        self,
+        vector: List[float],
+        vector_name: str = "text",
+        top_k: int = 10,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        payload_fields: Optional[List[str]] = None,
+    ) -> models.QueryRequest:
+        """QueryRequest equivalent of vector_search() for batch_search()."""
+        return models.QueryRequest(
+            query=_as_list(vector),
+            using=vector_name,
+            limit=top_k,
+            filter=self._build_filter(filter_dict) if filter_dict else None,
+            params=QUANTIZED_SEARCH_PARAMS,
+            with_payload=payload_fields or True,
+        )
+
+    async def batch_search(
+        self, collection: str, requests: List[models.QueryRequest]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several queries against one collection in a single request.
+
+        Qdrant batches are per collection. Returns one result list per
+        request, in order (all empty on error).
+        """
+        if not requests:
             return []
+        try:
+            logger.debug("BATCH_SEARCH %s (%d queries)", collection, len(requests))
+
+            responses = await self._query_batch_points(
+                collection_name=collection, requests=requests
+            )
+
+            return [_fmt(response.points) for response in responses]
+
+        except Exception as e:
+            logger.error(f"❌ Batch search error ({collection}): {e}")
+            return [[] for _ in requests]
 
     # ════════════════════════════════════════════════════════════════════════════
     # LEGACY METHODS (for backward compatibility)
     # ════════════════════════════════════════════════════════════════════════════
 
-    def multi_vector_search(
+    async def multi_vector_search(
         self,
         collection: str,
         vectors: Dict[str, List[float]],
@@ -555,7 +870,7 @@ class QdrantManager:
         filter_dict: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """Legacy method - redirects to multi_modal_search."""
-        return self.multi_modal_search(
+        return await self.multi_modal_search(
             collection=collection,
             vectors=vectors,
             top_k=top_k,
@@ -567,20 +882,18 @@ class QdrantManager:
     # ════════════════════════════════════════════════════════════════════════════
 
     def _build_filter(self, filter_dict: Dict[str, Any]) -> Optional[Filter]:
-        """Build Qdrant filter from dict."""
+        """Build Qdrant filter from dict (memoized; the Filter is shared, don't mutate)."""
         if not filter_dict:
             return None
 
-        conditions = []
-        for field, value in filter_dict.items():
-            if isinstance(value, list):
-                conditions.append(FieldCondition(key=field, match=MatchAny(any=value)))
-            else:
-                conditions.append(
-                    FieldCondition(key=field, match=MatchValue(value=value))
-                )
-
-        return Filter(must=conditions) if conditions else None
+        key = tuple(
+            (field, tuple(value) if isinstance(value, list) else value)
+            for field, value in filter_dict.items()
+        )
+        try:
+            return _build_filter_cached(key)
+        except TypeError:  # unhashable value
+            return _build_filter_uncached(key)
 
     def get_collection_stats(self, collection: str) -> Optional[Dict[str, Any]]:
         """Get collection statistics."""
@@ -633,6 +946,77 @@ class QdrantManager:
             return None
 
 
-@lru_cache()
+def _point_vectors(
+    vectors: Dict[str, Any], dense_names: set, sparse_names: set
+) -> Dict[str, Any]:
+    """
+    Named vectors for one PointStruct: dense as float lists, sparse as
+    SparseVector; empty vectors are dropped. Names outside the collection
+    config are classified by type.
+    """
+    named = {}
+    for name, data in vectors.items():
+        is_sparse = name in sparse_names or (
+            name not in dense_names and isinstance(data, dict) and "indices" in data
+        )
+        if is_sparse:
+            if isinstance(data, dict) and data.get("indices") and data.get("values"):
+                named[name] = SparseVector(indices=data["indices"], values=data["values"])
+        elif isinstance(data, np.ndarray):
+            if data.size:
+                named[name] = data.astype(np.float32, copy=False).ravel().tolist()
+        elif isinstance(data, list) and data:
+            named[name] = data
+    return named
+
+
+def _as_list(vector: Any) -> Any:
+    """
+    Plain float list for pydantic request models (Prefetch, QueryRequest).
+
+    query_points() itself takes numpy arrays, so only these paths convert;
+    callers reusing one vector across collections should pass the list.
+    """
+    return vector.tolist() if isinstance(vector, np.ndarray) else vector
+
+
+def _fmt(points: List[Any]) -> List[Dict[str, Any]]:
+    """Scored points -> result dicts (ids as str, missing score/payload defaulted)."""
+    return [
+        {
+            "id": p.id if isinstance(p.id, str) else str(p.id),
+            "score": p.score or 0.0,
+            "payload": p.payload or {},
+        }
+        for p in points
+    ]
+
+
+def _build_filter_uncached(key: tuple) -> Optional[Filter]:
+    conditions = []
+    for field, value in key:
+        if isinstance(value, tuple):
+            conditions.append(FieldCondition(key=field, match=MatchAny(any=list(value))))
+        else:
+            conditions.append(FieldCondition(key=field, match=MatchValue(value=value)))
+
+    return Filter(must=conditions) if conditions else None
+
+
+# Searches repeat the same few facets (e.g. the Bridge gene list):
+# build each distinct Filter once
+_build_filter_cached = lru_cache(maxsize=512)(_build_filter_uncached)
+
+
+_qdrant: Optional[QdrantManager] = None
+_qdrant_lock = threading.Lock()
+
+
 def get_qdrant() -> QdrantManager:
-    return QdrantManager()
+    """Process-wide QdrantManager (double-checked: connects exactly once)."""
+    global _qdrant
+    if _qdrant is None:
+        with _qdrant_lock:
+            if _qdrant is None:
+                _qdrant = QdrantManager()
+    return _qdrant
@@ -30,8 +30,10 @@ v3.3 CRITICAL FIX:
   AFTER:  CAS 3 keeps modal pure → accurate ranking
 """
 
+import asyncio
 import logging
 import hashlib
+import traceback
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
@@ -108,6 +110,16 @@ def extract_vector(result) -> List[float]:
     return list(result) if result is not None else []
 
 
+def as_query_vector(vector) -> np.ndarray:
+    """
+    Dense query vector as a flat float32 array.
+
+    Built once per query in node_search and passed to every collection's
+    search (cache-key hashing and the client use it without re-converting).
+    """
+    return np.asarray(vector, dtype=np.float32).ravel()
+
+
 def extract_metadata_for_bridge(results: List[Dict], max_items: int = 5) -> List[Dict]:
     """Extract metadata from Phase 1 results for Bridge LLM."""
     metadata = []
@@ -148,6 +160,29 @@ def extract_metadata_for_bridge(results: List[Dict], max_items: int = 5) -> List
     return metadata
 
 
+def start_modal_searches(
+    qdrant, vectors: Dict[str, List[float]], modalities: List[str], top_k: int
+) -> Dict[str, "asyncio.Task"]:
+    """
+    Start the Phase 1 modal searches concurrently.
+
+    Each present modality searches its native collection with its own
+    vector; returns {collection: task}, awaited by the per-modality logging.
+    """
+    tasks = {}
+    for modality, collection in MODAL_TO_COLLECTION.items():
+        if modality in modalities and modality in vectors:
+            tasks[collection] = asyncio.create_task(
+                qdrant.vector_search(
+                    collection=collection,
+                    vector=vectors[modality],
+                    vector_name=modality,
+                    top_k=top_k,
+                )
+            )
+    return tasks
+
+
 def merge_results(results1: List[Dict], results2: List[Dict]) -> List[Dict]:
     """Merge two result lists with score averaging."""
     merged = {}
@@ -451,6 +486,13 @@ async def node_search(state: GraphState) -> GraphState:
     search_case = state["search_case"]
     top_k = state.get("top_k", 5)
 
+    # Dense vectors converted once, shared by all collection searches
+    query_vectors = {
+        name: as_query_vector(vec)
+        for name, vec in state.get("vectors", {}).items()
+        if vec is not None and len(vec) > 0
+    }
+
     all_results = {}
     phase1_results = {}
     phase3_results = {}
@@ -468,19 +510,18 @@ async def node_search(state: GraphState) -> GraphState:
         logger.info("   📍 CAS 1: Direct parallel search (NO BRIDGE)")
         logger.info("   ─────────────────────────────────────────────")
 
-        text_vec = state["vectors"].get("text", [])
-        if not text_vec:
+        text_vec = query_vectors.get("text")
+        if text_vec is None:
             logger.error("   ❌ No text vector for CAS 1!")
             state["all_results"] = {}
             state["search_strategy"] = "CAS_1_ERROR"
             return state
 
-        # Search ALL collections in parallel
-        for collection in COLLECTIONS:
+        async def _search_collection(collection: str) -> List[Dict]:
             try:
                 vec_name = "caption" if collection == "images" else "text"
 
-                results = qdrant.vector_search(
+                results = await qdrant.vector_search(
                     collection=collection,
                     vector=text_vec,
                     vector_name=vec_name,
@@ -490,12 +531,18 @@ async def node_search(state: GraphState) -> GraphState:
                 for r in results:
                     r["collection"] = collection
 
-                all_results[collection] = results
                 logger.info(f"   ✅ {collection}: {len(results)} results")
+                return results
 
             except Exception as e:
                 logger.error(f"   ❌ {collection}: ERROR - {e}")
-                all_results[collection] = []
+                return []
+
+        # Search ALL collections in parallel
+        collection_results = await asyncio.gather(
+            *(_search_collection(c) for c in COLLECTIONS)
+        )
+        all_results = dict(zip(COLLECTIONS, collection_results))
 
         state["search_strategy"] = "CAS_1"
         state["alignment"] = None
@@ -527,17 +574,15 @@ async def node_search(state: GraphState) -> GraphState:
         # PHASE 1: Search EACH modality collection IN PARALLEL
         # ═══════════════════════════════════════════════════════════════
         logger.info(f"   🔍 PHASE 1: Searching modality collections (PARALLEL)")
+        modal_tasks = start_modal_searches(
+            qdrant, query_vectors, modalities, top_k * 2
+        )
 
         # Search IMAGE if present
-        if "image" in modalities and "image" in state["vectors"]:
+        if "images" in modal_tasks:
             logger.info(f"      ─────────────────────────────────────────────")
             logger.info(f"      🖼️ SEARCHING: IMAGES (image vector)")
-            results = qdrant.vector_search(
-                collection="images",
-                vector=state["vectors"]["image"],
-                vector_name="image",
-                top_k=top_k * 2,
-            )
+            results = await modal_tasks["images"]
             for r in results:
                 r["collection"] = "images"
             phase1_results["images"] = results
@@ -548,15 +593,10 @@ async def node_search(state: GraphState) -> GraphState:
                 )
 
         # Search SEQUENCE if present
-        if "sequence" in modalities and "sequence" in state["vectors"]:
+        if "proteins" in modal_tasks:
             logger.info(f"      ─────────────────────────────────────────────")
             logger.info(f"      🧬 SEARCHING: PROTEINS (sequence vector)")
-            results = qdrant.vector_search(
-                collection="proteins",
-                vector=state["vectors"]["sequence"],
-                vector_name="sequence",
-                top_k=top_k * 2,
-            )
+            results = await modal_tasks["proteins"]
             for r in results:
                 r["collection"] = "proteins"
             phase1_results["proteins"] = results
@@ -567,15 +607,10 @@ async def node_search(state: GraphState) -> GraphState:
                 )
 
         # Search STRUCTURE if present
-        if "structure" in modalities and "structure" in state["vectors"]:
+        if "structures" in modal_tasks:
             logger.info(f"      ─────────────────────────────────────────────")
             logger.info(f"      🔬 SEARCHING: STRUCTURES (structure vector)")
-            results = qdrant.vector_search(
-                collection="structures",
-                vector=state["vectors"]["structure"],
-                vector_name="structure",
-                top_k=top_k * 2,
-            )
+            results = await modal_tasks["structures"]
             for r in results:
                 r["collection"] = "structures"
             phase1_results["structures"] = results
@@ -647,7 +682,7 @@ async def node_search(state: GraphState) -> GraphState:
             f"   ╚═══════════════════════════════════════════════════════════════╝"
         )
 
-        for collection in rest_collections:
+        async def _search_rest(collection: str) -> None:
             try:
                 query_text = bridge_queries.get(collection, "protein function biology")
 
@@ -655,7 +690,9 @@ async def node_search(state: GraphState) -> GraphState:
                 logger.info(f"      🔎 SEARCHING: {collection.upper()}")
                 logger.info(f'         Query text: "{query_text[:80]}"')
 
-                query_vec = extract_vector(encoder.encode_text(query_text))
+                query_vec = as_query_vector(
+                    extract_vector(encoder.encode_text(query_text))
+                )
                 logger.info(f"         Query vector: dim={len(query_vec)}")
 
                 # Apply gene filter if enabled - BUT NOT for text-only collections!
@@ -686,14 +723,16 @@ async def node_search(state: GraphState) -> GraphState:
 
                 # Check collection stats
                 try:
-                    info = qdrant.client.get_collection(collection)
+                    info = await asyncio.to_thread(
+                        qdrant.client.get_collection, collection
+                    )
                     logger.info(
                         f"         Collection stats: {info.points_count} points"
                     )
                 except Exception as ce:
                     logger.warning(f"         ⚠️ Could not get collection info: {ce}")
 
-                results = qdrant.vector_search(
+                results = await qdrant.vector_search(
                     collection=collection,
                     vector=query_vec,
                     vector_name=vec_name,
@@ -706,7 +745,7 @@ async def node_search(state: GraphState) -> GraphState:
                     logger.warning(
                         f"         ⚠️ 0 results with filter, RETRYING without filter..."
                     )
-                    results = qdrant.vector_search(
+                    results = await qdrant.vector_search(
                         collection=collection,
                         vector=query_vec,
                         vector_name=vec_name,
@@ -741,6 +780,10 @@ async def node_search(state: GraphState) -> GraphState:
                 logger.error(f"      ❌ {collection}: ERROR - {e}")
                 phase3_results[collection] = []
 
+        # REST collections are independent: search them concurrently
+        await asyncio.gather(*(_search_rest(c) for c in rest_collections))
+        phase3_results = {c: phase3_results[c] for c in rest_collections}
+
         # Merge Phase 1 + Phase 3
         all_results = {**phase1_results, **phase3_results}
         state["search_strategy"] = "CAS_2"
@@ -781,18 +824,16 @@ async def node_search(state: GraphState) -> GraphState:
         # This preserves high similarity scores (0.95 stays 0.95, not diluted to 0.3)
         # ═══════════════════════════════════════════════════════════════
         logger.info(f"   🔍 PHASE 1: MODAL-ONLY search (no text fusion)")
+        modal_tasks = start_modal_searches(
+            qdrant, query_vectors, modalities, top_k * 2
+        )
 
         # SEQUENCE → proteins (sequence vector only)
-        if "sequence" in modalities and "sequence" in state["vectors"]:
+        if "proteins" in modal_tasks:
             logger.info(f"      ─────────────────────────────────────────────")
             logger.info(f"      🧬 MODAL: PROTEINS (sequence vector ONLY)")
 
-            seq_results = qdrant.vector_search(
-                collection="proteins",
-                vector=state["vectors"]["sequence"],
-                vector_name="sequence",
-                top_k=top_k * 2,  # Get more for MMR
-            )
+            seq_results = await modal_tasks["proteins"]
 
             for r in seq_results:
                 r["collection"] = "proteins"
@@ -811,16 +852,11 @@ async def node_search(state: GraphState) -> GraphState:
                 logger.warning(f"      ⚠️ proteins: 0 results")
 
         # IMAGE → images (image vector only)
-        if "image" in modalities and "image" in state["vectors"]:
+        if "images" in modal_tasks:
             logger.info(f"      ─────────────────────────────────────────────")
             logger.info(f"      🖼️ MODAL: IMAGES (image vector ONLY)")
 
-            img_results = qdrant.vector_search(
-                collection="images",
-                vector=state["vectors"]["image"],
-                vector_name="image",
-                top_k=top_k * 2,
-            )
+            img_results = await modal_tasks["images"]
 
             for r in img_results:
                 r["collection"] = "images"
@@ -834,16 +870,11 @@ async def node_search(state: GraphState) -> GraphState:
                 logger.warning(f"      ⚠️ images: 0 results")
 
         # STRUCTURE → structures (structure vector only)
-        if "structure" in modalities and "structure" in state["vectors"]:
+        if "structures" in modal_tasks:
             logger.info(f"      ─────────────────────────────────────────────")
             logger.info(f"      🔬 MODAL: STRUCTURES (structure vector ONLY)")
 
-            struct_results = qdrant.vector_search(
-                collection="structures",
-                vector=state["vectors"]["structure"],
-                vector_name="structure",
-                top_k=top_k * 2,
-            )
+            struct_results = await modal_tasks["structures"]
 
             for r in struct_results:
                 r["collection"] = "structures"
@@ -917,10 +948,12 @@ async def node_search(state: GraphState) -> GraphState:
         )
 
         # Get text vectors for hybrid search
-        text_vec = state["vectors"].get("text", [])
+        text_vec = query_vectors.get("text")
+        # Prefetch (hybrid) takes plain lists: convert once, not per collection
+        text_list = text_vec.tolist() if text_vec is not None else None
         sparse_vec = state.get("sparse_vectors", {}).get("text")
 
-        for collection in rest_collections:
+        async def _search_rest(collection: str) -> None:
             try:
                 # Use Bridge query OR fallback to user text
                 query_text = (
@@ -935,7 +968,8 @@ async def node_search(state: GraphState) -> GraphState:
 
                 # Re-encode if using bridge query (different from user text)
                 if query_text != state.get("input_text"):
-                    query_vec = extract_vector(encoder.encode_text(query_text))
+                    query_list = extract_vector(encoder.encode_text(query_text))
+                    query_vec = as_query_vector(query_list)
                     query_sparse = (
                         encoder.encode_sparse(query_text)
                         if hasattr(encoder, "encode_sparse")
@@ -943,6 +977,7 @@ async def node_search(state: GraphState) -> GraphState:
                     )
                 else:
                     query_vec = text_vec
+                    query_list = text_list
                     query_sparse = sparse_vec
 
                 # Apply gene filter if enabled
@@ -983,9 +1018,9 @@ async def node_search(state: GraphState) -> GraphState:
                         and sparse_values
                         and hasattr(qdrant, "hybrid_search")
                     ):
-                        results = qdrant.hybrid_search(
+                        results = await qdrant.hybrid_search(
                             collection=collection,
-                            dense_vector=query_vec,
+                            dense_vector=query_list,
                             sparse_indices=sparse_indices,
                             sparse_values=sparse_values,
                             dense_name=vec_name,
@@ -998,7 +1033,7 @@ async def node_search(state: GraphState) -> GraphState:
                         )
                     else:
                         # Fallback to dense-only
-                        results = qdrant.vector_search(
+                        results = await qdrant.vector_search(
                             collection=collection,
                             vector=query_vec,
                             vector_name=vec_name,
@@ -1010,7 +1045,7 @@ async def node_search(state: GraphState) -> GraphState:
                     logger.warning(
                         f"         ⚠️ Hybrid failed, using dense: {hybrid_err}"
                     )
-                    results = qdrant.vector_search(
+                    results = await qdrant.vector_search(
                         collection=collection,
                         vector=query_vec,
                         vector_name=vec_name,
@@ -1023,7 +1058,7 @@ async def node_search(state: GraphState) -> GraphState:
                     logger.warning(
                         f"         ⚠️ 0 results with filter, retrying without..."
                     )
-                    results = qdrant.vector_search(
+                    results = await qdrant.vector_search(
                         collection=collection,
                         vector=query_vec,
                         vector_name=vec_name,
@@ -1054,6 +1089,10 @@ async def node_search(state: GraphState) -> GraphState:
                 logger.error(f"      ❌ {collection}: ERROR - {e}")
                 phase3_results[collection] = []
 
+        # REST collections are independent: search them concurrently
+        await asyncio.gather(*(_search_rest(c) for c in rest_collections))
+        phase3_results = {c: phase3_results[c] for c in rest_collections}
+
         # Merge Phase 1 (modal) + Phase 3 (text) - no fusion, just combine
         all_results = {**phase1_results, **phase3_results}
         state["search_strategy"] = "CAS_3"
@@ -1131,96 +1170,121 @@ async def node_rank_enrich(state: GraphState) -> GraphState:
 
     state["reranked_results"] = reranked_results
 
+    # The CAS 1 summary is independent of the Design Assistant: start its LLM
+    # call now so both round-trips overlap instead of running back to back
+    summary_task = None
+    bridge = state.get("bridge_output")
+    if state.get("include_summary", True) and not (
+        bridge and bridge.get("interpretation")
+    ):
+        summary_task = asyncio.create_task(
+            llm.generate_summary(
+                query=state.get("input_text") or "",
+                results=reranked_results,
+            )
+        )
+
     # ─────────────────────────────────────────────────────────
     # DESIGN ASSISTANT (optionnel)
     # ─────────────────────────────────────────────────────────
     design_candidates = []
 
-    if state.get("include_design_candidates", True):  # Default to True
-        # Get search case
-        search_case = state.get("search_case", 1)
-        is_multimodal = search_case in [2, 3]
-        has_text = bool((state.get("input_text") or "").strip())
-        has_rich = _has_rich_results(reranked_results)
-        is_exploratory = _is_exploratory_query(state.get("input_text") or "")
-
-        logger.info(f"   🎨 DESIGN ASSISTANT CHECK:")
-        logger.info(f"      ├─ search_case={search_case}")
-        logger.info(f"      ├─ is_multimodal={is_multimodal} (CAS 2 or 3)")
-        logger.info(f"      ├─ has_text={has_text}")
-        logger.info(f"      ├─ is_exploratory={is_exploratory}")
-        logger.info(f"      └─ has_rich_results={has_rich}")
-
-        # Conditions:
-        # 1. ALWAYS activate for CAS 2/3 (multimodal) - user uploaded files!
-        # 2. For CAS 1 (text only), activate if exploratory OR has rich results
-        should_activate = is_multimodal or is_exploratory or has_rich
-
-        logger.info(f"      🎯 should_activate = {should_activate}")
-        if should_activate:
-            if is_multimodal:
-                logger.info(f"         (reason: multimodal CAS {search_case})")
-            elif is_exploratory:
-                logger.info(f"         (reason: exploratory query)")
-            else:
-                logger.info(f"         (reason: rich results)")
+    try:
+        if state.get("include_design_candidates", True):  # Default to True
+            # Get search case
+            search_case = state.get("search_case", 1)
+            is_multimodal = search_case in [2, 3]
+            has_text = bool((state.get("input_text") or "").strip())
+            has_rich = _has_rich_results(reranked_results)
+            is_exploratory = _is_exploratory_query(state.get("input_text") or "")
+
+            logger.info(f"   🎨 DESIGN ASSISTANT CHECK:")
+            logger.info(f"      ├─ search_case={search_case}")
+            logger.info(f"      ├─ is_multimodal={is_multimodal} (CAS 2 or 3)")
+            logger.info(f"      ├─ has_text={has_text}")
+            logger.info(f"      ├─ is_exploratory={is_exploratory}")
+            logger.info(f"      └─ has_rich_results={has_rich}")
+
+            # Conditions:
+            # 1. ALWAYS activate for CAS 2/3 (multimodal) - user uploaded files!
+            # 2. For CAS 1 (text only), activate if exploratory OR has rich results
+            should_activate = is_multimodal or is_exploratory or has_rich
+
+            logger.info(f"      🎯 should_activate = {should_activate}")
+            if should_activate:
+                if is_multimodal:
+                    logger.info(f"         (reason: multimodal CAS {search_case})")
+                elif is_exploratory:
+                    logger.info(f"         (reason: exploratory query)")
+                else:
+                    logger.info(f"         (reason: rich results)")
 
-        if should_activate:
-            logger.info("   🎨 DESIGN ASSISTANT: Generating candidates...")
-            try:
-                # Build context for multimodal
-                query_context = state.get("input_text") or ""
-                if not query_context and is_multimodal:
-                    # Use Bridge interpretation as context
-                    bridge = state.get("bridge_output", {})
-                    query_context = bridge.get(
-                        "interpretation",
-                        "Find related biological entities based on uploaded data",
+            if should_activate:
+                logger.info("   🎨 DESIGN ASSISTANT: Generating candidates...")
+                try:
+                    # Build context for multimodal
+                    query_context = state.get("input_text") or ""
+                    if not query_context and is_multimodal:
+                        # Use Bridge interpretation as context
+                        bridge = state.get("bridge_output", {})
+                        query_context = bridge.get(
+                            "interpretation",
+                            "Find related biological entities based on uploaded data",
+                        )
+                        logger.info(
+                            f"      Using Bridge interpretation as context: {query_context[:50]}..."
+                        )
+
+                    raw = await llm.generate_design_candidates(
+                        query=query_context,
+                        results=_flatten_results(reranked_results)[:10],
+                        top_k=3,
                     )
-                    logger.info(
-                        f"      Using Bridge interpretation as context: {query_context[:50]}..."
+                    candidates_list = (
+                        raw.get("candidates", []) if isinstance(raw, dict) else []
                     )
 
-                raw = await llm.generate_design_candidates(
-                    query=query_context,
-                    results=_flatten_results(reranked_results)[:10],
-                    top_k=3,
-                )
-                candidates_list = (
-                    raw.get("candidates", []) if isinstance(raw, dict) else []
-                )
-
-                logger.info(f"      📦 LLM returned {len(candidates_list)} candidates")
+                    logger.info(
+                        f"      📦 LLM returned {len(candidates_list)} candidates"
+                    )
 
-                for i, cand in enumerate(candidates_list):
-                    if isinstance(cand, dict):
-                        labeled = await _verify_and_label(cand, qdrant, encoder)
-                        design_candidates.append(labeled)
-                        name = cand.get("name", "?")
+                    design_candidates = await _verify_and_label(
+                        [c for c in candidates_list if isinstance(c, dict)],
+                        qdrant,
+                        encoder,
+                    )
+                    for i, labeled in enumerate(design_candidates):
+                        name = labeled.get("name", "?")
                         confidence = labeled.get("confidence", "?")
                         logger.info(
                             f"         [{i+1}] {name} → confidence: {confidence}"
                         )
 
+                    logger.info(
+                        f"      ✅ Generated {len(design_candidates)} verified candidates"
+                    )
+
+                except Exception as e:
+                    logger.error(f"      ❌ Design Assistant error: {e}")
+                    logger.error(f"      {traceback.format_exc()}")
+            else:
+                logger.info("   ⏭️ DESIGN ASSISTANT: SKIPPED")
                 logger.info(
-                    f"      ✅ Generated {len(design_candidates)} verified candidates"
+                    "      Reason: CAS 1 (text-only) without exploratory query or rich results"
+                )
+                logger.info(
+                    "      💡 Tip: Use words like 'discover', 'explore', 'novel' OR upload files"
                 )
-
-            except Exception as e:
-                logger.error(f"      ❌ Design Assistant error: {e}")
-                import traceback
-
-                logger.error(f"      {traceback.format_exc()}")
         else:
-            logger.info("   ⏭️ DESIGN ASSISTANT: SKIPPED")
-            logger.info(
-                "      Reason: CAS 1 (text-only) without exploratory query or rich results"
-            )
             logger.info(
-                "      💡 Tip: Use words like 'discover', 'explore', 'novel' OR upload files"
+                "   ⏭️ DESIGN ASSISTANT: DISABLED (include_design_candidates=False)"
             )
-    else:
-        logger.info("   ⏭️ DESIGN ASSISTANT: DISABLED (include_design_candidates=False)")
+
+    except BaseException:
+        # Node cancelled (or failed) mid-design: don't orphan the summary call
+        if summary_task is not None:
+            summary_task.cancel()
+        raise
 
     state["design_candidates"] = design_candidates
 
@@ -1238,13 +1302,10 @@ async def node_rank_enrich(state: GraphState) -> GraphState:
             interpretation = bridge["interpretation"]
             logger.info(f"   📝 SUMMARY: From Bridge ({len(summary)} chars)")
         else:
-            # Generate summary (CAS 1)
+            # Generate summary (CAS 1), started before the Design Assistant
             logger.info("   📝 SUMMARY: Generating with LLM...")
             try:
-                summary = await llm.generate_summary(
-                    query=state.get("input_text") or "",
-                    results=reranked_results,
-                )
+                summary = await summary_task
                 logger.info(f"      ✅ Generated ({len(summary)} chars)")
             except Exception as e:
                 logger.error(f"      ❌ Summary error: {e}")
@@ -1427,47 +1488,60 @@ def _flatten_results(results: Dict[str, List]) -> List[Dict]:
     return flat
 
 
-async def _verify_and_label(candidate: Dict, qdrant, encoder) -> Dict:
-    """Verify candidate and assign confidence label."""
-    name = candidate.get("name", "")
-    if not name:
-        candidate["confidence"] = ConfidenceLabel.EXPLORATORY.value
-        candidate["confidence_icon"] = "💡"
-        candidate["evidence_count"] = 0
-        return candidate
+async def _verify_and_label(candidates: List[Dict], qdrant, encoder) -> List[Dict]:
+    """
+    Verify candidates against article titles and assign confidence labels.
 
-    try:
-        vec = extract_vector(encoder.encode_text(name))
-        if not vec or len(vec) < 10:
-            raise ValueError("Invalid vector")
+    All name lookups go to "articles" in one batched Qdrant request.
+    """
+    pending = []  # (candidate, request)
+    for candidate in candidates:
+        name = candidate.get("name", "")
+        try:
+            if not name:
+                raise ValueError("No name")
+            vec = extract_vector(encoder.encode_text(name))
+            if not vec or len(vec) < 10:
+                raise ValueError("Invalid vector")
+            # Only titles are checked: skip abstracts and the rest of the payload
+            pending.append(
+                (candidate, qdrant.dense_request(vec, "text", 10, payload_fields=["title"]))
+            )
+        except Exception:
+            _set_confidence(candidate, 0)
 
-        results = qdrant.vector_search("articles", vec, "text", 10)
+    try:
+        batch = await qdrant.batch_search("articles", [req for _, req in pending])
+    except Exception:
+        batch = [[] for _ in pending]
 
+    for (candidate, _), results in zip(pending, batch):
+        name = candidate["name"].lower()
         matching = sum(
             1
             for r in results
-            if name.lower() in str(r.get("payload", {}).get("title", "")).lower()
+            if name in str(r.get("payload", {}).get("title", "")).lower()
         )
+        _set_confidence(candidate, matching)
 
-        if matching > 3:
-            candidate["confidence"] = ConfidenceLabel.ESTABLISHED.value
-            candidate["confidence_icon"] = "✅"
-            candidate["evidence_count"] = matching * 3
-        elif matching > 0:
-            candidate["confidence"] = ConfidenceLabel.EMERGING.value
-            candidate["confidence_icon"] = "⚠️"
-            candidate["evidence_count"] = matching
-        else:
-            candidate["confidence"] = ConfidenceLabel.EXPLORATORY.value
-            candidate["confidence_icon"] = "💡"
-            candidate["evidence_count"] = 0
-    except:
+    return candidates
+
+
+def _set_confidence(candidate: Dict, matching: int) -> None:
+    """Confidence label from the number of matching article titles."""
+    if matching > 3:
+        candidate["confidence"] = ConfidenceLabel.ESTABLISHED.value
+        candidate["confidence_icon"] = "✅"
+        candidate["evidence_count"] = matching * 3
+    elif matching > 0:
+        candidate["confidence"] = ConfidenceLabel.EMERGING.value
+        candidate["confidence_icon"] = "⚠️"
+        candidate["evidence_count"] = matching
+    else:
         candidate["confidence"] = ConfidenceLabel.EXPLORATORY.value
         candidate["confidence_icon"] = "💡"
         candidate["evidence_count"] = 0
 
-    return candidate
-
 
 def _collect_evidence(results: Dict[str, List]) -> Dict[str, Dict]:
     """Collect evidence links."""
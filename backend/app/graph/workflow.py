@@ -19,11 +19,13 @@ Total: ~350ms (aligned) / ~400ms (divergent)
 """
 
 import time
+import traceback
 from typing import Optional, Dict, Any, List
 import logging
 
 from langgraph.graph import StateGraph, END
 
+from app.core.article_processor import process_article_input
 from app.graph.state import GraphState, create_initial_state
 from app.graph.nodes import (
     node_encode,
@@ -117,8 +119,6 @@ async def run_recommendation(
     # Process article if provided - extract title/abstract and concatenate with text
     if article_path:
         try:
-            from app.core.article_processor import process_article_input
-
             text = process_article_input(
                 user_query=text or "", article_path=article_path
             )
@@ -163,8 +163,6 @@ async def run_recommendation(
         final_state = await workflow.ainvoke(initial_state)
     except Exception as e:
         logger.error(f"❌ WORKFLOW FAILED: {e}")
-        import traceback
-
         logger.error(traceback.format_exc())
         return SearchResponse(
             input_type="error",
@@ -3,8 +3,9 @@ BioDiscovery AI - Main FastAPI Application
 Multi-modal biological recommendation system
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 import logging
@@ -13,7 +14,7 @@ import os
 from app.api.routes import router
 from app.config import get_settings
 from app.core.qdrant_client import get_qdrant
-from app.core.encoders import get_encoder
+from app.core.encoders import close_encoder_batcher, get_encoder
 
 
 # Configure logging
@@ -54,6 +55,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down...")
+    await close_encoder_batcher()
 
 
 # Create FastAPI app
@@ -92,6 +94,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    """Reject oversized bodies from Content-Length before any bytes are read."""
+    content_length = request.headers.get("content-length")
+    max_bytes = settings.max_upload_mb * 1024 * 1024
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        return JSONResponse(
+            status_code=413,
+            content={"detail": f"Request body exceeds {settings.max_upload_mb} MB"},
+        )
+    return await call_next(request)
+
+
 app.mount("/static/pdb", StaticFiles(directory="data/structures_pdb"), name="pdb")
 app.mount(
     "/static/alphafold",
@@ -192,6 +192,13 @@ class SearchRequest(BaseModel):
     )
 
 
+class SummaryRequest(BaseModel):
+    """Streamed summary request: query plus results grouped by collection"""
+
+    query: str = ""
+    results: Dict[str, List[Dict[str, Any]]] = Field(default_factory=dict)
+
+
 class EvidenceData(BaseModel):
     """Evidence and traceability data"""
 
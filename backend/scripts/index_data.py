@@ -123,7 +123,7 @@ def index_proteins(data_path: str):
         )
 
     # Upsert
-    count = qdrant.upsert_points("proteins", points)
+    count = qdrant.bulk_upsert("proteins", points)
     logger.info(f"   ✅ Indexed {count} proteins")
     logger.info(f"   📊 Sparse vectors: {sparse_count}/{len(proteins)} documents")
 
@@ -171,7 +171,7 @@ def index_articles(data_path: str):
             }
         )
 
-    count = qdrant.upsert_points("articles", points)
+    count = qdrant.bulk_upsert("articles", points)
     logger.info(f"   ✅ Indexed {count} articles")
     logger.info(f"   📊 Sparse vectors: {sparse_count}/{len(articles)} documents")
 
@@ -233,7 +233,7 @@ def index_images(data_path: str):
             }
         )
 
-    count = qdrant.upsert_points("images", points)
+    count = qdrant.bulk_upsert("images", points)
     logger.info(f"   ✅ Indexed {count} images")
     logger.info(f"   📊 Image vectors: {image_encoded_count}/{len(images)} encoded")
     logger.info(f"   📊 Sparse vectors: {sparse_count}/{len(images)} documents")
@@ -282,7 +282,7 @@ def index_experiments(data_path: str):
             }
         )
 
-    count = qdrant.upsert_points("experiments", points)
+    count = qdrant.bulk_upsert("experiments", points)
     logger.info(f"   ✅ Indexed {count} experiments")
     logger.info(f"   📊 Sparse vectors: {sparse_count}/{len(experiments)} documents")
 
@@ -349,7 +349,7 @@ def index_structures(data_path: str):
             }
         )
 
-    count = qdrant.upsert_points("structures", points)
+    count = qdrant.bulk_upsert("structures", points)
     logger.info(f"   ✅ Indexed {count} structures")
     logger.info(
         f"   📊 Structure vectors: {structure_encoded_count}/{len(structures)} encoded"
@@ -0,0 +1,27 @@
+"""Tests for LLM reply post-processing."""
+
+import json
+
+import pytest
+
+from app.core.llm_client import GeminiClient
+
+strip = GeminiClient._strip_code_fence
+
+
+@pytest.mark.parametrize(
+    "reply",
+    [
+        '```json\n{"a": 1}\n```',  # usual fenced block
+        '```json {"a": 1,\n"b": 2\n}\n```',  # JSON starts on the fence line
+        '```json {"a": 1}```',  # one line, no newline at all
+        '```\n{"a": 1}\n```',  # no language tag
+        '{"a": 1}',  # no fence
+    ],
+)
+def test_strip_code_fence_keeps_json(reply):
+    assert json.loads(strip(reply))["a"] == 1
+
+
+def test_strip_code_fence_removes_one_newline_only():
+    assert strip('```json\n{"a": 1}\n\n```') == '{"a": 1}\n'